@@ -0,0 +1,376 @@
+import json
+import os
+import secrets
+import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+from config import Config
+
+JOURNAL_VERSION = 1
+
+# مرحله‌های journal: آماده‌سازی (پروژه هنوز دست نخورده) و جایگزینی
+PHASE_PREPARE = "prepare"
+PHASE_REPLACE = "replace"
+
+class _Operation:
+    """نوشتن یا حذف یک فایل به همراه اطلاعات بازگردانی آن"""
+    
+    __slots__ = ('path', 'target', 'content', 'newline', 'tmp', 'existed', 'backup', 'original', 'done',
+                 'unchanged')
+    
+    def __init__(self, path: str, target: Path, content: Optional[str] = None, newline: Optional[str] = None):
+        self.path = path
+        self.target = target
+        self.content = content      # None یعنی حذف فایل
+        self.newline = newline
+        self.tmp: Optional[Path] = None
+        self.existed: Optional[bool] = None
+        self.backup: Optional[str] = None
+        self.original: Optional[bytes] = None
+        self.done = False
+        self.unchanged = False
+    
+    @property
+    def is_write(self) -> bool:
+        return self.content is not None
+    
+    def encoded(self) -> bytes:
+        """bytes نهایی فایل، مانند نوشتن با open(..., 'w', newline=newline)"""
+        content = self.content
+        if self.newline is None and os.linesep != '\n':
+            content = content.replace('\n', os.linesep)
+        elif self.newline:
+            content = content.replace('\n', self.newline)
+        return content.encode('utf-8')
+
+class ApplyEngine:
+    """اعمال اتمی و موازی تغییرات فایل‌ها با journal برای بازگردانی
+    
+    عملیات ابتدا صف می‌شوند و run آن‌ها را در سه مرحله اجرا می‌کند:
+    ۱) ساخت پوشه‌های والد (هر پوشه یکتا فقط یک بار)؛ ۲) به صورت موازی:
+    نگه داشتن نسخه اصلی هر فایل در journal و نوشتن محتوای جدید در فایل
+    موقت کنار فایل مقصد؛ ۳) جایگزینی با os.replace و حذف‌ها. خطا در مرحله
+    ۲ پروژه را دست نخورده می‌گذارد و خطا در مرحله ۳ همه فایل‌ها را از
+    journal برمی‌گرداند.
+    
+    با journal_dir نسخه‌های اصلی روی دیسک (hard link یا کپی) نگه داشته
+    می‌شوند تا اعمالی که با crash نیمه‌کاره مانده در اجرای بعد با recover
+    برگردانده شود؛ بدون آن، bytes اصلی در حافظه می‌ماند.
+    
+    فایلی که bytes جدید آن با فایل روی دیسک یکی است (ابتدا مقایسه اندازه،
+    سپس محتوا) نوشته نمی‌شود تا mtime و کش‌های build دست نخورند؛ این
+    فایل‌ها در انتهای گزارش با پیام «بدون تغییر» می‌آیند.
+    """
+    
+    JOURNAL_NAME = "journal.json"
+    
+    def __init__(self, root: Path, journal_dir: Optional[Path] = None, workers: int = None):
+        self.root = Path(root)
+        self._real_root = os.path.realpath(self.root)
+        self.journal_dir = Path(journal_dir) if journal_dir is not None else None
+        self.workers = max(1, workers if workers is not None else Config.APPLY_WORKERS)
+        self._operations: List[_Operation] = []
+        # (عملیات، پیام) به ترتیب صف؛ پیام‌های بدون عملیات با None
+        self._messages: List[Tuple[Optional[_Operation], str]] = []
+        self._token = secrets.token_hex(4)
+    
+    def __len__(self) -> int:
+        return len(self._operations)
+    
+    @property
+    def operations(self) -> List[_Operation]:
+        """عملیات صف شده (برای پیش‌نمایش بدون اجرا)"""
+        return list(self._operations)
+    
+    def notes(self) -> List[str]:
+        """پیام‌هایی که به عملیاتی وابسته نیستند (فایل‌های رد شده، نتیجه hunkها ...)"""
+        return [message for op, message in self._messages if op is None]
+    
+    def _target(self, path: str) -> Path:
+        """مسیر مقصد روی دیسک؛ مسیری که پس از resolve خارج از root باشد رد می‌شود"""
+        target = self.root / path
+        resolved = os.path.realpath(target)
+        if resolved == self._real_root or os.path.commonpath([resolved, self._real_root]) != self._real_root:
+            raise ValueError(f"مسیر فایل {path} خارج از پوشه پروژه است")
+        # نوشتن از طریق symlink مانند open(..., 'w') به فایل مقصد آن می‌رود
+        if target.is_symlink():
+            target = Path(resolved)
+        return target
+    
+    def write(self, path: str, content: str, message: str = None, newline: str = None):
+        """صف کردن نوشتن فایل؛ newline مانند open (None: تبدیل \\n به خط جدید سیستم)"""
+        op = _Operation(path, self._target(path), content, newline)
+        self._operations.append(op)
+        self._add_message(op, message)
+    
+    def delete(self, path: str, message: str = None):
+        """صف کردن حذف فایل"""
+        op = _Operation(path, self._target(path))
+        self._operations.append(op)
+        self._add_message(op, message)
+    
+    def note(self, message: Optional[str]):
+        """پیام گزارش بدون عملیات (به ترتیب صف در خروجی run می‌آید)"""
+        self._add_message(None, message)
+    
+    def _add_message(self, op: Optional[_Operation], message: Optional[str]):
+        if message:
+            self._messages.append((op, message))
+    
+    def _report(self) -> List[str]:
+        """پیام‌ها به ترتیب صف و در انتها فایل‌هایی که تغییری نداشتند"""
+        report = [message for op, message in self._messages if op is None or not op.unchanged]
+        report.extend(f"⏸️  بدون تغییر: {op.path}" for op in self._operations if op.unchanged)
+        return report
+    
+    def run(self) -> List[str]:
+        """اجرای همه عملیات صف شده؛ با خطا همه چیز برگردانده و خطا دوباره raise می‌شود"""
+        operations = self._operations
+        if not operations:
+            return self._report()
+        
+        for index, op in enumerate(operations):
+            if op.is_write:
+                op.tmp = op.target.parent / f".{op.target.name}.{self._token}-{index}.tmp"
+        
+        created_dirs: List[Path] = []
+        try:
+            self._make_dirs(operations, created_dirs)
+            self._write_journal(PHASE_PREPARE, operations, created_dirs)
+            self._prepare_all(operations)
+        except BaseException:
+            self._discard(operations, created_dirs)
+            raise
+        
+        try:
+            self._write_journal(PHASE_REPLACE, operations, created_dirs)
+            for op in operations:
+                self._commit(op)
+        except BaseException:
+            self._rollback(operations, created_dirs)
+            raise
+        
+        self._clear_journal()
+        return self._report()
+    
+    def _make_dirs(self, operations: List[_Operation], created: List[Path]):
+        """ساخت پوشه‌های والد یکتا؛ پوشه‌های ساخته شده (کم‌عمق‌ترین اول) به created اضافه می‌شوند"""
+        parents: Set[Path] = {op.target.parent for op in operations if op.is_write}
+        for parent in sorted(parents, key=lambda path: len(path.parts)):
+            missing = []
+            current = parent
+            while not current.exists():
+                missing.append(current)
+                current = current.parent
+            for directory in reversed(missing):
+                directory.mkdir()
+                created.append(directory)
+    
+    def _prepare_all(self, operations: List[_Operation]):
+        if self.journal_dir is not None:
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+        
+        workers = min(self.workers, len(operations))
+        if workers <= 1:
+            for index, op in enumerate(operations):
+                self._prepare(index, op)
+            return
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="apply") as pool:
+            futures = [pool.submit(self._prepare, index, op) for index, op in enumerate(operations)]
+            errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+    
+    def _prepare(self, index: int, op: _Operation):
+        """پشتیبان نسخه اصلی و نوشتن محتوای جدید در فایل موقت"""
+        try:
+            st = op.target.stat()
+            mode = stat.S_IMODE(st.st_mode)
+            op.existed = True
+        except FileNotFoundError:
+            mode = None
+            op.existed = False
+        
+        data = op.encoded() if op.is_write else None
+        if op.existed and data is not None and st.st_size == len(data) and self._same_bytes(op.target, data):
+            op.unchanged = True
+            return
+        
+        if op.existed:
+            if self.journal_dir is not None:
+                backup = self.journal_dir / f"{index}.bak"
+                try:
+                    # hard link هزینه‌ای ندارد: os.replace فقط نام را به inode جدید می‌دهد
+                    os.link(op.target, backup)
+                except OSError:
+                    shutil.copy2(op.target, backup)
+                op.backup = backup.name
+            else:
+                op.original = op.target.read_bytes()
+        
+        if op.is_write:
+            fd = os.open(op.tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+            except BaseException:
+                op.tmp.unlink()
+                raise
+            if mode is not None:
+                os.chmod(op.tmp, mode)
+    
+    @staticmethod
+    def _same_bytes(path: Path, data: bytes) -> bool:
+        try:
+            with open(path, 'rb') as f:
+                return f.read() == data
+        except OSError:
+            return False
+    
+    def _commit(self, op: _Operation):
+        if op.unchanged:
+            return
+        if op.is_write:
+            os.replace(op.tmp, op.target)
+        else:
+            try:
+                op.target.unlink()
+            except FileNotFoundError:
+                pass
+        op.done = True
+    
+    def _restore(self, op: _Operation):
+        """برگرداندن یک فایل به نسخه اصلی (یا حذف فایلی که قبلاً نبود)"""
+        if op.tmp is not None:
+            try:
+                op.tmp.unlink()
+            except FileNotFoundError:
+                pass
+        
+        if not op.done or op.unchanged:
+            return
+        if not op.existed:
+            if op.is_write:
+                try:
+                    op.target.unlink()
+                except FileNotFoundError:
+                    pass
+            return
+        
+        op.target.parent.mkdir(parents=True, exist_ok=True)
+        if op.backup is not None:
+            os.replace(self.journal_dir / op.backup, op.target)
+            return
+        
+        tmp = op.target.parent / f".{op.target.name}.{self._token}-restore.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(op.original)
+        os.replace(tmp, op.target)
+    
+    def _rollback(self, operations: List[_Operation], created_dirs: List[Path]):
+        for op in reversed(operations):
+            try:
+                self._restore(op)
+            except OSError as e:
+                print(f"⚠️  بازگردانی {op.path} ناموفق بود: {e}")
+        self._remove_dirs(created_dirs)
+        self._clear_journal()
+    
+    def _discard(self, operations: List[_Operation], created_dirs: List[Path]):
+        """پاک کردن فایل‌های موقت وقتی هنوز چیزی در پروژه جایگزین نشده"""
+        for op in operations:
+            op.done = False
+            try:
+                self._restore(op)
+            except OSError:
+                pass
+        self._remove_dirs(created_dirs)
+        self._clear_journal()
+    
+    @staticmethod
+    def _remove_dirs(created_dirs: List[Path]):
+        # فقط پوشه‌های خالی، عمیق‌ترین اول
+        for directory in reversed(created_dirs):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+    
+    def _write_journal(self, phase: str, operations: List[_Operation], created_dirs: List[Path]):
+        if self.journal_dir is None:
+            return
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        
+        entries = [{
+            "path": op.path,
+            "target": str(op.target),
+            "write": op.is_write,
+            "tmp": str(op.tmp) if op.tmp is not None else None,
+            "existed": op.existed,
+            "backup": op.backup,
+            "unchanged": op.unchanged,
+        } for op in operations]
+        data = {
+            "version": JOURNAL_VERSION,
+            "phase": phase,
+            "root": str(self.root),
+            "created_dirs": [str(directory) for directory in created_dirs],
+            "entries": entries,
+        }
+        
+        tmp = self.journal_dir / (self.JOURNAL_NAME + ".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            # dumps با encoder سریع C (dump روی فایل تکه تکه و کند می‌نویسد)
+            f.write(json.dumps(data, ensure_ascii=False))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.journal_dir / self.JOURNAL_NAME)
+    
+    def _clear_journal(self):
+        if self.journal_dir is None or not self.journal_dir.exists():
+            return
+        # حذف فایل journal نقطه پایان اعمال است؛ پشتیبان‌ها پس از آن پاک می‌شوند
+        try:
+            (self.journal_dir / self.JOURNAL_NAME).unlink()
+        except FileNotFoundError:
+            pass
+        shutil.rmtree(self.journal_dir, ignore_errors=True)
+    
+    def recover(self) -> List[str]:
+        """بازگردانی اعمالی که با crash نیمه‌کاره مانده؛ خروجی: مسیرهای برگردانده شده"""
+        if self.journal_dir is None:
+            return []
+        journal_path = self.journal_dir / self.JOURNAL_NAME
+        if not journal_path.exists():
+            if self.journal_dir.exists():
+                shutil.rmtree(self.journal_dir, ignore_errors=True)
+            return []
+        
+        try:
+            with open(journal_path, 'r', encoding='utf-8') as f:
+                data: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != JOURNAL_VERSION:
+            print("⚠️  journal اعمال تغییرات نامعتبر است و نادیده گرفته شد")
+            self._clear_journal()
+            return []
+        
+        operations = []
+        for entry in data.get("entries", []):
+            op = _Operation(entry["path"], Path(entry["target"]), "" if entry["write"] else None)
+            op.tmp = Path(entry["tmp"]) if entry.get("tmp") else None
+            op.existed = entry.get("existed")
+            op.backup = entry.get("backup")
+            op.unchanged = entry.get("unchanged", False)
+            # در مرحله جایگزینی معلوم نیست کدام فایل‌ها جایگزین شده‌اند؛ همه برگردانده می‌شوند
+            op.done = data.get("phase") == PHASE_REPLACE and op.existed is not None
+            operations.append(op)
+        
+        created_dirs = [Path(directory) for directory in data.get("created_dirs", [])]
+        self._rollback(operations, created_dirs)
+        return [op.path for op in operations if op.done and not op.unchanged]
\ No newline at end of file
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+میکروبنچمارک هزینه هر مسیر در should_ignore:
+حلقه قدیمی fnmatch روی مسیر مطلق در برابر IgnoreMatcher کامپایل شده
+"""
+
+import sys
+import time
+import random
+import fnmatch
+from pathlib import Path, PurePosixPath
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config
+from ignore_matcher import IgnoreMatcher
+
+def legacy_should_ignore(path_str: str) -> bool:
+    """پیاده‌سازی قبلی: یک fnmatch به ازای هر الگو"""
+    for pattern in Config.IGNORE_PATTERNS:
+        if fnmatch.fnmatch(path_str, f'*{pattern}*'):
+            return True
+    return False
+
+def make_paths(count: int, root: PurePosixPath):
+    """تولید مسیرهای نسبی شبیه یک پروژه واقعی"""
+    rng = random.Random(42)
+    dirs = ['src', 'lib', 'app', 'core', 'utils', 'tests', 'docs', 'node_modules', 'build']
+    exts = ['py', 'js', 'ts', 'md', 'json', 'pyc', 'log', 'txt']
+    
+    paths = []
+    for i in range(count):
+        depth = rng.randint(0, 5)
+        parts = [rng.choice(dirs) for _ in range(depth)]
+        parts.append(f"file_{i}.{rng.choice(exts)}")
+        paths.append(root.joinpath(*parts))
+    return paths
+
+def measure(func, items, repeat: int = 3) -> float:
+    """کمترین زمان اجرای func روی همه آیتم‌ها (نانوثانیه به ازای هر مسیر)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter_ns() - start)
+    return best / len(items)
+
+def main(count: int = 100000):
+    root = PurePosixPath('/home/dev/workspace/projects/sample-project')
+    paths = make_paths(count, root)
+    matcher = IgnoreMatcher(Config.IGNORE_PATTERNS)
+    
+    absolute = [str(p) for p in paths]
+    relative = [p.relative_to(root).parts for p in paths]
+    
+    legacy_ns = measure(legacy_should_ignore, absolute)
+    matcher_ns = measure(matcher.matches_parts, relative)
+    
+    legacy_hits = sum(legacy_should_ignore(p) for p in absolute)
+    matcher_hits = sum(matcher.matches_parts(p) for p in relative)
+    
+    print(f"📏 تعداد مسیرها: {count:,} | الگوها: {len(Config.IGNORE_PATTERNS)}")
+    print(f"   fnmatch loop : {legacy_ns:8.0f} ns/path  ({legacy_hits:,} نادیده)")
+    print(f"   IgnoreMatcher: {matcher_ns:8.0f} ns/path  ({matcher_hits:,} نادیده)")
+    print(f"   ⚡ سرعت: {legacy_ns / matcher_ns:.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
\ No newline at end of file
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+مقایسه پیمایش قدیمی (os.walk + Path + should_ignore) با ProjectScanner:
+تعداد فراخوانی‌های فایل‌سیستم (stat/scandir) و زمان اجرا
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config
+from ignore_matcher import IgnoreMatcher
+from file_scanner import ProjectScanner
+
+# فراخوانی‌های C که هر کدام حداقل یک syscall فایل‌سیستم هستند
+_FS_CALLS = {'stat', 'lstat', 'scandir', 'listdir', 'open'}
+
+def make_tree(root: Path, count: int):
+    """ساخت یک درخت نمونه با پوشه‌های تو در تو و پوشه‌های نادیده گرفته شده"""
+    rng = random.Random(7)
+    dirs = ['src', 'lib', 'core', 'utils', 'api', 'node_modules', 'build']
+    for i in range(count):
+        parts = [rng.choice(dirs) for _ in range(rng.randint(0, 4))]
+        directory = root.joinpath(*parts)
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"module_{i}.py").write_text(f"VALUE = {i}\n")
+
+def legacy_walk(project_path: Path, matcher: IgnoreMatcher):
+    """پیمایش قبلی: os.walk، شیء Path برای هر مسیر، is_file و stat جداگانه"""
+    def should_ignore(path: Path) -> bool:
+        if matcher.matches_parts(path.relative_to(project_path).parts):
+            return True
+        if path.is_file():
+            if path.stat().st_size > Config.MAX_FILE_SIZE:
+                return True
+        return False
+    
+    result = []
+    for root, dirs, filenames in os.walk(project_path):
+        root_path = Path(root)
+        dirs[:] = [d for d in dirs if not should_ignore(root_path / d)]
+        for filename in filenames:
+            file_path = root_path / filename
+            if should_ignore(file_path):
+                continue
+            result.append(str(file_path.relative_to(project_path)).replace('\\', '/'))
+    return result
+
+def scanner_walk(project_path: Path, matcher: IgnoreMatcher):
+    """پیمایش جدید: os.scandir و stat از DirEntry"""
+    result = []
+    for scanned in ProjectScanner(project_path, matcher).scan():
+        if scanned.ignored:
+            continue
+        if scanned.stat().st_size > Config.MAX_FILE_SIZE:
+            continue
+        result.append(scanned.path)
+    return result
+
+def count_fs_calls(func, *args) -> int:
+    """شمارش فراخوانی‌های فایل‌سیستم با sys.setprofile"""
+    counter = 0
+    
+    def profiler(frame, event, arg):
+        nonlocal counter
+        if event == 'c_call' and getattr(arg, '__name__', '') in _FS_CALLS:
+            counter += 1
+    
+    sys.setprofile(profiler)
+    try:
+        func(*args)
+    finally:
+        sys.setprofile(None)
+    return counter
+
+def best_time(func, *args, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(count: int = 10000):
+    matcher = IgnoreMatcher(Config.IGNORE_PATTERNS)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp).resolve()
+        make_tree(root, count)
+        
+        legacy_files = legacy_walk(root, matcher)
+        scanner_files = scanner_walk(root, matcher)
+        assert legacy_files == scanner_files, "ترتیب یا محتوای خروجی متفاوت است"
+        
+        print(f"📏 فایل‌ها: {count:,} | خروجی: {len(scanner_files):,} فایل (ترتیب یکسان)")
+        for label, func in (("os.walk + Path", legacy_walk), ("ProjectScanner", scanner_walk)):
+            calls = count_fs_calls(func, root, matcher)
+            elapsed = best_time(func, root, matcher)
+            print(f"   {label:15}: {calls:8,} stat/scandir  |  {elapsed * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
\ No newline at end of file
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+مقایسه قالب‌های خروجی (json، json-min، blocks) روی پروژه‌های واقعی
+
+برای هر پروژه و هر قالب: اندازه خروجی، token تخمینی، تعداد بخش‌ها با سقف
+پیش‌فرض و زمان ساختن و parse کردن خروجی گزارش می‌شود.
+
+استفاده:
+    python benchmarks/compare_formats.py /path/to/project [/path/to/other ...] [--repeat 3]
+"""
+
+import io
+import sys
+import time
+import argparse
+import contextlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config
+from export_formats import FORMATS
+from project_serializer import ProjectSerializer
+from token_estimator import estimate_tokens
+
+def quiet():
+    return contextlib.redirect_stdout(io.StringIO())
+
+def best_time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def compare_project(root: Path, repeat: int):
+    with quiet():
+        serializer = ProjectSerializer(str(root))
+        files = serializer.load_project_files()
+    header = serializer._project_header(len(files))
+    
+    print(f"\n📦 {root} ({len(files):,} فایل)")
+    print(f"   {'قالب':10} {'کاراکتر':>13} {'نسبت':>6} {'token~':>11} {'بخش‌ها':>7} "
+          f"{'ساخت (ms)':>10} {'parse (ms)':>11}")
+    
+    base_size = None
+    for name, fmt in FORMATS.items():
+        text = fmt.dumps(header, files)
+        base_size = base_size or len(text)
+        
+        serializer.export_format = name
+        parts = serializer.split_into_parts(text, Config.DEFAULT_MAX_CHARS_PER_PART)
+        build = best_time(lambda: fmt.dumps(header, files), repeat)
+        parse = best_time(lambda: serializer.deserialize_project(text), repeat)
+        
+        print(f"   {name:10} {len(text):>13,} {len(text) / base_size:>6.0%} {estimate_tokens(text):>11,} "
+              f"{len(parts):>7} {build * 1000:>10.1f} {parse * 1000:>11.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="مقایسه اندازه و سرعت قالب‌های خروجی")
+    parser.add_argument('projects', nargs='+', help="مسیر پروژه‌ها")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    for project in args.projects:
+        compare_project(Path(project).resolve(), args.repeat)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+ساخت پروژه‌های مصنوعی و قابل تکرار برای بنچمارک‌ها
+
+- تعداد فایل دلخواه (مثلاً 1k، 10k، 100k) با اندازه‌های متنوع
+- فایل‌های binary، فایل‌های بزرگ‌تر از MAX_FILE_SIZE و پوشه‌های نادیده گرفته شده
+- پوشه‌های تو در تو تا عمق زیاد
+- repository گیت محلی (fixture) با commit اولیه روی branch main
+
+با seed یکسان خروجی همیشه یکسان است.
+
+استفاده:
+    python benchmarks/generate_project.py /tmp/bench-10k 10k [--git] [--seed 1]
+"""
+
+import sys
+import json
+import random
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config
+
+GENERATOR_VERSION = 1
+
+# پوشه‌هایی که باید توسط الگوهای نادیده‌گیری حذف شوند
+IGNORED_DIRS = ['node_modules', '__pycache__', 'build', 'dist', '.venv']
+
+SOURCE_DIRS = ['src', 'lib', 'core', 'utils', 'api', 'models', 'views', 'services', 'tests', 'docs']
+
+_TEMPLATES = {
+    '.py': [
+        "def function_{n}(value):",
+        "    result = value * {n} + {m}",
+        "    return result",
+        "class Model{n}:",
+        "    \"\"\"مدل شماره {n}\"\"\"",
+        "    name = 'model_{n}'",
+        "# توضیح: مقدار {m} برای تست",
+        "",
+    ],
+    '.js': [
+        "export function handler{n}(req, res) {{",
+        "  const value = {m};",
+        "  return res.json({{ id: {n}, value }});",
+        "}}",
+        "// پیام: \"سلام\" {n}",
+        "",
+    ],
+    '.md': [
+        "## بخش {n}",
+        "این یک متن نمونه برای مستندات است و شامل عدد {m} می‌باشد.",
+        "- مورد {n}",
+        "",
+    ],
+    '.json': [
+        "{{\"id\": {n}, \"value\": {m}, \"tags\": [\"a\", \"b\\\\c\"]}}",
+    ],
+    '.txt': [
+        "Line {n}\twith tab and value {m}",
+        "خط فارسی شماره {n}",
+        "",
+    ],
+}
+
+def parse_count(text: str) -> int:
+    """تبدیل 1k / 10k / 100k / 2500 به عدد"""
+    text = text.strip().lower()
+    if text.endswith('k'):
+        return int(float(text[:-1]) * 1000)
+    if text.endswith('m'):
+        return int(float(text[:-1]) * 1000000)
+    return int(text)
+
+def _pick_size(rng: random.Random) -> int:
+    """اندازه فایل: اکثراً کوچک، تعدادی متوسط و تعداد کمی بیش از حد مجاز"""
+    roll = rng.random()
+    if roll < 0.80:
+        return rng.randint(80, 4 * 1024)
+    if roll < 0.98:
+        return rng.randint(4 * 1024, 32 * 1024)
+    if roll < 0.999:
+        return rng.randint(32 * 1024, 256 * 1024)
+    return Config.MAX_FILE_SIZE + rng.randint(1, 64 * 1024)
+
+def _make_text(rng: random.Random, ext: str, size: int) -> str:
+    templates = _TEMPLATES[ext]
+    lines = []
+    total = 0
+    n = 0
+    while total < size:
+        line = templates[n % len(templates)].format(n=n, m=rng.randint(0, 10 ** 6))
+        lines.append(line)
+        total += len(line) + 1
+        n += 1
+    return '\n'.join(lines) + '\n'
+
+def _make_dir(rng: random.Random, max_depth: int) -> str:
+    # 5٪ فایل‌ها در مسیرهای بسیار عمیق
+    depth = rng.randint(max_depth // 2, max_depth) if rng.random() < 0.05 else rng.randint(0, 3)
+    return '/'.join(rng.choice(SOURCE_DIRS) + str(rng.randint(0, 3)) for _ in range(depth))
+
+def generate_project(root: Path, file_count: int, seed: int = 1,
+                     binary_ratio: float = 0.02, ignored_ratio: float = 0.1,
+                     max_depth: int = 12) -> Dict[str, Any]:
+    """ساخت درخت پروژه در root؛ خروجی: آمار فایل‌های ساخته شده"""
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    
+    stats = {"files": 0, "text": 0, "binary": 0, "ignored": 0, "oversized": 0, "bytes": 0}
+    created_dirs = set()
+    extensions = list(_TEMPLATES)
+    
+    for i in range(file_count):
+        roll = rng.random()
+        directory = _make_dir(rng, max_depth)
+        
+        if roll < ignored_ratio:
+            directory = f"{directory}/{rng.choice(IGNORED_DIRS)}".lstrip('/')
+            kind = 'ignored'
+        elif roll < ignored_ratio + binary_ratio:
+            kind = 'binary'
+        else:
+            kind = 'text'
+        
+        if directory not in created_dirs:
+            (root / directory).mkdir(parents=True, exist_ok=True)
+            created_dirs.add(directory)
+        
+        if kind == 'binary':
+            data = bytes([0x89, 0x50, 0x4E, 0x47, 0, 0]) + rng.randbytes(rng.randint(256, 32 * 1024))
+            path = root / directory / f"image_{i}.png"
+            path.write_bytes(data)
+            size = len(data)
+        else:
+            ext = rng.choice(extensions)
+            size = _pick_size(rng)
+            if size > Config.MAX_FILE_SIZE:
+                stats["oversized"] += 1
+            content = _make_text(rng, ext, size)
+            path = root / directory / f"file_{i}{ext}"
+            with open(path, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(content)
+            size = path.stat().st_size
+        
+        stats["files"] += 1
+        stats[kind] += 1
+        stats["bytes"] += size
+    
+    return stats
+
+def _git(root: Path, *args: str):
+    subprocess.run(['git', *args], cwd=str(root), check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def make_git_fixture(root: Path):
+    """تبدیل پوشه ساخته شده به repository گیت با یک commit روی main"""
+    root = Path(root)
+    with open(root / '.gitignore', 'w', encoding='utf-8') as f:
+        f.write('\n'.join(f"{name}/" for name in IGNORED_DIRS) + '\n')
+    
+    _git(root, 'init', '-q')
+    _git(root, 'checkout', '-q', '-B', 'main')
+    _git(root, 'config', 'user.name', 'bench')
+    _git(root, 'config', 'user.email', 'bench@example.com')
+    _git(root, 'config', 'commit.gpgsign', 'false')
+    _git(root, 'add', '-A')
+    _git(root, 'commit', '-q', '-m', 'Initial commit')
+
+def ensure_fixture(root: Path, file_count: int, seed: int = 1, git: bool = True) -> Dict[str, Any]:
+    """ساخت fixture فقط اگر با همین پارامترها قبلاً ساخته نشده باشد"""
+    root = Path(root)
+    marker = root / '.bench-fixture.json'
+    params = {"version": GENERATOR_VERSION, "files": file_count, "seed": seed, "git": git}
+    
+    if marker.exists():
+        with open(marker, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+        if info.get("params") == params:
+            return info["stats"]
+        raise ValueError(f"پوشه {root} با پارامترهای دیگری ساخته شده است")
+    
+    if root.exists() and any(root.iterdir()):
+        raise ValueError(f"پوشه {root} خالی نیست")
+    
+    stats = generate_project(root, file_count, seed)
+    
+    # marker قبل از commit نوشته می‌شود تا جزو پروژه باشد
+    with open(marker, 'w', encoding='utf-8') as f:
+        json.dump({"params": params, "stats": stats}, f, indent=2)
+    
+    if git:
+        make_git_fixture(root)
+    
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="ساخت پروژه مصنوعی برای بنچمارک")
+    parser.add_argument('root', help="پوشه مقصد")
+    parser.add_argument('count', help="تعداد فایل‌ها (مثلاً 1k، 10k، 100k)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--git', action='store_true', help="ساخت repository گیت")
+    args = parser.parse_args()
+    
+    stats = ensure_fixture(Path(args.root), parse_count(args.count), args.seed, args.git)
+    print(json.dumps(stats, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+اجرای بنچمارک‌های زمان‌دار روی پروژه‌های مصنوعی و مقایسه با baseline
+
+سناریوها:
+    load_cold / load_warm / load_git_index  -> load_project_files
+    serialize_project / export_to_file
+    serialize_changes_only
+    serialize_changes_since  -> تغییرات نسبت به base branch از طریق git
+    split_into_parts
+    deserialize_project / deserialize_parts
+    apply_changes_only / apply_full_project
+    git_flow  -> create_feature_branch, stage, commit, diff, merge (هر مرحله جدا)
+
+استفاده:
+    python benchmarks/run_benchmarks.py --sizes 1k,10k
+    python benchmarks/run_benchmarks.py --sizes 1k,10k --save-baseline
+    python benchmarks/run_benchmarks.py --sizes 100k --scenarios load_cold,serialize_project
+
+نتایج در JSON ذخیره می‌شوند؛ اگر زمان بهترین اجرای یک سناریو بیش از
+--threshold نسبت به baseline کندتر شود، برنامه با کد 1 خارج می‌شود.
+baseline در benchmarks/baseline.json همراه کد commit می‌شود؛ نتایج هر اجرا
+در benchmarks/results/ (نادیده گرفته شده در گیت) می‌مانند.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import random
+import platform
+import argparse
+import statistics
+import contextlib
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+from config import Config
+from project_serializer import ProjectSerializer
+from git_manager import GitManager
+from snapshot_store import SnapshotStore
+from generate_project import ensure_fixture, parse_count
+
+RESULTS_DIR = BENCH_DIR / 'results'
+BASELINE_PATH = BENCH_DIR / 'baseline.json'
+
+# نسبت فایل‌هایی که در سناریوهای تغییر، تغییر/اضافه/حذف می‌شوند
+CHANGE_RATIO = 0.01
+
+def quiet():
+    """خاموش کردن printهای برنامه هنگام اندازه‌گیری"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+class Bench:
+    """اجرای یک سناریو چند بار و نگه داشتن زمان هر مرحله"""
+    
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+    
+    def run(self, func: Callable[[], None], setup: Callable[[], None] = None,
+            teardown: Callable[[], None] = None) -> List[Dict[str, float]]:
+        runs = []
+        for _ in range(self.repeat):
+            with quiet():
+                if setup is not None:
+                    setup()
+                start = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - start
+                if teardown is not None:
+                    teardown()
+            runs.append({"": elapsed})
+        return runs
+    
+    def run_steps(self, steps: List[tuple], setup: Callable[[], None] = None,
+                  teardown: Callable[[], None] = None) -> List[Dict[str, float]]:
+        """اجرای چند مرحله پشت سر هم با زمان‌گیری جداگانه"""
+        runs = []
+        for _ in range(self.repeat):
+            timings = {}
+            with quiet():
+                if setup is not None:
+                    setup()
+                for name, func in steps:
+                    start = time.perf_counter()
+                    func()
+                    timings[name] = time.perf_counter() - start
+                if teardown is not None:
+                    teardown()
+            runs.append(timings)
+        return runs
+
+def _make_serializer(root: Path, git_manager: GitManager = None) -> ProjectSerializer:
+    with quiet():
+        return ProjectSerializer(str(root), git_manager=git_manager)
+
+def _changed_files(files: List[Dict[str, Any]], seed: int) -> List[Dict[str, Any]]:
+    """کپی لیست فایل‌ها با درصد کمی تغییر، حذف و فایل جدید (بدون تغییر دیسک)"""
+    rng = random.Random(seed)
+    count = max(1, int(len(files) * CHANGE_RATIO))
+    result = [dict(f) for f in files]
+    
+    for index in rng.sample(range(len(result)), min(count, len(result))):
+        result[index]["content"] += f"\n# changed {index}\n"
+    
+    for index in sorted(rng.sample(range(len(result)), min(count // 2, len(result))), reverse=True):
+        del result[index]
+    
+    for i in range(count // 2):
+        result.append({"path": f"bench_new/new_{i}.py", "content": f"VALUE = {i}\n"})
+    
+    return result
+
+# ---------------------------------------------------------------- سناریوها
+
+def scenario_load_cold(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    # کش محتوا خالی است ولی cache سیستم‌عامل گرم می‌ماند
+    serializer = ctx["serializer"]
+    return bench.run(serializer.load_project_files, serializer.clear_content_cache)
+
+def scenario_load_warm(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    serializer = ctx["serializer"]
+    return bench.run(serializer.load_project_files)
+
+def scenario_load_git_index(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    serializer = _make_serializer(root, ctx["git_manager"])
+    with quiet():
+        serializer.load_project_files()
+    return bench.run(serializer.load_project_files)
+
+def scenario_serialize_project(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    serializer = ctx["serializer"]
+    
+    def run():
+        ctx["json"] = serializer.serialize_project()
+    
+    return bench.run(run)
+
+def scenario_export_to_file(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    serializer = ctx["serializer"]
+    output = Path(ctx["workdir"]) / 'export.json'
+    try:
+        return bench.run(lambda: serializer.export_to_file(output))
+    finally:
+        output.unlink(missing_ok=True)
+
+def scenario_serialize_changes_only(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    serializer = ctx["serializer"]
+    with quiet():
+        files = serializer.load_project_files()
+        serializer.serialize_project()
+    store = serializer._get_snapshot_store()
+    baseline = dict(store.load(SnapshotStore.SYNC_STATE))
+    changed = _changed_files(files, seed=2)
+    
+    def setup():
+        store.save(SnapshotStore.SYNC_STATE, dict(baseline))
+    
+    def run():
+        ctx["changes_json"] = serializer.serialize_changes_only(changed)
+    
+    return bench.run(run, setup)
+
+def scenario_serialize_changes_since(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    git_manager = ctx["git_manager"]
+    repo = git_manager.repo
+    serializer = _make_serializer(root, git_manager)
+    base_branch = git_manager.get_base_branch()
+    rng = random.Random(5)
+    
+    tracked = [p for p in repo.git.ls_files().split('\n') if p.endswith('.py')]
+    touched = rng.sample(tracked, min(len(tracked), max(1, int(len(tracked) * CHANGE_RATIO))))
+    new_file = root / 'bench_new_file.py'
+    
+    def setup():
+        for path in touched:
+            with open(root / path, 'a', encoding='utf-8', newline='\n') as f:
+                f.write("\n# bench change\n")
+        with open(new_file, 'w', encoding='utf-8', newline='\n') as f:
+            f.write("VALUE = 1\n")
+    
+    def teardown():
+        repo.git.checkout('--', *touched)
+        new_file.unlink(missing_ok=True)
+    
+    return bench.run(lambda: serializer.serialize_changes_since(base_branch), setup, teardown)
+
+def scenario_split_into_parts(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    serializer = ctx["serializer"]
+    json_str = _ensure_json(ctx)
+    
+    def run():
+        ctx["parts"] = serializer.split_into_parts(json_str, Config.DEFAULT_MAX_CHARS_PER_PART)
+    
+    return bench.run(run)
+
+def scenario_deserialize_project(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    serializer = ctx["serializer"]
+    json_str = _ensure_json(ctx)
+    return bench.run(lambda: serializer.deserialize_project(json_str))
+
+def scenario_deserialize_parts(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    serializer = ctx["serializer"]
+    if "parts" not in ctx:
+        ctx["parts"] = serializer.split_into_parts(_ensure_json(ctx), Config.DEFAULT_MAX_CHARS_PER_PART)
+    text = '\n\n'.join(ctx["parts"])
+    return bench.run(lambda: serializer.deserialize_project(text))
+
+def scenario_search_rank(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    # index یک بار ساخته می‌شود (گرم کردن)؛ فقط رتبه‌بندی و انتخاب با بودجه زمان‌گیری می‌شود
+    serializer = ctx["serializer"]
+    with quiet():
+        serializer.refresh_search_index()
+    query = "utils helper function process data model"
+    
+    return bench.run(lambda: serializer.suggest_files(query, Config.SEARCH_BUDGET_CHARS, refresh=False))
+
+def _ensure_json(ctx: Dict[str, Any]) -> str:
+    if "json" not in ctx:
+        with quiet():
+            ctx["json"] = ctx["serializer"].serialize_project()
+    return ctx["json"]
+
+def _apply_copy(root: Path, ctx: Dict[str, Any]) -> Path:
+    """کپی پروژه (بدون .git) برای سناریوهایی که روی دیسک می‌نویسند"""
+    target = Path(ctx["workdir"]) / f"apply-{root.name}"
+    if not target.exists():
+        shutil.copytree(root, target, ignore=shutil.ignore_patterns('.git'))
+    return target
+
+def scenario_apply_changes_only(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    target = _apply_copy(root, ctx)
+    serializer = _make_serializer(target)
+    with quiet():
+        files = serializer.load_project_files()
+    
+    changed = _changed_files(files, seed=3)
+    current = {f["path"]: f["content"] for f in files}
+    new = {f["path"]: f["content"] for f in changed}
+    
+    payload = {"changes_only": True, "files": []}
+    for path, content in new.items():
+        if path not in current:
+            payload["files"].append({"path": path, "content": content, "action": "added"})
+        elif current[path] != content:
+            payload["files"].append({"path": path, "content": content, "action": "modified"})
+    for path in current:
+        if path not in new:
+            payload["files"].append({"path": path, "action": "deleted"})
+    
+    def teardown():
+        # بازگرداندن پروژه به حالت قبل (خارج از زمان‌گیری)
+        for file_obj in payload["files"]:
+            path = file_obj["path"]
+            file_path = target / path
+            if path in current:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+                    f.write(current[path])
+            elif file_path.exists():
+                file_path.unlink()
+    
+    return bench.run(lambda: serializer.apply_changes(payload), teardown=teardown)
+
+def scenario_apply_full_project(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    target = _apply_copy(root, ctx)
+    serializer = _make_serializer(target)
+    payload = serializer.deserialize_project(_ensure_json(ctx))
+    # محتوای یکسان، پس اجرای تکراری پروژه را تغییر نمی‌دهد
+    return bench.run(lambda: serializer.apply_changes(payload))
+
+def scenario_git_flow(root: Path, bench: Bench, ctx: Dict[str, Any]):
+    git_manager = ctx["git_manager"]
+    repo = git_manager.repo
+    base_branch = git_manager.get_base_branch()
+    base_sha = repo.head.commit.hexsha
+    rng = random.Random(4)
+    
+    tracked = [p for p in repo.git.ls_files().split('\n') if p.endswith('.py')]
+    touched = rng.sample(tracked, min(len(tracked), max(1, int(len(tracked) * CHANGE_RATIO))))
+    state = {}
+    
+    def setup():
+        for path in touched:
+            with open(root / path, 'a', encoding='utf-8', newline='\n') as f:
+                f.write("\n# bench change\n")
+    
+    def branch():
+        state["branch"] = git_manager.create_feature_branch("bench")
+    
+    def merge():
+        git_manager.merge_to_base(base_branch)
+    
+    def teardown():
+        repo.git.checkout(base_branch)
+        repo.git.reset('--hard', base_sha)
+        git_manager.delete_branch(state["branch"])
+    
+    steps = [
+        ("create_branch", branch),
+        ("stage", git_manager.stage_all_changes),
+        ("commit", lambda: git_manager.commit_changes("bench change")),
+        ("diff", git_manager.get_diff),
+        ("merge", merge),
+    ]
+    return bench.run_steps(steps, setup, teardown)
+
+SCENARIOS = {
+    "load_cold": scenario_load_cold,
+    "load_warm": scenario_load_warm,
+    "load_git_index": scenario_load_git_index,
+    "serialize_project": scenario_serialize_project,
+    "export_to_file": scenario_export_to_file,
+    "serialize_changes_only": scenario_serialize_changes_only,
+    "serialize_changes_since": scenario_serialize_changes_since,
+    "split_into_parts": scenario_split_into_parts,
+    "deserialize_project": scenario_deserialize_project,
+    "deserialize_parts": scenario_deserialize_parts,
+    "search_rank": scenario_search_rank,
+    "apply_changes_only": scenario_apply_changes_only,
+    "apply_full_project": scenario_apply_full_project,
+    "git_flow": scenario_git_flow,
+}
+
+# ---------------------------------------------------------------- اجرا و گزارش
+
+def summarize(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, Any]]:
+    """تبدیل زمان‌های هر اجرا به best/median برای هر مرحله"""
+    result = {}
+    for step in runs[0]:
+        values = [run[step] for run in runs]
+        result[step] = {
+            "best": min(values),
+            "median": statistics.median(values),
+            "runs": values
+        }
+    return result
+
+def run_size(label: str, root: Path, workdir: Path, names: List[str],
+             repeat: int, seed: int) -> Dict[str, Any]:
+    print(f"\n📦 پروژه {label}: {root}")
+    stats = ensure_fixture(root, parse_count(label), seed=seed, git=True)
+    print(f"   {stats['files']:,} فایل | {stats['bytes'] / 1024 / 1024:.1f} MB | "
+          f"binary: {stats['binary']} | ignored: {stats['ignored']} | oversized: {stats['oversized']}")
+    
+    git_manager = GitManager(str(root))
+    with quiet():
+        git_manager.init_or_load_repo()
+        serializer = ProjectSerializer(str(root))
+        serializer.load_project_files()
+    
+    ctx = {"serializer": serializer, "git_manager": git_manager, "workdir": workdir}
+    bench = Bench(repeat)
+    results = {}
+    
+    for name in names:
+        runs = SCENARIOS[name](root, bench, ctx)
+        for step, summary in summarize(runs).items():
+            key = f"{label}/{name}" + (f".{step}" if step else "")
+            results[key] = summary
+            print(f"   ⏱️  {key:42} best {summary['best'] * 1000:10.1f} ms | "
+                  f"median {summary['median'] * 1000:10.1f} ms")
+    
+    return results
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float, min_delta: float) -> List[str]:
+    """لیست سناریوهایی که نسبت به baseline کندتر شده‌اند"""
+    regressions = []
+    print(f"\n📊 مقایسه با baseline (آستانه {threshold:.0%}):")
+    
+    for key, summary in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"   🆕 {key:42} (در baseline نیست)")
+            continue
+        
+        ratio = summary["best"] / base["best"] if base["best"] else float('inf')
+        delta = summary["best"] - base["best"]
+        regressed = ratio > 1 + threshold and delta > min_delta
+        marker = "❌" if regressed else ("✅" if ratio < 1 - threshold else "  ")
+        print(f"   {marker} {key:42} {base['best'] * 1000:10.1f} -> {summary['best'] * 1000:10.1f} ms "
+              f"({ratio:5.2f}x)")
+        
+        if regressed:
+            regressions.append(key)
+    
+    return regressions
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=str(BENCH_DIR.parent),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="بنچمارک ProjectSerializer و GitManager")
+    parser.add_argument('--sizes', default='1k,10k', help="اندازه پروژه‌ها، مثلاً 1k,10k,100k")
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help="لیست سناریوها با کاما")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--workdir', help="پوشه fixtureها (برای استفاده مجدد بین اجراها)")
+    parser.add_argument('--output', default=str(RESULTS_DIR / 'latest.json'))
+    parser.add_argument('--baseline', default=str(BASELINE_PATH))
+    parser.add_argument('--save-baseline', action='store_true', help="ذخیره نتایج به عنوان baseline")
+    parser.add_argument('--threshold', type=float, default=0.20,
+                        help="حداکثر کندی مجاز نسبت به baseline (0.20 = 20٪)")
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help="تفاوت‌های کمتر از این مقدار (ثانیه) نویز در نظر گرفته می‌شوند")
+    args = parser.parse_args()
+    
+    names = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"سناریوی ناشناخته: {', '.join(unknown)}")
+    
+    temp_dir = None
+    if args.workdir:
+        workdir = Path(args.workdir).resolve()
+        workdir.mkdir(parents=True, exist_ok=True)
+    else:
+        temp_dir = tempfile.TemporaryDirectory(prefix='ide-sync-bench-')
+        workdir = Path(temp_dir.name)
+    
+    sizes = [size.strip() for size in args.sizes.split(',') if size.strip()]
+    results = {}
+    
+    # پوشه state پروژه‌های بدون .git (کش محتوا، snapshotها، journal) داخل
+    # workdir ساخته می‌شود، نه در ~/.cache که با هر اجرا یک پوشه جدید می‌گرفت
+    previous_cache_home = os.environ.get('XDG_CACHE_HOME')
+    os.environ['XDG_CACHE_HOME'] = str(workdir / 'cache')
+    
+    try:
+        for label in sizes:
+            size_dir = workdir / f"run-{label}"
+            shutil.rmtree(size_dir, ignore_errors=True)
+            size_dir.mkdir()
+            results.update(run_size(label, workdir / f"project-{label}-s{args.seed}",
+                                    size_dir, names, args.repeat, args.seed))
+    finally:
+        if previous_cache_home is None:
+            os.environ.pop('XDG_CACHE_HOME', None)
+        else:
+            os.environ['XDG_CACHE_HOME'] = previous_cache_home
+        if temp_dir is not None:
+            temp_dir.cleanup()
+    
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec='seconds'),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "sizes": sizes,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results
+    }
+    
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 نتایج ذخیره شد: {output}")
+    
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output, baseline_path)
+        print(f"📌 baseline به‌روز شد: {baseline_path}")
+        return 0
+    
+    if not baseline_path.exists():
+        print(f"ℹ️  baseline یافت نشد ({baseline_path})؛ با --save-baseline بسازید")
+        return 0
+    
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)["results"]
+    
+    regressions = compare(results, baseline, args.threshold, args.min_delta)
+    if regressions:
+        print(f"\n❌ {len(regressions)} سناریو کندتر شده است: {', '.join(regressions)}")
+        return 1
+    
+    print("\n✅ کندی قابل توجهی نسبت به baseline دیده نشد")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
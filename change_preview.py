@@ -0,0 +1,143 @@
+import difflib
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from apply_engine import ApplyEngine
+
+STATUS_ADDED = "added"
+STATUS_MODIFIED = "modified"
+STATUS_DELETED = "deleted"
+STATUS_UNCHANGED = "unchanged"
+
+STATUS_TITLES = {
+    STATUS_ADDED: "➕ جدید",
+    STATUS_MODIFIED: "✏️ تغییر",
+    STATUS_DELETED: "➖ حذف",
+    STATUS_UNCHANGED: "⏸️ بدون تغییر",
+}
+
+# diff طولانی‌تر از این تعداد خط کوتاه نمایش داده می‌شود
+MAX_DIFF_LINES = 20000
+
+_BINARY_SNIFF_BYTES = 8192
+
+def _decode(data: bytes) -> Optional[str]:
+    """متن bytes فایل؛ None برای فایل binary یا غیر UTF-8"""
+    if b'\0' in data[:_BINARY_SNIFF_BYTES]:
+        return None
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+def _read(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+def line_stats(old: str, new: str) -> Tuple[int, int]:
+    """تعداد خطوط اضافه و حذف شده (مقایسه چندمجموعه‌ای خطوط، بدون diff کامل)
+    
+    هزینه خطی است؛ خطی که فقط جابه‌جا شده باشد در آمار نمی‌آید.
+    """
+    old_counts = Counter(old.splitlines())
+    new_counts = Counter(new.splitlines())
+    return sum((new_counts - old_counts).values()), sum((old_counts - new_counts).values())
+
+class FilePreview:
+    """وضعیت یک فایل در پیش‌نمایش؛ diff کامل فقط هنگام درخواست ساخته می‌شود"""
+    
+    __slots__ = ('path', 'status', 'added', 'removed', 'binary', '_target', '_new', '_diff')
+    
+    def __init__(self, path: str, status: str, added: int = 0, removed: int = 0, binary: bool = False,
+                 target: Path = None, new: Optional[str] = None):
+        self.path = path
+        self.status = status
+        self.added = added
+        self.removed = removed
+        self.binary = binary
+        self._target = target
+        self._new = new
+        self._diff: Optional[str] = None
+    
+    def diff(self) -> str:
+        """unified diff فایل روی دیسک با محتوای پاسخ (محاسبه و کش در اولین درخواست)"""
+        if self._diff is not None:
+            return self._diff
+        
+        if self.status == STATUS_UNCHANGED:
+            self._diff = "محتوای پاسخ با فایل فعلی یکسان است"
+            return self._diff
+        
+        old = ""
+        if self.status != STATUS_ADDED:
+            data = _read(self._target)
+            old = _decode(data) if data is not None else ""
+        if old is None or self.binary:
+            self._diff = "فایل فعلی binary است و diff متنی ندارد"
+            return self._diff
+        
+        lines = difflib.unified_diff(old.splitlines(), (self._new or "").splitlines(),
+                                     fromfile=f"a/{self.path}", tofile=f"b/{self.path}", lineterm="")
+        shown = list(islice(lines, MAX_DIFF_LINES + 1))
+        if len(shown) > MAX_DIFF_LINES:
+            shown[MAX_DIFF_LINES:] = [f"... (diff بیش از {MAX_DIFF_LINES} خط است و کوتاه شد)"]
+        self._diff = "\n".join(shown)
+        return self._diff
+
+class ChangePreview:
+    """پیش‌نمایش اعمال یک پاسخ: وضعیت و آمار خطوط هر فایل نسبت به دیسک
+    
+    از عملیات صف شده ApplyEngine ساخته می‌شود، پس دقیقاً همان چیزی را نشان
+    می‌دهد که apply انجام خواهد داد، بدون ساخت branch یا نوشتن روی دیسک.
+    """
+    
+    def __init__(self, files: List[FilePreview], notes: List[str] = None):
+        self.files = files
+        self.notes = notes or []
+    
+    def __len__(self) -> int:
+        return len(self.files)
+    
+    @classmethod
+    def from_engine(cls, engine: ApplyEngine) -> 'ChangePreview':
+        files: Dict[str, FilePreview] = {}
+        for op in engine.operations:
+            # اگر یک مسیر چند بار در صف باشد، آخرین عملیات نتیجه نهایی است
+            files.pop(op.path, None)
+            files[op.path] = cls._preview_operation(op)
+        return cls(list(files.values()), engine.notes())
+    
+    @staticmethod
+    def _preview_operation(op) -> FilePreview:
+        data = _read(op.target)
+        
+        if not op.is_write:
+            old = _decode(data) if data is not None else ""
+            removed = len(old.splitlines()) if old else 0
+            return FilePreview(op.path, STATUS_DELETED, 0, removed, old is None, op.target)
+        
+        if data is None:
+            return FilePreview(op.path, STATUS_ADDED, len(op.content.splitlines()), 0, False, op.target, op.content)
+        if data == op.encoded():
+            return FilePreview(op.path, STATUS_UNCHANGED, target=op.target)
+        
+        old = _decode(data)
+        if old is None:
+            return FilePreview(op.path, STATUS_MODIFIED, len(op.content.splitlines()), 0, True,
+                               op.target, op.content)
+        added, removed = line_stats(old, op.content)
+        return FilePreview(op.path, STATUS_MODIFIED, added, removed, False, op.target, op.content)
+    
+    def counts(self) -> Dict[str, int]:
+        """تعداد فایل‌ها در هر وضعیت"""
+        return dict(Counter(preview.status for preview in self.files))
+    
+    def summary(self) -> str:
+        counts = self.counts()
+        parts = [f"{STATUS_TITLES[status]}: {counts[status]}" for status in STATUS_TITLES if counts.get(status)]
+        added = sum(preview.added for preview in self.files)
+        removed = sum(preview.removed for preview in self.files)
+        return f"{'، '.join(parts) or 'هیچ فایلی'} — خطوط: +{added} / −{removed}"
\ No newline at end of file
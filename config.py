@@ -1,95 +1,176 @@
-from pathlib import Path
-
-class Config:
-    """تنظیمات برنامه"""
-    
-    # تنظیمات Git
-    DEFAULT_BASE_BRANCH = 'main'
-    FEATURE_BRANCH_PREFIX = 'ai-feature'
-    
-    # فایل‌هایی که باید نادیده گرفته شوند
-    IGNORE_PATTERNS = [
-        '.git',
-        '__pycache__',
-        '*.pyc',
-        '.env',
-        'node_modules',
-        '.vscode',
-        '.idea',
-        '*.log',
-        '.DS_Store',
-        'venv',
-        'env',
-        '*.exe',
-        '*.dll',
-        '*.so',
-        '.pytest_cache',
-        'dist',
-        'build',
-        '*.egg-info'
-        'assets'
-        'backups'
-    ]
-    
-    # حداکثر اندازه فایل (در بایت)
-    MAX_FILE_SIZE = 1024 * 1024  # 1MB
-    
-    # تنظیمات تقسیم‌بندی
-    DEFAULT_MAX_CHARS_PER_PART = 15000  # 15K کاراکتر (برای اکثر AI‌ها مناسب)
-    MIN_CHARS_PER_PART = 5000
-    MAX_CHARS_PER_PART = 100000
-    
-    # فرمت خروجی
-    OUTPUT_FORMAT = "json"
-    
-    # پیام‌های راهنما
-    SYSTEM_PROMPT = """شما یک دستیار برنامه‌نویسی متخصص هستید. من یک پروژه نرم‌افزاری را به شما می‌دهم.
-
-**فرمت پروژه:**
-پروژه به صورت JSON است با این ساختار:
-{
-  "project_name": "نام پروژه",
-  "files": [
-    {"path": "مسیر فایل", "content": "محتوای فایل"}
-  ]
-}
-
-**اگر پروژه در چند بخش ارسال شد:**
-- هر بخش با ---START PART X/Y--- شروع می‌شود
-- با ---END PART X/Y--- تمام می‌شود
-- منتظر تمام بخش‌ها باشید
-- پس از دریافت هر بخش فقط بگویید: "بخش X دریافت شد"
-- پس از دریافت آخرین بخش بگویید: "تمام بخش‌ها دریافت شد. آماده دریافت درخواست"
-
-**دو حالت پاسخ:**
-
-**حالت 1: تغییرات کامل (تمام فایل‌ها)**
-- کل پروژه را با تغییرات برگردانید
-- همان فرمت JSON
-
-**حالت 2: فقط تغییرات (توصیه می‌شود)**
-- فقط فایل‌های تغییر یافته را برگردانید:
-{
-  "project_name": "نام پروژه",
-  "changes_only": true,
-  "files": [
-    {"path": "فایل تغییر یافته", "content": "محتوای جدید", "action": "modified"},
-    {"path": "فایل جدید", "content": "محتوا", "action": "added"},
-    {"path": "فایل حذفی", "action": "deleted"}
-  ]
-}
-
-**مهم:**
-- فقط JSON خروجی بدهید
-- بدون توضیحات اضافه در داخل JSON
-- در صورت نیاز به توضیح، قبل از JSON بنویسید
-- اگر خروجی بزرگ شد، آن را به بخش‌های 10000 کاراکتری تقسیم کنید
-
-آماده هستید؟"""
-    
-    SYSTEM_PROMPT_MULTI_PART = """توجه: این پروژه در {total_parts} بخش ارسال می‌شود.
-
-لطفاً پس از دریافت هر بخش فقط بگویید: "بخش X دریافت شد"
-پس از دریافت بخش آخر، بگویید: "تمام بخش‌ها دریافت شد. آماده‌ام."
-
+import os
+from pathlib import Path
+
+class Config:
+    """تنظیمات برنامه"""
+    
+    # تنظیمات Git
+    DEFAULT_BASE_BRANCH = 'main'
+    FEATURE_BRANCH_PREFIX = 'ai-feature'
+    # تغییرات هوش مصنوعی مستقیماً در objectهای گیت commit شوند (بدون نوشتن روی
+    # working tree)؛ پس از تایید فقط fast-forward، و رد کردن فقط حذف branch است.
+    # حالت اختیاری؛ پیش‌فرض همان روند checkout، نوشتن فایل‌ها و merge است
+    GIT_OBJECT_COMMIT = False
+    
+    # فایل‌هایی که باید نادیده گرفته شوند
+    IGNORE_PATTERNS = [
+        '.git',
+        '__pycache__',
+        '*.pyc',
+        '.env',
+        'node_modules',
+        '.vscode',
+        '.idea',
+        '*.log',
+        '.DS_Store',
+        'venv',
+        'env',
+        '*.exe',
+        '*.dll',
+        '*.so',
+        '.pytest_cache',
+        'dist',
+        'build',
+        '*.egg-info'
+        'assets'
+        'backups'
+    ]
+    
+    # حداکثر اندازه فایل (در بایت)
+    MAX_FILE_SIZE = 1024 * 1024  # 1MB
+    
+    # فایل‌های بزرگ‌تر از این مقدار با mmap خوانده می‌شوند
+    MMAP_THRESHOLD = 256 * 1024  # 256KB
+    
+    # تعداد بایت‌های ابتدای فایل برای تشخیص binary
+    BINARY_SNIFF_BYTES = 8192
+    
+    # تعداد threadهای بارگذاری موازی فایل‌ها (1 = بارگذاری ترتیبی)
+    LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
+    # در repositoryها لیست فایل‌ها از index گیت خوانده شود (به جای os.walk)
+    USE_GIT_INDEX = True
+    
+    # کش محتوای فایل‌ها (داخل .git/ide-sync یا ~/.cache/ide-sync)
+    STATE_DIR_NAME = 'ide-sync'
+    CONTENT_CACHE_ENABLED = True
+    CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+    
+    # حالت نظارت زنده (GUI)
+    WATCH_USE_INOTIFY = True
+    WATCH_POLL_INTERVAL = 2.0  # ثانیه (وقتی inotify در دسترس نباشد)
+    WATCH_DEBOUNCE = 0.2  # ثانیه
+    WATCH_FLUSH_TIMEOUT = 5.0  # حداکثر انتظار برای اعمال تغییرات در صف قبل از خروجی (ثانیه)
+    
+    # خروجی جریانی
+    CLIPBOARD_MAX_CHARS = 20 * 1024 * 1024  # خروجی بزرگ‌تر فقط در فایل ذخیره می‌شود
+    EXPORT_READ_CHUNK = 1024 * 1024  # اندازه تکه‌ها هنگام چاپ فایل خروجی
+    GUI_PREVIEW_MAX_CHARS = 2 * 1024 * 1024  # حداکثر متن نمایش داده شده در تب خروجی
+    
+    # تنظیمات تقسیم‌بندی
+    DEFAULT_MAX_CHARS_PER_PART = 15000  # 15K کاراکتر (برای اکثر AI‌ها مناسب)
+    MIN_CHARS_PER_PART = 5000
+    MAX_CHARS_PER_PART = 100000
+    
+    # سقف بخش‌ها بر حسب token تخمینی
+    DEFAULT_MAX_TOKENS_PER_PART = 4000
+    MIN_TOKENS_PER_PART = 1000
+    MAX_TOKENS_PER_PART = 100000
+    
+    # روش چیدن فایل‌ها در بخش‌ها: "ffd" (کمترین تعداد بخش، فایل‌های هر پوشه کنار هم)
+    # یا "ordered" (پر کردن ترتیبی به ترتیب مسیرها)
+    PART_PACKING = "ffd"
+    
+    # قالب پیش‌فرض خروجی: "json" (indent=2)، "json-min" (بدون فاصله) یا
+    # "blocks" (محتوای خام هر فایل داخل fence؛ کوچک‌ترین و خواناترین برای AI)
+    EXPORT_FORMAT = "json"
+    
+    # اعمال پاسخ‌های unified diff (action: "patch")
+    PATCH_FUZZ = 2  # حداکثر خطوط context ابتدا/انتهای hunk که می‌توانند مطابقت نداشته باشند
+    PATCH_ALLOW_PARTIAL = False  # با رد شدن یک hunk، hunkهای موفق همان فایل نوشته شوند یا نه
+    
+    # تعداد threadهای نوشتن فایل‌ها هنگام اعمال تغییرات (1 = نوشتن ترتیبی)
+    APPLY_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+    
+    # در خروجی «فایل‌های انتخابی»، بقیه فایل‌ها به صورت outline (فقط امضاها،
+    # فقط خواندنی) ارسال شوند
+    OUTLINE_UNSELECTED = True
+    
+    # انتخاب خودکار فایل‌های مرتبط با جستجو (BM25): سقف پیش‌فرض حجم فایل‌های انتخابی
+    SEARCH_BUDGET_CHARS = 60000
+    SEARCH_BUDGET_TOKENS = 15000
+    
+    # فرمت خروجی
+    OUTPUT_FORMAT = "json"
+    
+    # پیام‌های راهنما
+    SYSTEM_PROMPT = """شما یک دستیار برنامه‌نویسی متخصص هستید. من یک پروژه نرم‌افزاری را به شما می‌دهم.
+
+**فرمت پروژه:**
+پروژه به صورت JSON است با این ساختار:
+{
+  "project_name": "نام پروژه",
+  "files": [
+    {"path": "مسیر فایل", "content": "محتوای فایل"}
+  ]
+}
+
+**اگر پروژه در چند بخش ارسال شد:**
+- هر بخش با ---START PART X/Y--- شروع می‌شود
+- با ---END PART X/Y--- تمام می‌شود
+- منتظر تمام بخش‌ها باشید
+- پس از دریافت هر بخش فقط بگویید: "بخش X دریافت شد"
+- پس از دریافت آخرین بخش بگویید: "تمام بخش‌ها دریافت شد. آماده دریافت درخواست"
+
+**سه حالت پاسخ:**
+
+**حالت 1: تغییرات کامل (تمام فایل‌ها)**
+- کل پروژه را با تغییرات برگردانید
+- همان فرمت JSON
+
+**حالت 2: فقط تغییرات (توصیه می‌شود)**
+- فقط فایل‌های تغییر یافته را برگردانید:
+{
+  "project_name": "نام پروژه",
+  "changes_only": true,
+  "files": [
+    {"path": "فایل تغییر یافته", "content": "محتوای جدید", "action": "modified"},
+    {"path": "فایل جدید", "content": "محتوا", "action": "added"},
+    {"path": "فایل حذفی", "action": "deleted"}
+  ]
+}
+
+**حالت 3: patch (برای تغییرات کوچک در فایل‌های بزرگ)**
+- در حالت changes_only به جای کل محتوا، unified diff فایل را بدهید:
+{
+  "project_name": "نام پروژه",
+  "changes_only": true,
+  "files": [
+    {"path": "فایل تغییر یافته", "action": "patch", "diff": "@@ -10,3 +10,3 @@\n خط context\n-خط حذفی\n+خط جدید\n خط context"}
+  ]
+}
+- هر hunk با @@ -شروع,تعداد +شروع,تعداد @@ شروع می‌شود
+- هر خط با یک کاراکتر شروع می‌شود: فاصله (بدون تغییر)، - (حذف) یا + (اضافه)
+- حداقل 3 خط context قبل و بعد از هر تغییر بیاورید و خطوط را دقیقاً مثل فایل بنویسید
+- hunkهایی که با فایل مطابقت نداشته باشند رد می‌شوند و فایل تغییر نمی‌کند
+- می‌توانید حالت 2 و 3 را در یک پاسخ با هم استفاده کنید
+
+**فایل‌های outline:**
+- فایل‌هایی که "outline": true و "read_only": true دارند فقط importها، کلاس‌ها و امضای توابع را نشان می‌دهند
+- "lines" تعداد خطوط فایل واقعی است
+- این فایل‌ها را در پاسخ برنگردانید؛ اگر به محتوای کامل یکی از آن‌ها نیاز دارید، آن را درخواست کنید
+
+**مهم:**
+- فقط JSON خروجی بدهید
+- بدون توضیحات اضافه در داخل JSON
+- در صورت نیاز به توضیح، قبل از JSON بنویسید
+- اگر خروجی بزرگ شد، آن را به بخش‌های 10000 کاراکتری تقسیم کنید
+
+آماده هستید؟"""
+    
+    SYSTEM_PROMPT_MULTI_PART = """توجه: این پروژه در {total_parts} بخش ارسال می‌شود.
+
+لطفاً پس از دریافت هر بخش فقط بگویید: "بخش X دریافت شد"
+پس از دریافت بخش آخر، بگویید: "تمام بخش‌ها دریافت شد. آماده‌ام."
+
 سپس درخواست‌های من را پردازش کنید و پاسخ دهید."""
\ No newline at end of file
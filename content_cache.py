@@ -0,0 +1,166 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from config import Config
+
+def get_project_state_dir(project_path: Path) -> Path:
+    """پوشه داده‌های داخلی برنامه برای یک پروژه
+    
+    اگر پروژه repository گیت باشد داخل .git ذخیره می‌شود (هرگز export نمی‌شود)،
+    در غیر این صورت در پوشه cache کاربر.
+    """
+    project_path = Path(project_path).resolve()
+    git_dir = project_path / '.git'
+    
+    if git_dir.is_dir():
+        state_dir = git_dir / Config.STATE_DIR_NAME
+    else:
+        cache_root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        digest = hashlib.sha1(str(project_path).encode('utf-8')).hexdigest()[:12]
+        state_dir = Path(cache_root) / Config.STATE_DIR_NAME / f"{project_path.name}-{digest}"
+    
+    state_dir.mkdir(parents=True, exist_ok=True)
+    return state_dir
+
+class ContentCache:
+    """کش دائمی محتوای فایل‌ها بر اساس stat
+    
+    کلید: مسیر نسبی + st_mtime_ns + st_size + st_ino
+    مقدار: متن decode شده یا حکم binary بودن فایل
+    نوشتن‌ها تا flush() در حافظه جمع می‌شوند و در یک transaction ذخیره می‌شوند.
+    """
+    
+    SCHEMA_VERSION = 1
+    
+    def __init__(self, db_path: Path, max_bytes: int = None):
+        self.db_path = Path(db_path)
+        self.max_bytes = Config.CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        self._pending_puts = []
+        self._pending_touches = []
+        
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_schema()
+    
+    def _init_schema(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS entries")
+        
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                content TEXT,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries(last_used)")
+        self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self._conn.commit()
+    
+    @staticmethod
+    def _stat_key(st: os.stat_result) -> Tuple[int, int, int]:
+        return st.st_mtime_ns, st.st_size, st.st_ino
+    
+    def get(self, path: str, st: os.stat_result) -> Optional[Tuple[str, Optional[str]]]:
+        """دریافت (نوع، محتوا) اگر stat فایل از زمان ذخیره تغییر نکرده باشد"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, inode, kind, content FROM entries WHERE path = ?",
+                (path,)
+            ).fetchone()
+            
+            if row is None or tuple(row[:3]) != self._stat_key(st):
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            self._pending_touches.append(path)
+            return row[3], row[4]
+    
+    def put(self, path: str, st: os.stat_result, kind: str, content: Optional[str] = None):
+        """ثبت نتیجه خواندن یک فایل (تا flush در حافظه می‌ماند)"""
+        mtime_ns, size, inode = self._stat_key(st)
+        with self._lock:
+            self._pending_puts.append((path, mtime_ns, size, inode, kind, content))
+    
+    def flush(self):
+        """ذخیره نوشتن‌های معلق و حذف قدیمی‌ترین رکوردها تا زیر سقف حجم"""
+        with self._lock:
+            if not self._pending_puts and not self._pending_touches:
+                return
+            
+            now = time.time()
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [entry + (now,) for entry in self._pending_puts]
+                )
+                self._conn.executemany(
+                    "UPDATE entries SET last_used = ? WHERE path = ?",
+                    [(now, path) for path in self._pending_touches]
+                )
+                self._evict()
+            
+            self._pending_puts = []
+            self._pending_touches = []
+    
+    def _evict(self):
+        """حذف LRU تا زمانی که حجم کل از max_bytes کمتر شود"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        to_delete = []
+        for path, size in self._conn.execute("SELECT path, size FROM entries ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            to_delete.append((path,))
+            total -= size
+        
+        self._conn.executemany("DELETE FROM entries WHERE path = ?", to_delete)
+    
+    def clear(self):
+        """پاک کردن کامل کش"""
+        with self._lock:
+            self._pending_puts = []
+            self._pending_touches = []
+            with self._conn:
+                self._conn.execute("DELETE FROM entries")
+            self._conn.execute("VACUUM")
+            self.hits = 0
+            self.misses = 0
+    
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """آمار کش: hit/miss و تعداد و حجم رکوردها"""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": total
+        }
+    
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
@@ -0,0 +1,255 @@
+import json
+import re
+from abc import ABC, abstractmethod
+from json.encoder import encode_basestring as _encode_str
+from typing import Any, Dict, List, Optional
+from config import Config
+from export_writer import encode_json_record, json_document_head, json_document_tail
+
+FORMAT_JSON = "json"
+FORMAT_JSON_MIN = "json-min"
+FORMAT_BLOCKS = "blocks"
+
+# خطوطی که فقط از backtick تشکیل شده‌اند (برای انتخاب fence امن)
+_BACKTICK_LINE = re.compile(r'^(`{3,})', re.MULTILINE)
+
+class ExportFormat(ABC):
+    """قالب متن خروجی پروژه
+    
+    هر سند از head (اطلاعات پروژه)، رکوردهای فایل با جداکننده و tail
+    ساخته می‌شود تا نوشتن جریانی و تقسیم به بخش‌ها برای همه قالب‌ها یکسان
+    باشد. encode_content شکل محتوای فایل داخل رکورد است (برای تخمین اندازه).
+    head، tail و encode_record انتزاعی‌اند تا قالب ناقص هنگام ساخت خطا بدهد.
+    """
+    
+    name = ""
+    title = ""
+    extension = ".json"
+    first_separator = ""
+    separator = ""
+    # محتوا در این قالب escape می‌شود یا خام می‌ماند (برای کلید کش token)
+    content_encoding = "json"
+    
+    @abstractmethod
+    def head(self, header: Dict[str, Any]) -> str:
+        """ابتدای سند تا پیش از اولین رکورد"""
+    
+    @abstractmethod
+    def tail(self, has_items: bool, trailer: Dict[str, Any] = None) -> str:
+        """انتهای سند پس از آخرین رکورد"""
+    
+    @abstractmethod
+    def encode_record(self, record: Dict[str, Any]) -> str:
+        """متن یک رکورد فایل (بدون جداکننده)"""
+    
+    def encode_content(self, content: str) -> str:
+        return _encode_str(content)
+    
+    def parse(self, text: str) -> Dict[str, Any]:
+        return json.loads(text)
+    
+    def dumps(self, header: Dict[str, Any], records: List[Dict[str, Any]],
+              trailer: Dict[str, Any] = None) -> str:
+        """ساخت کل سند در حافظه"""
+        body = self.separator.join(self.encode_record(record) for record in records)
+        if records:
+            body = self.first_separator + body
+        return self.head(header) + body + self.tail(bool(records), trailer)
+
+class JsonFormat(ExportFormat):
+    """JSON با indent=2 (قالب پیش‌فرض و سازگار با نسخه‌های قبلی)"""
+    
+    name = FORMAT_JSON
+    title = "JSON"
+    first_separator = "\n"
+    separator = ",\n"
+    
+    def head(self, header):
+        return json_document_head(header)
+    
+    def tail(self, has_items, trailer=None):
+        return json_document_tail(has_items, trailer)
+    
+    def encode_record(self, record):
+        return encode_json_record(record)
+    
+    def dumps(self, header, records, trailer=None):
+        document = dict(header)
+        document["files"] = records
+        if trailer:
+            document.update(trailer)
+        return json.dumps(document, ensure_ascii=False, indent=2)
+
+class MinifiedJsonFormat(ExportFormat):
+    """JSON بدون فاصله و تورفتگی"""
+    
+    name = FORMAT_JSON_MIN
+    title = "JSON فشرده"
+    separator = ","
+    
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    
+    def head(self, header):
+        if not header:
+            return '{"files":['
+        return self._dumps(header)[:-1] + ',"files":['
+    
+    def tail(self, has_items, trailer=None):
+        if trailer:
+            return '],' + self._dumps(trailer)[1:]
+        return ']}'
+    
+    def encode_record(self, record):
+        return self._dumps(record)
+
+class BlocksFormat(ExportFormat):
+    """قالب بلوکی: خطوط "#@ کلید: مقدار" و محتوای خام هر فایل داخل fence
+    
+    نمونه:
+        #@ format: blocks
+        #@ project_name: demo
+        #@ total_files: 1
+        
+        #@ file: src/app.py
+        ```
+        print("hello")
+        ```
+    
+    محتوا escape نمی‌شود؛ طول fence هر فایل از طولانی‌ترین خط backtick داخل
+    محتوا بیشتر است، پس پایان بلوک همیشه قطعی است. مقدارهای رشته‌ای که
+    خودشان JSON معتبر هستند (مثل "123" یا "true") یا خط جدید دارند و
+    مقدارهای غیر رشته‌ای به شکل JSON نوشته می‌شوند.
+    """
+    
+    name = FORMAT_BLOCKS
+    title = "بلوک متنی"
+    extension = ".txt"
+    first_separator = "\n"
+    separator = "\n\n"
+    content_encoding = "raw"
+    
+    MAGIC = "#@ format: blocks"
+    PREFIX = "#@ "
+    
+    @staticmethod
+    def _encode_value(value: Any) -> str:
+        if isinstance(value, str) and value == value.strip() and '\n' not in value and '\r' not in value:
+            try:
+                json.loads(value)
+            except ValueError:
+                return value
+        return json.dumps(value, ensure_ascii=False)
+    
+    @staticmethod
+    def _decode_value(text: str) -> Any:
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+    
+    def _meta_lines(self, data: Dict[str, Any]) -> str:
+        return ''.join(f"{self.PREFIX}{key}: {self._encode_value(value)}\n" for key, value in data.items())
+    
+    def head(self, header):
+        return f"{self.MAGIC}\n{self._meta_lines(header)}"
+    
+    def tail(self, has_items, trailer=None):
+        if trailer:
+            return '\n\n' + self._meta_lines(trailer)
+        return '\n'
+    
+    def encode_content(self, content):
+        runs = _BACKTICK_LINE.findall(content) if '```' in content else None
+        fence = '`' * (max(map(len, runs)) + 1 if runs else 3)
+        return f"{fence}\n{content}\n{fence}"
+    
+    def encode_record(self, record):
+        lines = [f"{self.PREFIX}file: {self._encode_value(record.get('path', ''))}\n"]
+        for key, value in record.items():
+            if key not in ("path", "content"):
+                lines.append(f"{self.PREFIX}{key}: {self._encode_value(value)}\n")
+        
+        block = ''.join(lines)
+        if "content" in record:
+            return block + self.encode_content(record["content"] or "")
+        return block[:-1]
+    
+    def parse(self, text):
+        header: Dict[str, Any] = {}
+        files: List[Dict[str, Any]] = []
+        record: Optional[Dict[str, Any]] = None
+        position = 0
+        length = len(text)
+        
+        while position < length:
+            end = text.find('\n', position)
+            if end < 0:
+                end = length
+            line = text[position:end].rstrip('\r')
+            position = end + 1
+            
+            if line.startswith(self.PREFIX):
+                key, separator, value = line[len(self.PREFIX):].partition(': ')
+                if not separator:
+                    key, value = key.rstrip(':'), ""
+                if key == "format":
+                    continue
+                if key == "file":
+                    record = {"path": self._decode_value(value)}
+                    files.append(record)
+                elif record is not None:
+                    record[key] = self._decode_value(value)
+                else:
+                    header[key] = self._decode_value(value)
+            
+            elif line.startswith('```'):
+                if record is None:
+                    raise ValueError(f"بلوک محتوای بدون «#@ file» در خروجی: {line[:40]}")
+                
+                # متن بعد از backtickها (مثل نام زبان) نادیده گرفته می‌شود
+                fence = line[:len(line) - len(line.lstrip('`'))]
+                close = text.find('\n' + fence, end)
+                while close >= 0:
+                    after = close + 1 + len(fence)
+                    if after >= length or text[after] in '\r\n':
+                        break
+                    close = text.find('\n' + fence, after)
+                if close < 0:
+                    raise ValueError(f"پایان بلوک محتوای فایل {record.get('path')} یافت نشد")
+                
+                record["content"] = text[end + 1:close] if close > end else ""
+                # پس از پایان محتوا، فیلدهای بعدی به سطح سند تعلق دارند
+                record = None
+                position = close + 1 + len(fence)
+            
+            elif line.strip():
+                raise ValueError(f"خط نامعتبر در خروجی بلوکی: {line[:60]}")
+        
+        header["files"] = files
+        return header
+
+FORMATS: Dict[str, ExportFormat] = {
+    fmt.name: fmt for fmt in (JsonFormat(), MinifiedJsonFormat(), BlocksFormat())
+}
+
+def get_format(name: str = None) -> ExportFormat:
+    """قالب با نام داده شده (پیش‌فرض: Config.EXPORT_FORMAT)"""
+    name = name or Config.EXPORT_FORMAT
+    if name not in FORMATS:
+        raise ValueError(f"قالب خروجی ناشناخته: {name} (قالب‌های موجود: {', '.join(FORMATS)})")
+    return FORMATS[name]
+
+def detect_format(text: str) -> ExportFormat:
+    """تشخیص قالب یک متن خروجی"""
+    start = text.lstrip()
+    if start.startswith(BlocksFormat.MAGIC):
+        return FORMATS[FORMAT_BLOCKS]
+    if start.startswith('{\n'):
+        return FORMATS[FORMAT_JSON]
+    return FORMATS[FORMAT_JSON_MIN]
+
+def parse_document(text: str) -> Dict[str, Any]:
+    """parse متن خروجی در هر قالب"""
+    return detect_format(text).parse(text)
\ No newline at end of file
@@ -0,0 +1,102 @@
+import json
+import tempfile
+from json.encoder import encode_basestring as _encode_str
+from typing import Any, Dict, TextIO
+
+def encode_json_record(record: Dict[str, Any], level: int = 2) -> str:
+    """encode یک رکورد با همان قالب json.dumps(..., indent=2) در عمق level
+    
+    مقدارهای رشته‌ای سطح اول (مثل content) مستقیماً با encoder رشته C ساخته
+    می‌شوند؛ encoder پایتونی json با indent برای متن‌های بزرگ کندتر است.
+    بقیه مقدارها (مثل dict کوچک chunk) جداگانه با json.dumps encode می‌شوند.
+    """
+    pad = '  ' * level
+    
+    if record and all(type(key) is str for key in record):
+        inner = pad + '  '
+        items = [f'{inner}{_encode_str(key)}: {_encode_value(value, inner)}' for key, value in record.items()]
+        return f'{pad}{{\n' + ',\n'.join(items) + f'\n{pad}}}'
+    
+    # رشته‌های JSON خط جدید خام ندارند، پس تورفتگی با جایگزینی ساده اضافه می‌شود
+    text = json.dumps(record, ensure_ascii=False, indent=2)
+    return pad + text.replace('\n', '\n' + pad)
+
+def _encode_value(value: Any, pad: str) -> str:
+    if type(value) is str:
+        return _encode_str(value)
+    return json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n' + pad)
+
+def json_document_head(header: Dict[str, Any], list_key: str = "files") -> str:
+    """ابتدای سند JSON تا قبل از اولین عضو لیست (با تورفتگی 2)"""
+    if not header:
+        return f'{{\n  "{list_key}": ['
+    return json.dumps(header, ensure_ascii=False, indent=2)[:-2] + f',\n  "{list_key}": ['
+
+def json_document_tail(has_items: bool, trailer: Dict[str, Any] = None) -> str:
+    """انتهای سند JSON پس از آخرین عضو لیست؛ trailer کلیدهای بعد از لیست است"""
+    tail = '\n  ]' if has_items else ']'
+    if trailer:
+        return tail + ',' + json.dumps(trailer, ensure_ascii=False, indent=2)[1:]
+    return tail + '\n}'
+
+class JsonStreamWriter:
+    """نوشتن جریانی سند خروجی پروژه
+    
+    رکوردها همزمان با بارگذاری در یک فایل موقت نوشته می‌شوند و در پایان
+    header (که به تعداد فایل‌ها نیاز دارد) و سپس رکوردها به مقصد کپی می‌شوند.
+    خروجی دقیقاً برابر json.dumps(project_data, ensure_ascii=False, indent=2)
+    است و حافظه مصرفی فقط به بزرگ‌ترین فایل بستگی دارد.
+    
+    با export_format (یکی از قالب‌های export_formats) همین کار برای قالب‌های
+    دیگر انجام می‌شود.
+    """
+    
+    COPY_CHUNK = 1024 * 1024
+    
+    def __init__(self, list_key: str = "files", export_format=None):
+        self.list_key = list_key
+        self.export_format = export_format
+        self.count = 0
+        self._chars = 0
+        self._spool = tempfile.TemporaryFile('w+', encoding='utf-8', newline='')
+    
+    def add(self, record: Dict[str, Any]):
+        """افزودن یک رکورد به انتهای لیست"""
+        fmt = self.export_format
+        if fmt is None:
+            fragment = (',\n' if self.count else '\n') + encode_json_record(record)
+        else:
+            fragment = (fmt.separator if self.count else fmt.first_separator) + fmt.encode_record(record)
+        self._spool.write(fragment)
+        self._chars += len(fragment)
+        self.count += 1
+    
+    def finish(self, stream: TextIO, header: Dict[str, Any]) -> int:
+        """نوشتن سند کامل در stream؛ خروجی: تعداد کاراکترهای نوشته شده"""
+        fmt = self.export_format
+        if fmt is None:
+            head = json_document_head(header, self.list_key)
+            tail = json_document_tail(self.count > 0)
+        else:
+            head = fmt.head(header)
+            tail = fmt.tail(self.count > 0)
+        
+        stream.write(head)
+        self._spool.seek(0)
+        while True:
+            chunk = self._spool.read(self.COPY_CHUNK)
+            if not chunk:
+                break
+            stream.write(chunk)
+        stream.write(tail)
+        
+        return len(head) + self._chars + len(tail)
+    
+    def close(self):
+        self._spool.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
\ No newline at end of file
@@ -0,0 +1,117 @@
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+from ignore_matcher import IgnoreMatcher
+
+class ScannedFile:
+    """یک فایل پیدا شده در پیمایش پروژه
+    
+    stat فقط یک بار (و در صورت امکان از DirEntry) گرفته و نگه داشته می‌شود
+    تا بررسی اندازه، کش محتوا و خواندن فایل همگی از همان نتیجه استفاده کنند.
+    """
+    
+    __slots__ = ('path', 'abs_path', 'ignored', '_entry', '_stat')
+    
+    def __init__(self, path: str, abs_path: str, ignored: bool = False,
+                 entry: Optional[os.DirEntry] = None):
+        self.path = path              # مسیر نسبی POSIX
+        self.abs_path = abs_path      # مسیر کامل برای open
+        self.ignored = ignored        # با الگوهای نادیده‌گیری تطبیق داشته
+        self._entry = entry
+        self._stat = None
+    
+    @property
+    def name(self) -> str:
+        return self.path.rsplit('/', 1)[-1]
+    
+    def stat(self) -> os.stat_result:
+        """stat فایل (دنبال کردن symlink)؛ در صورت نبود فایل OSError"""
+        if self._stat is None:
+            if self._entry is not None:
+                self._stat = self._entry.stat()
+            else:
+                self._stat = os.stat(self.abs_path)
+        return self._stat
+
+class ProjectScanner:
+    """پیمایش پروژه با os.scandir
+    
+    ترتیب خروجی همان ترتیب os.walk است (فایل‌های هر پوشه قبل از زیرپوشه‌ها).
+    پوشه‌های نادیده گرفته شده اصلاً باز نمی‌شوند و مسیرهای نسبی فقط با
+    عملیات رشته‌ای ساخته می‌شوند (بدون شیء Path).
+    """
+    
+    def __init__(self, root: Path, matcher: IgnoreMatcher):
+        self.root = str(Path(root).resolve())
+        self.matcher = matcher
+    
+    def _abs_path(self, relative_path: str) -> str:
+        if not relative_path:
+            return self.root
+        if os.sep != '/':
+            relative_path = relative_path.replace('/', os.sep)
+        return self.root + os.sep + relative_path
+    
+    def scan(self, start: str = '') -> Iterator[ScannedFile]:
+        """پیمایش درخت پروژه (یا زیرپوشه نسبی start)"""
+        # پشته (مسیر کامل، پیشوند نسبی)
+        stack = [(self._abs_path(start), start + '/' if start else '')]
+        matcher = self.matcher
+        
+        while stack:
+            dir_path, prefix = stack.pop()
+            
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                relative_path = prefix + name
+                
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if is_dir:
+                    # مانند os.walk پیش‌فرض، وارد symlink پوشه‌ها نمی‌شویم
+                    if entry.is_symlink():
+                        continue
+                    if not matcher.matches_name(name) and not matcher.matches_path(relative_path):
+                        subdirs.append((entry.path, relative_path + '/'))
+                    continue
+                
+                ignored = matcher.matches_name(name) or matcher.matches_path(relative_path)
+                yield ScannedFile(relative_path, entry.path, ignored, entry)
+            
+            stack.extend(reversed(subdirs))
+    
+    def iter_dirs(self, start: str = '') -> Iterator[str]:
+        """مسیر نسبی تمام پوشه‌های نادیده گرفته نشده (شامل خود start)"""
+        stack = [start]
+        matcher = self.matcher
+        
+        while stack:
+            relative_dir = stack.pop()
+            yield relative_dir
+            
+            prefix = relative_dir + '/' if relative_dir else ''
+            try:
+                with os.scandir(self._abs_path(relative_dir)) as it:
+                    for entry in it:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        relative_path = prefix + entry.name
+                        if not matcher.matches_name(entry.name) and not matcher.matches_path(relative_path):
+                            stack.append(relative_path)
+            except OSError:
+                continue
+    
+    def from_paths(self, relative_paths: Iterable[str]) -> Iterator[ScannedFile]:
+        """تبدیل لیست مسیرهای نسبی (مثلاً از index گیت) به ScannedFile"""
+        for relative_path in relative_paths:
+            yield ScannedFile(relative_path, self._abs_path(relative_path), self.matcher.matches(relative_path))
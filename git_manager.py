@@ -1,261 +1,452 @@
-from git import Repo, GitCommandError
-from pathlib import Path
-from typing import Optional
-from datetime import datetime
-from config import Config
-
-class GitManager:
-    """مدیریت عملیات Git"""
-    
-    def __init__(self, project_path: str):
-        self.project_path = Path(project_path).resolve()
-        self.repo: Optional[Repo] = None
-        self.base_branch = None
-        
-    def init_or_load_repo(self) -> Repo:
-        """مقداردهی اولیه یا بارگذاری repository"""
-        try:
-            self.repo = Repo(self.project_path)
-            print(f"✅ Git repository موجود بارگذاری شد")
-            
-            # تشخیص base branch
-            self.base_branch = self._detect_base_branch()
-            print(f"📍 Base branch: {self.base_branch}")
-            
-        except:
-            print(f"📦 Git repository جدید ایجاد می‌شود...")
-            self.repo = Repo.init(self.project_path)
-            
-            # ایجاد .gitignore اگر وجود ندارد
-            gitignore_path = self.project_path / '.gitignore'
-            if not gitignore_path.exists():
-                with open(gitignore_path, 'w') as f:
-                    f.write('\n'.join(Config.IGNORE_PATTERNS))
-            
-            # ایجاد commit اولیه
-            self.repo.index.add('*')
-            try:
-                self.repo.index.commit("Initial commit")
-                print("✅ Commit اولیه ایجاد شد")
-            except:
-                pass
-            
-            # تشخیص base branch
-            self.base_branch = self._detect_base_branch()
-        
-        return self.repo
-    
-    def _detect_base_branch(self) -> str:
-        """تشخیص خودکار base branch"""
-        try:
-            # ابتدا سعی می‌کنیم branch فعلی را بگیریم
-            current = self.repo.active_branch.name
-            
-            # لیست branch‌های موجود
-            branches = [b.name for b in self.repo.heads]
-            
-            # اولویت‌ها
-            preferred_branches = ['main', 'master', 'develop', 'dev']
-            
-            # اگر یکی از branch‌های ترجیحی وجود دارد
-            for branch in preferred_branches:
-                if branch in branches:
-                    return branch
-            
-            # اگر هیچکدام نبود، از branch فعلی استفاده کن
-            if current:
-                return current
-            
-            # اگر branch‌ها وجود دارند، اولی را برگردان
-            if branches:
-                return branches[0]
-            
-            # در غیر این صورت، پیش‌فرض
-            return Config.DEFAULT_BASE_BRANCH
-            
-        except:
-            # اگر خطایی رخ داد، از تنظیمات استفاده کن
-            return Config.DEFAULT_BASE_BRANCH
-    
-    def get_current_branch(self) -> str:
-        """دریافت نام branch فعلی"""
-        try:
-            return self.repo.active_branch.name
-        except:
-            return "HEAD (detached)"
-    
-    def get_base_branch(self) -> str:
-        """دریافت base branch"""
-        if self.base_branch:
-            return self.base_branch
-        return self._detect_base_branch()
-    
-    def set_base_branch(self, branch_name: str):
-        """تنظیم دستی base branch"""
-        # بررسی وجود branch
-        branches = [b.name for b in self.repo.heads]
-        if branch_name in branches:
-            self.base_branch = branch_name
-            print(f"✅ Base branch تنظیم شد: {branch_name}")
-            return True
-        else:
-            print(f"❌ Branch '{branch_name}' یافت نشد")
-            return False
-    
-    def list_branches(self):
-        """لیست تمام branch‌ها"""
-        try:
-            return [b.name for b in self.repo.heads]
-        except:
-            return []
-    
-    def create_feature_branch(self, request_summary: str = "ai-changes") -> str:
-        """ایجاد branch جدید برای ویژگی"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_summary = "".join(c if c.isalnum() else "_" for c in request_summary[:30])
-        branch_name = f"{Config.FEATURE_BRANCH_PREFIX}/{safe_summary}_{timestamp}"
-        
-        try:
-            new_branch = self.repo.create_head(branch_name)
-            new_branch.checkout()
-            print(f"🌿 Branch جدید ایجاد شد: {branch_name}")
-            return branch_name
-        except GitCommandError as e:
-            print(f"❌ خطا در ایجاد branch: {e}")
-            raise
-    
-    def stage_all_changes(self):
-        """Stage کردن تمام تغییرات"""
-        self.repo.git.add(A=True)
-    
-    def commit_changes(self, message: str) -> bool:
-        """ایجاد commit"""
-        try:
-            if self.repo.index.diff("HEAD") or self.repo.untracked_files:
-                self.repo.index.commit(message)
-                print(f"✅ Commit ایجاد شد: {message}")
-                return True
-            else:
-                print("ℹ️  تغییری برای commit وجود ندارد")
-                return False
-        except GitCommandError as e:
-            print(f"❌ خطا در commit: {e}")
-            raise
-    
-    def get_diff(self, base_branch: str = None) -> str:
-        """دریافت diff بین branch‌ها"""
-        if base_branch is None:
-            base_branch = self.get_base_branch()
-        
-        try:
-            # بررسی وجود base branch
-            branches = [b.name for b in self.repo.heads]
-            
-            if base_branch not in branches:
-                # اگر base branch وجود نداشت، diff با HEAD
-                diff = self.repo.git.diff('HEAD')
-                return diff
-            
-            diff = self.repo.git.diff(base_branch, self.get_current_branch())
-            return diff
-        except GitCommandError:
-            # اگر خطایی رخ داد، diff ساده
-            try:
-                diff = self.repo.git.diff('HEAD')
-                return diff
-            except:
-                return ""
-    
-    def get_status(self) -> str:
-        """دریافت وضعیت فعلی repository"""
-        try:
-            status = self.repo.git.status()
-            
-            # اضافه کردن اطلاعات branch‌ها
-            branches_info = f"\nBranches موجود:\n"
-            for branch in self.repo.heads:
-                marker = "→" if branch.name == self.get_current_branch() else " "
-                branches_info += f"  {marker} {branch.name}\n"
-            
-            return status + "\n" + branches_info
-        except:
-            return "خطا در دریافت وضعیت"
-    
-    def merge_to_base(self, base_branch: str = None) -> bool:
-        """ادغام branch فعلی به base branch"""
-        if base_branch is None:
-            base_branch = self.get_base_branch()
-        
-        current_branch = self.get_current_branch()
-        
-        # بررسی وجود base branch
-        branches = [b.name for b in self.repo.heads]
-        
-        if base_branch not in branches:
-            print(f"❌ Base branch '{base_branch}' یافت نشد")
-            print(f"📋 Branch‌های موجود: {', '.join(branches)}")
-            
-            # اگر فقط یک branch وجود دارد، نیازی به merge نیست
-            if len(branches) == 1:
-                print(f"ℹ️  فقط یک branch وجود دارد. تغییرات در همین branch ذخیره می‌شوند.")
-                return True
-            
-            # سوال از کاربر برای انتخاب base branch
-            if branches:
-                base_branch = branches[0]
-                print(f"⚠️  از '{base_branch}' به عنوان base branch استفاده می‌شود")
-            else:
-                return False
-        
-        try:
-            # تغییر به base branch
-            self.repo.heads[base_branch].checkout()
-            
-            # ادغام
-            self.repo.git.merge(current_branch)
-            print(f"✅ Branch {current_branch} به {base_branch} ادغام شد")
-            
-            return True
-        except GitCommandError as e:
-            print(f"❌ خطا در merge: {e}")
-            
-            # برگشت به branch قبلی
-            try:
-                self.repo.heads[current_branch].checkout()
-            except:
-                pass
-            
-            return False
-    
-    def delete_branch(self, branch_name: str):
-        """حذف یک branch"""
-        try:
-            self.repo.delete_head(branch_name, force=True)
-            print(f"🗑️  Branch حذف شد: {branch_name}")
-        except GitCommandError as e:
-            print(f"❌ خطا در حذف branch: {e}")
-    
-    def checkout_branch(self, branch_name: str):
-        """تغییر به یک branch"""
-        try:
-            # بررسی وجود branch
-            branches = [b.name for b in self.repo.heads]
-            
-            if branch_name not in branches:
-                print(f"❌ Branch '{branch_name}' یافت نشد")
-                print(f"📋 Branch‌های موجود: {', '.join(branches)}")
-                
-                # اگر branch‌ها وجود دارند، به اولی برو
-                if branches:
-                    branch_name = branches[0]
-                    print(f"⚠️  به جای آن به '{branch_name}' تغییر می‌کنیم")
-                else:
-                    return False
-            
-            self.repo.heads[branch_name].checkout()
-            print(f"✅ تغییر به branch: {branch_name}")
-            return True
-            
-        except GitCommandError as e:
-            print(f"❌ خطا در checkout: {e}")
+import os
+import tempfile
+from git import Repo, GitCommandError
+from git.exc import BadName, BadObject
+from git.objects import Blob, Commit
+from gitdb import IStream
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, List, Tuple, Dict, Iterable, Set
+from datetime import datetime
+from config import Config
+
+class GitManager:
+    """مدیریت عملیات Git"""
+    
+    def __init__(self, project_path: str):
+        self.project_path = Path(project_path).resolve()
+        self.repo: Optional[Repo] = None
+        self.base_branch = None
+        
+    def init_or_load_repo(self) -> Repo:
+        """مقداردهی اولیه یا بارگذاری repository"""
+        try:
+            self.repo = Repo(self.project_path)
+            print(f"✅ Git repository موجود بارگذاری شد")
+            
+            # تشخیص base branch
+            self.base_branch = self._detect_base_branch()
+            print(f"📍 Base branch: {self.base_branch}")
+            
+        except:
+            print(f"📦 Git repository جدید ایجاد می‌شود...")
+            self.repo = Repo.init(self.project_path)
+            
+            # ایجاد .gitignore اگر وجود ندارد
+            gitignore_path = self.project_path / '.gitignore'
+            if not gitignore_path.exists():
+                with open(gitignore_path, 'w') as f:
+                    f.write('\n'.join(Config.IGNORE_PATTERNS))
+            
+            # ایجاد commit اولیه
+            self.repo.index.add('*')
+            try:
+                self.repo.index.commit("Initial commit")
+                print("✅ Commit اولیه ایجاد شد")
+            except:
+                pass
+            
+            # تشخیص base branch
+            self.base_branch = self._detect_base_branch()
+        
+        return self.repo
+    
+    def _detect_base_branch(self) -> str:
+        """تشخیص خودکار base branch"""
+        try:
+            # ابتدا سعی می‌کنیم branch فعلی را بگیریم
+            current = self.repo.active_branch.name
+            
+            # لیست branch‌های موجود
+            branches = [b.name for b in self.repo.heads]
+            
+            # اولویت‌ها
+            preferred_branches = ['main', 'master', 'develop', 'dev']
+            
+            # اگر یکی از branch‌های ترجیحی وجود دارد
+            for branch in preferred_branches:
+                if branch in branches:
+                    return branch
+            
+            # اگر هیچکدام نبود، از branch فعلی استفاده کن
+            if current:
+                return current
+            
+            # اگر branch‌ها وجود دارند، اولی را برگردان
+            if branches:
+                return branches[0]
+            
+            # در غیر این صورت، پیش‌فرض
+            return Config.DEFAULT_BASE_BRANCH
+            
+        except:
+            # اگر خطایی رخ داد، از تنظیمات استفاده کن
+            return Config.DEFAULT_BASE_BRANCH
+    
+    def get_current_branch(self) -> str:
+        """دریافت نام branch فعلی"""
+        try:
+            return self.repo.active_branch.name
+        except:
+            return "HEAD (detached)"
+    
+    def get_base_branch(self) -> str:
+        """دریافت base branch"""
+        if self.base_branch:
+            return self.base_branch
+        return self._detect_base_branch()
+    
+    def set_base_branch(self, branch_name: str):
+        """تنظیم دستی base branch"""
+        # بررسی وجود branch
+        branches = [b.name for b in self.repo.heads]
+        if branch_name in branches:
+            self.base_branch = branch_name
+            print(f"✅ Base branch تنظیم شد: {branch_name}")
+            return True
+        else:
+            print(f"❌ Branch '{branch_name}' یافت نشد")
+            return False
+    
+    def list_branches(self):
+        """لیست تمام branch‌ها"""
+        try:
+            return [b.name for b in self.repo.heads]
+        except:
+            return []
+    
+    def list_project_files(self) -> Optional[List[str]]:
+        """لیست فایل‌های پروژه از index گیت
+        
+        شامل فایل‌های tracked و فایل‌های untracked که ignore نشده‌اند؛
+        .gitignore، .git/info/exclude و core.excludesFile رعایت می‌شوند.
+        اگر repository در دسترس نباشد None برمی‌گرداند.
+        """
+        if self.repo is None:
+            return None
+        
+        try:
+            output = self.repo.git.ls_files('--cached', '--others', '--exclude-standard', '-z')
+        except GitCommandError as e:
+            print(f"⚠️  خطا در خواندن index گیت: {e}")
+            return None
+        
+        # فایل‌های دارای conflict چند بار در index آمده‌اند
+        return sorted({path for path in output.split('\0') if path})
+    
+    def resolve_commit(self, ref: str = "HEAD") -> str:
+        """تبدیل نام branch/tag/commit به SHA کامل"""
+        try:
+            return self.repo.commit(ref).hexsha
+        except (GitCommandError, ValueError, BadName, BadObject) as e:
+            raise ValueError(f"commit '{ref}' یافت نشد: {e}")
+    
+    def get_merge_base(self, ref: str) -> str:
+        """نقطه جدا شدن HEAD از ref (برای commitهای قبلی همان commit)"""
+        sha = self.resolve_commit(ref)
+        try:
+            return self.repo.git.merge_base(sha, 'HEAD').strip() or sha
+        except GitCommandError:
+            # تاریخچه مشترک ندارند یا HEAD هنوز commit ندارد
+            return sha
+    
+    def list_changed_files(self, ref: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """فایل‌های تغییر کرده نسبت به ref، شامل تغییرات commit نشده
+        
+        مقایسه از merge-base با ref تا working tree است (مثل «هر چه از main
+        به بعد تغییر داده‌ام») و فایل‌های untracked که ignore نشده‌اند هم
+        جزو فایل‌های اضافه شده هستند. تغییر نام به صورت حذف + اضافه می‌آید.
+        خروجی: (SHA مبنا، لیست (مسیر نسبی، added/modified/deleted))
+        """
+        base = self.get_merge_base(ref)
+        
+        try:
+            output = self.repo.git.diff('--name-status', '--no-renames', '-z', base, '--')
+            untracked = self.repo.git.ls_files('--others', '--exclude-standard', '-z')
+        except GitCommandError as e:
+            raise ValueError(f"خطا در گرفتن تغییرات نسبت به '{ref}': {e}")
+        
+        actions = {'A': 'added', 'D': 'deleted'}
+        changes = {}
+        
+        # خروجی -z به صورت وضعیت\0مسیر\0 پشت سر هم است
+        fields = output.split('\0')
+        for status, path in zip(fields[0::2], fields[1::2]):
+            if path:
+                changes[path] = actions.get(status[:1], 'modified')
+        
+        for path in untracked.split('\0'):
+            if path:
+                changes[path] = 'added'
+        
+        return base, sorted(changes.items())
+    
+    def _feature_branch_name(self, request_summary: str) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_summary = "".join(c if c.isalnum() else "_" for c in request_summary[:30])
+        return f"{Config.FEATURE_BRANCH_PREFIX}/{safe_summary}_{timestamp}"
+    
+    def create_feature_branch(self, request_summary: str = "ai-changes") -> str:
+        """ایجاد branch جدید برای ویژگی"""
+        branch_name = self._feature_branch_name(request_summary)
+        
+        try:
+            new_branch = self.repo.create_head(branch_name)
+            new_branch.checkout()
+            print(f"🌿 Branch جدید ایجاد شد: {branch_name}")
+            return branch_name
+        except GitCommandError as e:
+            print(f"❌ خطا در ایجاد branch: {e}")
+            raise
+    
+    def _normalize_eol(self) -> bool:
+        """آیا git add انتهای خط‌های CRLF را به LF تبدیل می‌کند (core.autocrlf)"""
+        try:
+            value = self.repo.config_reader().get_value('core', 'autocrlf', False)
+        except Exception:
+            return False
+        return value is True or str(value).lower() in ('true', 'input')
+    
+    def uncommitted_paths(self) -> Set[str]:
+        """مسیرهایی که در working tree یا index با HEAD فرق دارند (شامل untracked)"""
+        try:
+            output = self.repo.git.status('--porcelain', '-z', '--untracked-files=all', '--no-renames')
+        except GitCommandError as e:
+            raise ValueError(f"خطا در گرفتن وضعیت گیت: {e}")
+        # هر رکورد به صورت «XY مسیر» و جدا شده با \0 است
+        return {entry[3:] for entry in output.split('\0') if len(entry) > 3}
+    
+    def commit_files(self, writes: Dict[str, bytes], deletes: Iterable[str], message: str,
+                     request_summary: str = "ai-changes") -> Tuple[str, str]:
+        """ساخت commit مستقیم از محتوای فایل‌ها در یک feature branch جدید
+        
+        محتوای فایل‌ها به صورت blob نوشته می‌شود و tree جدید از tree فعلی HEAD
+        در یک فایل index موقت (GIT_INDEX_FILE خارج از .git) ساخته می‌شود؛
+        working tree، index اصلی و branch فعلی دست نمی‌خورند. mode اجرایی
+        فایل‌های موجود حفظ می‌شود. خروجی: (نام branch، SHA commit)
+        """
+        try:
+            parent = self.repo.head.commit
+        except ValueError:
+            # repository هنوز commit ندارد
+            parent = None
+        
+        normalize_eol = self._normalize_eol()
+        records = []
+        for path in deletes:
+            records.append(f"0 {'0' * 40}\t{path}")
+        
+        for path, data in writes.items():
+            if normalize_eol:
+                data = data.replace(b'\r\n', b'\n')
+            stream = self.repo.odb.store(IStream(Blob.type, len(data), BytesIO(data)))
+            mode = '100644'
+            if parent is not None:
+                try:
+                    if parent.tree.join(path).mode == 0o100755:
+                        mode = '100755'
+                except KeyError:
+                    pass
+            records.append(f"{mode} {stream.binsha.hex()}\t{path}")
+        
+        with tempfile.TemporaryDirectory(prefix='ide-sync-index-') as tmp:
+            env = {'GIT_INDEX_FILE': os.path.join(tmp, 'index')}
+            info_path = os.path.join(tmp, 'index-info')
+            with open(info_path, 'wb') as f:
+                f.write(''.join(record + '\0' for record in records).encode('utf-8'))
+            
+            git = self.repo.git
+            if parent is not None:
+                git.read_tree(parent.hexsha, env=env)
+            with open(info_path, 'rb') as f:
+                git.update_index('-z', '--index-info', istream=f, env=env)
+            tree = git.write_tree(env=env).strip()
+        
+        commit = Commit.create_from_tree(self.repo, tree, message,
+                                         parent_commits=[parent] if parent is not None else [], head=False)
+        
+        branch_name = self._feature_branch_name(request_summary)
+        self.repo.create_head(branch_name, commit)
+        print(f"🌿 commit {commit.hexsha[:8]} در branch جدید ساخته شد: {branch_name}")
+        return branch_name, commit.hexsha
+    
+    def get_commit_diff(self, commit: str) -> str:
+        """diff یک commit نسبت به والد آن (برای commit بدون والد: کل محتوا)"""
+        try:
+            if self.repo.commit(commit).parents:
+                return self.repo.git.diff(f"{commit}^", commit)
+            return self.repo.git.show(commit, format='')
+        except GitCommandError:
+            return ""
+    
+    def fast_forward(self, branch_name: str, base_branch: str = None) -> bool:
+        """رساندن base branch به commit یک branch (مانند merge_to_base ولی فقط fast-forward)
+        
+        مانند merge_to_base به base branch می‌رود و آن را جلو می‌برد؛ git فقط
+        فایل‌هایی را که در commit تغییر کرده‌اند بازنویسی می‌کند. اگر base
+        branch از commit جدا شده باشد یا تغییرات commit نشده با آن فایل‌ها
+        تداخل داشته باشد، چیزی تغییر نمی‌کند و به branch قبلی برمی‌گردد.
+        """
+        if base_branch is None:
+            base_branch = self.get_base_branch()
+        
+        current_branch = self.get_current_branch()
+        branches = [b.name for b in self.repo.heads]
+        
+        if base_branch not in branches:
+            print(f"⚠️  Base branch '{base_branch}' یافت نشد؛ branch فعلی ({current_branch}) به‌روز می‌شود")
+            base_branch = current_branch
+        
+        try:
+            if base_branch != current_branch:
+                self.repo.heads[base_branch].checkout()
+            self.repo.git.merge('--ff-only', branch_name)
+            print(f"✅ {base_branch} تا {branch_name} جلو برده شد (fast-forward)")
+            return True
+        except GitCommandError as e:
+            print(f"❌ fast-forward {base_branch} ممکن نشد: {e}")
+            
+            # برگشت به branch قبلی
+            if base_branch != current_branch:
+                try:
+                    self.repo.heads[current_branch].checkout()
+                except Exception:
+                    pass
+            
+            return False
+    
+    def stage_all_changes(self):
+        """Stage کردن تمام تغییرات"""
+        self.repo.git.add(A=True)
+    
+    def commit_changes(self, message: str) -> bool:
+        """ایجاد commit"""
+        try:
+            if self.repo.index.diff("HEAD") or self.repo.untracked_files:
+                self.repo.index.commit(message)
+                print(f"✅ Commit ایجاد شد: {message}")
+                return True
+            else:
+                print("ℹ️  تغییری برای commit وجود ندارد")
+                return False
+        except GitCommandError as e:
+            print(f"❌ خطا در commit: {e}")
+            raise
+    
+    def get_diff(self, base_branch: str = None) -> str:
+        """دریافت diff بین branch‌ها"""
+        if base_branch is None:
+            base_branch = self.get_base_branch()
+        
+        try:
+            # بررسی وجود base branch
+            branches = [b.name for b in self.repo.heads]
+            
+            if base_branch not in branches:
+                # اگر base branch وجود نداشت، diff با HEAD
+                diff = self.repo.git.diff('HEAD')
+                return diff
+            
+            diff = self.repo.git.diff(base_branch, self.get_current_branch())
+            return diff
+        except GitCommandError:
+            # اگر خطایی رخ داد، diff ساده
+            try:
+                diff = self.repo.git.diff('HEAD')
+                return diff
+            except:
+                return ""
+    
+    def get_status(self) -> str:
+        """دریافت وضعیت فعلی repository"""
+        try:
+            status = self.repo.git.status()
+            
+            # اضافه کردن اطلاعات branch‌ها
+            branches_info = f"\nBranches موجود:\n"
+            for branch in self.repo.heads:
+                marker = "→" if branch.name == self.get_current_branch() else " "
+                branches_info += f"  {marker} {branch.name}\n"
+            
+            return status + "\n" + branches_info
+        except:
+            return "خطا در دریافت وضعیت"
+    
+    def merge_to_base(self, base_branch: str = None) -> bool:
+        """ادغام branch فعلی به base branch"""
+        if base_branch is None:
+            base_branch = self.get_base_branch()
+        
+        current_branch = self.get_current_branch()
+        
+        # بررسی وجود base branch
+        branches = [b.name for b in self.repo.heads]
+        
+        if base_branch not in branches:
+            print(f"❌ Base branch '{base_branch}' یافت نشد")
+            print(f"📋 Branch‌های موجود: {', '.join(branches)}")
+            
+            # اگر فقط یک branch وجود دارد، نیازی به merge نیست
+            if len(branches) == 1:
+                print(f"ℹ️  فقط یک branch وجود دارد. تغییرات در همین branch ذخیره می‌شوند.")
+                return True
+            
+            # سوال از کاربر برای انتخاب base branch
+            if branches:
+                base_branch = branches[0]
+                print(f"⚠️  از '{base_branch}' به عنوان base branch استفاده می‌شود")
+            else:
+                return False
+        
+        try:
+            # تغییر به base branch
+            self.repo.heads[base_branch].checkout()
+            
+            # ادغام
+            self.repo.git.merge(current_branch)
+            print(f"✅ Branch {current_branch} به {base_branch} ادغام شد")
+            
+            return True
+        except GitCommandError as e:
+            print(f"❌ خطا در merge: {e}")
+            
+            # برگشت به branch قبلی
+            try:
+                self.repo.heads[current_branch].checkout()
+            except:
+                pass
+            
+            return False
+    
+    def delete_branch(self, branch_name: str):
+        """حذف یک branch"""
+        try:
+            self.repo.delete_head(branch_name, force=True)
+            print(f"🗑️  Branch حذف شد: {branch_name}")
+        except GitCommandError as e:
+            print(f"❌ خطا در حذف branch: {e}")
+    
+    def checkout_branch(self, branch_name: str):
+        """تغییر به یک branch"""
+        try:
+            # بررسی وجود branch
+            branches = [b.name for b in self.repo.heads]
+            
+            if branch_name not in branches:
+                print(f"❌ Branch '{branch_name}' یافت نشد")
+                print(f"📋 Branch‌های موجود: {', '.join(branches)}")
+                
+                # اگر branch‌ها وجود دارند، به اولی برو
+                if branches:
+                    branch_name = branches[0]
+                    print(f"⚠️  به جای آن به '{branch_name}' تغییر می‌کنیم")
+                else:
+                    return False
+            
+            self.repo.heads[branch_name].checkout()
+            print(f"✅ تغییر به branch: {branch_name}")
+            return True
+            
+        except GitCommandError as e:
+            print(f"❌ خطا در checkout: {e}")
             raise
\ No newline at end of file
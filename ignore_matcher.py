@@ -0,0 +1,75 @@
+import os
+import re
+import fnmatch
+from typing import Iterable, Sequence
+
+class IgnoreMatcher:
+    """تطبیق الگوهای نادیده‌گیری که فقط یک بار کامپایل می‌شود
+    
+    الگوها روی اجزای مسیر نسبی به ریشه پروژه بررسی می‌شوند:
+    - الگوی ساده (مثل node_modules) باید دقیقاً برابر نام یک جزء باشد
+    - الگوی wildcard (مثل *.pyc) با fnmatch روی هر جزء تطبیق داده می‌شود
+    - الگوی دارای / روی کل مسیر نسبی بررسی می‌شود
+    """
+    
+    _GLOB_CHARS = frozenset('*?[')
+    
+    def __init__(self, patterns: Iterable[str]):
+        # روی ویندوز fnmatch به بزرگی و کوچکی حروف حساس نیست
+        self._fold_case = os.path.normcase('A') == 'a'
+        
+        names = set()
+        name_globs = []
+        path_globs = []
+        
+        for pattern in patterns:
+            pattern = pattern.strip().replace('\\', '/').strip('/')
+            if not pattern:
+                continue
+            
+            pattern = self._normalize(pattern)
+            
+            if '/' in pattern:
+                path_globs.append(fnmatch.translate(f'*{pattern}*'))
+            elif self._GLOB_CHARS.intersection(pattern):
+                name_globs.append(fnmatch.translate(pattern))
+            else:
+                names.add(pattern)
+        
+        self.names = frozenset(names)
+        self._name_regex = re.compile('|'.join(name_globs)) if name_globs else None
+        self._path_regex = re.compile('|'.join(path_globs)) if path_globs else None
+    
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self._fold_case else text
+    
+    def matches_name(self, name: str) -> bool:
+        """بررسی یک جزء مسیر (نام فایل یا پوشه)"""
+        name = self._normalize(name)
+        
+        if name in self.names:
+            return True
+        
+        return self._name_regex is not None and self._name_regex.match(name) is not None
+    
+    def matches_path(self, relative_path: str) -> bool:
+        """بررسی فقط الگوهای دارای / روی کل مسیر نسبی POSIX"""
+        if self._path_regex is None:
+            return False
+        
+        return self._path_regex.match(self._normalize(relative_path)) is not None
+    
+    def matches_parts(self, parts: Sequence[str]) -> bool:
+        """بررسی مسیر نسبی که به صورت لیست اجزا داده شده"""
+        for part in parts:
+            if self.matches_name(part):
+                return True
+        
+        if self._path_regex is not None:
+            return self.matches_path('/'.join(parts))
+        
+        return False
+    
+    def matches(self, relative_path: str) -> bool:
+        """بررسی مسیر نسبی POSIX (مثل src/app/main.py)"""
+        return self.matches_parts([p for p in relative_path.split('/') if p])
\ No newline at end of file
@@ -0,0 +1,255 @@
+import ast
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from snapshot_store import content_hash
+
+# با تغییر شکل outline، کش قبلی نامعتبر می‌شود
+OUTLINE_VERSION = 1
+
+# حداکثر طول هر خط outline (امضاهای خیلی طولانی کوتاه می‌شوند)
+_MAX_LINE = 200
+
+_PYTHON_EXTENSIONS = {'.py', '.pyi', '.pyw'}
+_MARKDOWN_EXTENSIONS = {'.md', '.markdown'}
+
+# تعریف‌ها در زبان‌های رایج (JS/TS، Java، C#، Go، Rust، C/C++، PHP، Ruby، Swift، Kotlin ...)
+_GENERIC_DEFINITION = re.compile(
+    r'^[ \t]*(?:(?:export|default|public|private|protected|internal|static|abstract|final|sealed|'
+    r'partial|async|pub(?:\([^)\n]*\))?|override|virtual|inline|extern|unsafe|open|data)[ \t]+)*'
+    r'(?:class|interface|struct|enum|trait|impl|type|fn|func|function|def|module|namespace|'
+    r'object|record|protocol|extension|union)\b(?![.,;:!?)])[^\n]*'
+    # متدهای دارای سطح دسترسی
+    r'|^[ \t]*(?:public|private|protected|internal)\b[^;=\n]*\([^\n]*'
+    # const f = (...) => و const f = async x =>
+    r'|^[ \t]*(?:export[ \t]+)?(?:const|let|var)[ \t]+\w+[ \t]*=[ \t]*(?:async[ \t]*)?'
+    r'(?:\([^)\n]*\)|\w+)[ \t]*=>[^\n]*'
+    # تعریف و prototype توابع سطح بالای C/C++
+    r'|^[A-Za-z_][\w \t\*&:<>,]*[ \t\*&]\**[A-Za-z_][\w:~]*[ \t]*\([^;\n]*\)[ \t]*(?:const[ \t]*)?[{;]?[ \t]*$',
+    re.MULTILINE)
+
+_MARKDOWN_HEADING = re.compile(r'^#{1,6}[ \t]+\S[^\n]*', re.MULTILINE)
+
+_C_KEYWORDS = ('if', 'else', 'for', 'while', 'switch', 'return', 'do', 'case')
+
+def _clip(line: str) -> str:
+    line = line.rstrip()
+    if len(line) > _MAX_LINE:
+        line = line[:_MAX_LINE] + " …"
+    return line
+
+def _outline_generic(text: str, pattern) -> str:
+    lines = []
+    for match in pattern.finditer(text):
+        line = match.group(0).rstrip()
+        first_word = re.match(r'\s*(\w*)', line).group(1)
+        if first_word in _C_KEYWORDS:
+            continue
+        if line.endswith('{'):
+            line = line[:-1].rstrip()
+        lines.append(_clip(line))
+    return '\n'.join(lines)
+
+class _PythonOutliner:
+    """outline فایل Python با ast: importها، ثابت‌ها، کلاس‌ها و امضای توابع
+    
+    خطوط امضا عیناً از فایل برداشته می‌شوند (با decoratorها و تورفتگی)؛
+    از docstring فقط پاراگراف اول و به جای بدنه «...» می‌آید.
+    """
+    
+    def __init__(self, source: str):
+        self.source = source
+        # شماره خطوط ast فقط \n و \r را می‌شمارد (splitlines روی \f و ... هم می‌شکند)
+        self.lines = re.split(r'\r\n|\r|\n', source)
+        self.output: List[str] = []
+    
+    def run(self) -> str:
+        tree = ast.parse(self.source)
+        self._docstring(tree.body, "")
+        for node in tree.body:
+            self._node(node)
+        return '\n'.join(self.output)
+    
+    def _segment(self, node: ast.AST) -> List[str]:
+        return self.lines[node.lineno - 1:node.end_lineno]
+    
+    def _docstring(self, body: List[ast.stmt], indent: str) -> bool:
+        if not (body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)):
+            return False
+        
+        summary = re.split(r'\n[ \t]*\n', body[0].value.value.strip(), 1)[0].strip()
+        if '"""' in summary or summary.endswith(('\\', '"')):
+            summary = summary.replace('\\', '\\\\').replace('"', '\\"')
+        summary = ('\n' + indent).join(line.strip() for line in summary.splitlines())
+        self.output.append(f'{indent}"""{summary}"""')
+        return True
+    
+    def _node(self, node: ast.stmt):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            self.output.extend(_clip(line) for line in self._segment(node))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            self._assignment(node)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            self._definition(node)
+    
+    def _assignment(self, node):
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        if not all(isinstance(target, ast.Name) for target in targets):
+            return
+        
+        segment = self._segment(node)
+        if len(segment) == 1:
+            self.output.append(_clip(segment[0]))
+            return
+        
+        # مقدارهای چند خطی (مثل dictهای بزرگ) حذف می‌شوند
+        first = segment[0]
+        indent = first[:len(first) - len(first.lstrip())]
+        if isinstance(node, ast.AnnAssign):
+            annotation = ast.get_source_segment(self.source, node.annotation) or "..."
+            self.output.append(_clip(f"{indent}{node.target.id}: {annotation} = ..."))
+        else:
+            names = " = ".join(target.id for target in targets)
+            self.output.append(f"{indent}{names} = ...")
+    
+    def _definition(self, node):
+        start = min([decorator.lineno for decorator in node.decorator_list] + [node.lineno])
+        first_body = node.body[0]
+        body_start = min([decorator.lineno for decorator in getattr(first_body, 'decorator_list', [])]
+                         + [first_body.lineno])
+        header = self.lines[start - 1:body_start]
+        indent = self.lines[node.lineno - 1][:node.col_offset]
+        
+        # پایان header خطی است که بدنه از آن شروع می‌شود یا خط قبل از آن
+        last = header[-1]
+        if last[:first_body.col_offset].strip():
+            # بدنه در همان خط header (مثل def f(): return 1)
+            header[-1] = last[:first_body.col_offset].rstrip()
+            body_indent = indent + "    "
+        else:
+            header.pop()
+            while header and (not header[-1].strip() or header[-1].lstrip().startswith('#')):
+                header.pop()
+            body_indent = self.lines[body_start - 1][:first_body.col_offset]
+        
+        self.output.extend(_clip(line) for line in header)
+        has_doc = self._docstring(node.body, body_indent)
+        
+        if isinstance(node, ast.ClassDef):
+            before = len(self.output)
+            for child in node.body[1 if has_doc else 0:]:
+                self._node(child)
+            if len(self.output) > before or has_doc:
+                return
+        
+        if not has_doc:
+            self.output.append(f"{body_indent}...")
+
+def outline_python(source: str) -> Optional[str]:
+    """outline کد Python؛ None اگر فایل قابل parse نباشد"""
+    try:
+        return _PythonOutliner(source).run()
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+
+def outline_kind(path: str) -> str:
+    """نوع outline بر اساس پسوند فایل: python، markdown یا generic"""
+    extension = Path(path).suffix.lower()
+    if extension in _PYTHON_EXTENSIONS:
+        return "python"
+    if extension in _MARKDOWN_EXTENSIONS:
+        return "markdown"
+    return "generic"
+
+def make_outline(path: str, content: str) -> str:
+    """outline یک فایل: فقط تعریف‌ها و امضاها، بدون بدنه
+    
+    برای Python از ast و برای بقیه زبان‌ها (یا Python نامعتبر) از regex
+    استفاده می‌شود. در Markdown عنوان‌ها نگه داشته می‌شوند.
+    """
+    kind = outline_kind(path)
+    if kind == "python":
+        outline = outline_python(content)
+        if outline is not None:
+            return outline
+    if kind == "markdown":
+        return _outline_generic(content, _MARKDOWN_HEADING)
+    return _outline_generic(content, _GENERIC_DEFINITION)
+
+class OutlineCache:
+    """کش outlineها بر اساس hash محتوا
+    
+    مانند کش token در پوشه state پروژه ذخیره می‌شود؛ کلید شامل نوع
+    outline است چون یک محتوا با پسوندهای مختلف outline متفاوتی دارد.
+    """
+    
+    MAX_ENTRIES = 50000
+    
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._cache: Optional[Dict[str, str]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def _load(self) -> Dict[str, str]:
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path is not None and self.cache_path.exists():
+                try:
+                    with open(self.cache_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if data.get("version") == OUTLINE_VERSION:
+                        self._cache = data.get("entries", {})
+                except (OSError, ValueError, AttributeError):
+                    self._cache = {}
+        return self._cache
+    
+    def get(self, path: str, content: str) -> str:
+        """outline فایل (از کش یا ساخته شده)"""
+        key = f"{outline_kind(path)}:{content_hash(content)}"
+        with self._lock:
+            cache = self._load()
+            outline = cache.get(key)
+        if outline is not None:
+            return outline
+        
+        outline = make_outline(path, content)
+        with self._lock:
+            self._cache[key] = outline
+            self._dirty = True
+        return outline
+    
+    def save(self):
+        """ذخیره کش (قدیمی‌ترین رکوردها بیش از سقف حذف می‌شوند)"""
+        with self._lock:
+            if not self._dirty or self.cache_path is None:
+                return
+            
+            cache = self._cache
+            if len(cache) > self.MAX_ENTRIES:
+                keys = list(cache)[-self.MAX_ENTRIES:]
+                cache = self._cache = {key: cache[key] for key in keys}
+            
+            try:
+                with open(self.cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({"version": OUTLINE_VERSION, "entries": cache}, f,
+                              ensure_ascii=False, separators=(',', ':'))
+                self._dirty = False
+            except OSError as e:
+                print(f"⚠️  ذخیره کش outline ناموفق بود: {e}")
+
+def outline_record(file_obj: Dict[str, Any], cache: OutlineCache = None) -> Dict[str, Any]:
+    """رکورد فقط خواندنی outline به جای رکورد کامل یک فایل"""
+    path = file_obj["path"]
+    content = file_obj["content"]
+    outline = cache.get(path, content) if cache is not None else make_outline(path, content)
+    return {
+        "path": path,
+        "outline": True,
+        "read_only": True,
+        "lines": content.count('\n') + (0 if content.endswith('\n') or not content else 1),
+        "content": outline
+    }
\ No newline at end of file
@@ -0,0 +1,377 @@
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from config import Config
+from export_formats import ExportFormat, FORMAT_JSON, get_format
+from snapshot_store import content_hash
+from token_estimator import TokenEstimator, estimate_tokens
+
+UNIT_CHARS = "chars"
+UNIT_TOKENS = "tokens"
+
+# بزرگ‌ترین عدد index/count که برای اندازه‌گیری رکورد chunk فرض می‌شود
+_MAX_CHUNKS = 999999
+
+# کمترین فضای محتوا در هر chunk؛ کمتر از این فایل تکه نمی‌شود
+_MIN_CHUNK_SIZE = 64
+
+def frame_parts(parts: List[str]) -> List[str]:
+    """افزودن تگ‌های ---START PART i/n--- و ---END PART i/n---"""
+    total = len(parts)
+    return [f"---START PART {i}/{total}---\n{part}\n---END PART {i}/{total}---"
+            for i, part in enumerate(parts, 1)]
+
+def join_chunks(files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """سرهم کردن chunkهای فایل‌های بزرگ و بررسی hash محتوای نهایی
+    
+    رکورد کامل در جای اولین chunk قرار می‌گیرد. chunk ناقص، تکراری یا
+    hash نادرست باعث ValueError می‌شود.
+    """
+    if not any(isinstance(file_obj, dict) and "chunk" in file_obj for file_obj in files):
+        return files
+    
+    result: List[Dict[str, Any]] = []
+    pending: Dict[Tuple[str, str], Tuple[int, Dict[str, Any], Dict[int, str]]] = {}
+    
+    for file_obj in files:
+        meta = file_obj.get("chunk") if isinstance(file_obj, dict) else None
+        if not isinstance(meta, dict):
+            result.append(file_obj)
+            continue
+        
+        path = file_obj.get("path")
+        try:
+            index, count, expected = int(meta["index"]), int(meta["count"]), str(meta["hash"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"اطلاعات chunk فایل {path} نادرست است")
+        
+        key = (path, expected)
+        if key not in pending:
+            record = {k: v for k, v in file_obj.items() if k != "chunk"}
+            pending[key] = (count, record, {})
+            result.append(record)
+        
+        pieces = pending[key][2]
+        if not 1 <= index <= count or index in pieces:
+            raise ValueError(f"chunk شماره {index} فایل {path} نامعتبر یا تکراری است")
+        pieces[index] = file_obj.get("content") or ""
+    
+    for (path, expected), (count, record, pieces) in pending.items():
+        missing = [str(i) for i in range(1, count + 1) if i not in pieces]
+        if missing:
+            raise ValueError(f"chunkهای {', '.join(missing)} از {count} فایل {path} یافت نشد")
+        
+        content = ''.join(pieces[i] for i in range(1, count + 1))
+        if content_hash(content) != expected:
+            raise ValueError(f"hash فایل {path} پس از سرهم کردن chunkها مطابقت ندارد")
+        record["content"] = content
+    
+    return result
+
+class _Item:
+    """یک رکورد encode شده به همراه اندازه‌اش"""
+    
+    __slots__ = ('index', 'chunk', 'record', 'fragment', 'chars', 'tokens', 'directory')
+    
+    def __init__(self, index: int, record: Dict[str, Any], export_format: ExportFormat, chunk: int = 0):
+        self.index = index
+        self.chunk = chunk
+        self.record = record
+        self.fragment = export_format.encode_record(record)
+        self.chars = len(self.fragment)
+        self.tokens = 0
+        path = record.get("path") or ""
+        self.directory = path.rsplit('/', 1)[0] if '/' in path else ""
+    
+    def size(self, unit: str) -> int:
+        return self.tokens if unit == UNIT_TOKENS else self.chars
+    
+    @property
+    def order(self) -> Tuple[int, int]:
+        return (self.index, self.chunk)
+
+def _measure(text: str, unit: str) -> int:
+    return estimate_tokens(text) if unit == UNIT_TOKENS else len(text)
+
+def _cut_content(content: str, budget: int, unit: str, encode: Callable[[str], str]) -> List[str]:
+    """بریدن محتوا به تکه‌هایی که شکل encode شده هر کدام حداکثر budget باشد
+    
+    هر کاراکتر حداقل یک کاراکتر خروجی دارد، پس تکه با کوتاه کردن انتهای
+    آن (به اندازه مقدار اضافه یا به نسبت آن) به سرعت در بودجه جا می‌شود.
+    در صورت امکان برش روی انتهای خط است.
+    """
+    pieces = []
+    position = 0
+    length = len(content)
+    
+    while position < length:
+        end = min(position + budget, length)
+        while True:
+            cost = _measure(encode(content[position:end]), unit)
+            if cost <= budget:
+                break
+            current = end - position
+            fit = current - (cost - budget)
+            if unit == UNIT_TOKENS or fit < 1:
+                fit = max(1, current * budget // cost - 1)
+            end = position + fit
+        
+        if end < length:
+            newline = content.rfind('\n', position, end)
+            if newline >= position + (end - position) // 2:
+                end = newline + 1
+        
+        pieces.append(content[position:end])
+        position = end
+    
+    return pieces
+
+class PlannedPart:
+    """یک بخش برنامه‌ریزی شده: رکوردها به ترتیب اصلی و اندازه کل"""
+    
+    __slots__ = ('items', 'size', 'oversized')
+    
+    def __init__(self, items: List[_Item], size: int, oversized: bool = False):
+        self.items = sorted(items, key=lambda item: item.order)
+        self.size = size
+        self.oversized = oversized
+
+class PartPlanner:
+    """تقسیم رکوردهای فایل به بخش‌ها با سقف کاراکتر یا token
+    
+    هر رکورد دقیقاً یک بار (با قالب خروجی export_format، پیش‌فرض JSON با
+    indent=2) encode و اندازه‌گیری می‌شود؛ پس از آن برنامه‌ریزی برای هر سقف
+    دلخواه فقط روی اعداد کار می‌کند و متن بخش‌ها با join قطعه‌ها ساخته
+    می‌شود. هر بخش یک سند کامل همان قالب است (برای JSON برابر
+    json.dumps(header + files, ensure_ascii=False, indent=2)).
+    
+    فایلی که به تنهایی از سقف بزرگ‌تر است به chunkهای پشت سر هم در بخش‌های
+    متوالی شکسته می‌شود؛ هر chunk کلید "chunk" با index (از 1)، count و hash
+    کل محتوا دارد تا هنگام ترکیب بخش‌ها دوباره سرهم و بررسی شود.
+    
+    حالت‌های چیدن:
+        ordered: پر کردن ترتیبی بخش‌ها به ترتیب مسیرها
+        ffd: first-fit-decreasing (با انتخاب تنگ‌ترین بخش) روی گروه فایل‌های
+             هر پوشه، تا تعداد بخش‌ها کمتر و پوشه‌ها تا حد امکان یکجا باشند
+    """
+    
+    def __init__(self, header: Dict[str, Any], records: Iterable[Dict[str, Any]],
+                 estimator: TokenEstimator = None, export_format: ExportFormat = None,
+                 hashes: Dict[str, str] = None):
+        self.header = header
+        # hash محتوای هر مسیر که serializer هنگام ساخت خروجی حساب کرده (کلید کش token)
+        self.hashes = hashes or {}
+        self.estimator = estimator or TokenEstimator()
+        self.export_format = export_format or get_format(FORMAT_JSON)
+        self._head = self.export_format.head(header)
+        self._tail = self.export_format.tail(True)
+        self.items = [_Item(index, record, self.export_format) for index, record in enumerate(records)]
+        self._tokens_ready = False
+        self._chunks: Dict[Tuple[int, str, int], List[_Item]] = {}
+    
+    @property
+    def total_chars(self) -> int:
+        return sum(item.chars for item in self.items)
+    
+    def _ensure_tokens(self):
+        """تخمین token همه رکوردها (فقط یک بار)
+        
+        فقط محتوایی که hash آن از serializer رسیده کش می‌شود؛ محتوای بدون
+        hash (مثلاً متن paste شده) مستقیم تخمین زده می‌شود و دوباره hash نمی‌شود.
+        """
+        if self._tokens_ready:
+            return
+        
+        estimator = self.estimator
+        fmt = self.export_format
+        empty_tokens = estimate_tokens(fmt.encode_content(""))
+        for item in self.items:
+            record = item.record
+            content = record.get("content")
+            if isinstance(content, str):
+                # محتوا به همان شکلی که در قالب می‌آید تخمین زده می‌شود؛
+                # بقیه رکورد (کلیدها، مسیر و تورفتگی) جداگانه شمرده می‌شود
+                key = self.hashes.get(record.get("path"))
+                if key is not None and fmt.content_encoding != "json":
+                    key = f"{fmt.content_encoding}:{key}"
+                skeleton = fmt.encode_record(dict(record, content=""))
+                item.tokens = (estimator.estimate(fmt.encode_content(content), key) +
+                               estimate_tokens(skeleton) - empty_tokens)
+            else:
+                item.tokens = estimate_tokens(item.fragment)
+        
+        estimator.save()
+        self._tokens_ready = True
+    
+    def _base_size(self, unit: str) -> int:
+        """اندازه بخش خالی: header، جداکننده قبل از اولین رکورد و انتهای سند"""
+        return _measure(self._head + self.export_format.first_separator + self._tail, unit)
+    
+    def plan(self, limit: int, unit: str = UNIT_CHARS, packing: str = None) -> List[PlannedPart]:
+        """برنامه‌ریزی بخش‌ها بدون ساختن متن آن‌ها"""
+        if unit == UNIT_TOKENS:
+            self._ensure_tokens()
+        
+        packing = packing or Config.PART_PACKING
+        base = self._base_size(unit)
+        separator = _measure(self.export_format.separator, unit)
+        capacity = limit - base
+        
+        parts: List[PlannedPart] = []
+        regular: List[_Item] = []
+        for item in self.items:
+            if item.size(unit) <= capacity:
+                regular.append(item)
+                continue
+            
+            # رکوردی که به تنهایی در یک بخش جا نمی‌شود: هر chunk یک بخش
+            chunks = self._split_item(item, unit, capacity)
+            if chunks:
+                parts.extend(PlannedPart([chunk], base + chunk.size(unit)) for chunk in chunks)
+            else:
+                parts.append(PlannedPart([item], base + item.size(unit), oversized=True))
+        
+        if packing == "ordered":
+            bins = self._pack_ordered(regular, unit, capacity, separator)
+        else:
+            bins = self._pack_decreasing(regular, unit, capacity, separator)
+        
+        parts.extend(PlannedPart(items, base + used) for items, used in bins)
+        parts.sort(key=lambda part: part.items[0].order)
+        return parts
+    
+    def _split_item(self, item: _Item, unit: str, capacity: int) -> List[_Item]:
+        """شکستن رکورد بزرگ به chunkهایی که هر کدام در یک بخش جا شوند
+        
+        اگر محتوا متنی نباشد یا جای کافی برای محتوا نماند لیست خالی برمی‌گرداند.
+        """
+        key = (item.index, unit, capacity)
+        if key in self._chunks:
+            return self._chunks[key]
+        
+        record = item.record
+        content = record.get("content")
+        chunks: List[_Item] = []
+        if isinstance(content, str) and content:
+            meta = {"index": _MAX_CHUNKS, "count": _MAX_CHUNKS, "hash": content_hash(content)}
+            encode = self.export_format.encode_content
+            skeleton = self.export_format.encode_record(self._chunk_record(record, "", meta))
+            budget = capacity - _measure(skeleton, unit) + _measure(encode(""), unit)
+            
+            if budget >= _MIN_CHUNK_SIZE:
+                pieces = _cut_content(content, budget, unit, encode)
+                for number, piece in enumerate(pieces, 1):
+                    meta = {"index": number, "count": len(pieces), "hash": meta["hash"]}
+                    chunk = _Item(item.index, self._chunk_record(record, piece, meta),
+                                  self.export_format, number)
+                    if unit == UNIT_TOKENS:
+                        chunk.tokens = estimate_tokens(chunk.fragment)
+                    chunks.append(chunk)
+        
+        self._chunks[key] = chunks
+        return chunks
+    
+    @staticmethod
+    def _chunk_record(record: Dict[str, Any], piece: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """رکورد یک chunk: کلید chunk درست قبل از content قرار می‌گیرد"""
+        result = {}
+        for key, value in record.items():
+            if key == "content":
+                result["chunk"] = meta
+                value = piece
+            result[key] = value
+        return result
+    
+    @staticmethod
+    def _pack_ordered(items: List[_Item], unit: str, capacity: int,
+                      separator: int) -> List[Tuple[List[_Item], int]]:
+        bins = []
+        current: List[_Item] = []
+        used = 0
+        
+        for item in items:
+            cost = item.size(unit) + (separator if current else 0)
+            if current and used + cost > capacity:
+                bins.append((current, used))
+                current, used = [], 0
+                cost = item.size(unit)
+            current.append(item)
+            used += cost
+        
+        if current:
+            bins.append((current, used))
+        return bins
+    
+    @staticmethod
+    def _group_by_directory(items: List[_Item], unit: str, capacity: int,
+                            separator: int) -> List[Tuple[int, List[_Item]]]:
+        """گروه‌بندی فایل‌های هر پوشه؛ گروه بزرگ‌تر از یک بخش به تکه‌های پیوسته شکسته می‌شود
+        
+        اندازه هر گروه شامل یک جداکننده به ازای هر رکورد است.
+        """
+        directories: Dict[str, List[_Item]] = {}
+        for item in items:
+            directories.setdefault(item.directory, []).append(item)
+        
+        groups = []
+        limit = capacity + separator
+        for members in directories.values():
+            current: List[_Item] = []
+            used = 0
+            for item in members:
+                cost = item.size(unit) + separator
+                if current and used + cost > limit:
+                    groups.append((used, current))
+                    current, used = [], 0
+                current.append(item)
+                used += cost
+            if current:
+                groups.append((used, current))
+        
+        return groups
+    
+    @classmethod
+    def _pack_decreasing(cls, items: List[_Item], unit: str, capacity: int,
+                         separator: int) -> List[Tuple[List[_Item], int]]:
+        groups = cls._group_by_directory(items, unit, capacity, separator)
+        groups.sort(key=lambda group: (-group[0], group[1][0].order))
+        
+        # اولین رکورد هر بخش جداکننده ندارد، پس ظرفیت به اندازه یک جداکننده بیشتر است
+        limit = capacity + separator
+        bins: List[List[_Item]] = []
+        used: List[int] = []
+        free: List[Tuple[int, int]] = []  # (فضای خالی، شماره بخش) مرتب شده
+        
+        for size, members in groups:
+            position = bisect_left(free, (size, -1))
+            if position < len(free):
+                remaining, bin_id = free.pop(position)
+                bins[bin_id].extend(members)
+                used[bin_id] += size
+                insort(free, (remaining - size, bin_id))
+            else:
+                bin_id = len(bins)
+                bins.append(list(members))
+                used.append(size)
+                insort(free, (limit - size, bin_id))
+        
+        return [(members, total - separator) for members, total in zip(bins, used)]
+    
+    def count_parts(self, limit: int, unit: str = UNIT_CHARS, packing: str = None) -> int:
+        """تعداد بخش‌های لازم برای یک سقف (بدون ساختن متن)"""
+        return len(self.plan(limit, unit, packing))
+    
+    def render(self, part: PlannedPart) -> str:
+        trailer = None
+        if part.oversized:
+            trailer = {"warning": f"فایل {part.items[0].record.get('path')} بسیار بزرگ است"}
+        fmt = self.export_format
+        return (self._head + fmt.first_separator + fmt.separator.join(item.fragment for item in part.items) +
+                fmt.tail(True, trailer))
+    
+    def split(self, limit: int, unit: str = UNIT_CHARS, packing: str = None) -> List[str]:
+        """بخش‌های نهایی با تگ PART (یا سند واحد اگر همه در یک بخش جا شوند)"""
+        planned = self.plan(limit, unit, packing)
+        parts = [self.render(part) for part in planned]
+        if len(planned) == 1 and not planned[0].oversized:
+            return parts
+        return frame_parts(parts)
\ No newline at end of file
@@ -0,0 +1,337 @@
+import re
+from typing import Dict, List, Optional, Tuple
+from config import Config
+
+HUNK_APPLIED = "applied"
+HUNK_ALREADY = "already"
+HUNK_REJECTED = "rejected"
+
+# @@ -start[,count] +start[,count] @@ متن اختیاری
+_HUNK_HEADER = re.compile(r'^@@+ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@+')
+
+class Hunk:
+    """یک hunk از unified diff
+    
+    lines لیست (علامت، متن) است؛ علامت ' ' برای context، '-' حذف و '+'
+    اضافه. متن‌ها بدون انتهای خط نگه داشته می‌شوند.
+    """
+    
+    __slots__ = ('index', 'old_start', 'new_start', 'lines', 'old_no_eol', 'new_no_eol')
+    
+    def __init__(self, index: int, old_start: int, new_start: int):
+        self.index = index
+        self.old_start = old_start
+        self.new_start = new_start
+        self.lines: List[Tuple[str, str]] = []
+        self.old_no_eol = False  # آخرین خط سمت قدیم بدون newline است
+        self.new_no_eol = False  # آخرین خط سمت جدید بدون newline است
+    
+    @property
+    def old_lines(self) -> List[str]:
+        return [text for sign, text in self.lines if sign != '+']
+    
+    @property
+    def new_lines(self) -> List[str]:
+        return [text for sign, text in self.lines if sign != '-']
+    
+    def trimmed(self, fuzz: int) -> Tuple[int, List[Tuple[str, str]]]:
+        """حذف حداکثر fuzz خط context از ابتدا و انتهای hunk
+        
+        خروجی: (تعداد خطوط حذف شده از ابتدا، خطوط باقی‌مانده)
+        """
+        lines = self.lines
+        lead = 0
+        while lead < fuzz and lead < len(lines) and lines[lead][0] == ' ':
+            lead += 1
+        trail = 0
+        while trail < fuzz and trail < len(lines) - lead and lines[-1 - trail][0] == ' ':
+            trail += 1
+        return lead, lines[lead:len(lines) - trail]
+
+class HunkResult:
+    """نتیجه اعمال یک hunk"""
+    
+    __slots__ = ('index', 'status', 'line', 'offset', 'fuzz', 'reason')
+    
+    def __init__(self, index: int, status: str, line: int = 0, offset: int = 0,
+                 fuzz: int = 0, reason: str = ""):
+        self.index = index
+        self.status = status
+        self.line = line      # شماره خط (از 1) محل اعمال در فایل اصلی
+        self.offset = offset  # فاصله از شماره خط اعلام شده در header
+        self.fuzz = fuzz      # تعداد خطوط context نادیده گرفته شده
+        self.reason = reason
+    
+    def describe(self) -> str:
+        if self.status == HUNK_REJECTED:
+            return f"hunk {self.index} رد شد: {self.reason}"
+        if self.status == HUNK_ALREADY:
+            return f"hunk {self.index} قبلاً اعمال شده است (خط {self.line})"
+        
+        notes = []
+        if self.offset:
+            notes.append(f"offset {self.offset:+d}")
+        if self.fuzz:
+            notes.append(f"fuzz {self.fuzz}")
+        detail = f" ({', '.join(notes)})" if notes else ""
+        return f"hunk {self.index} در خط {self.line} اعمال شد{detail}"
+
+class PatchResult:
+    """خروجی apply_patch: متن نهایی و نتیجه هر hunk"""
+    
+    __slots__ = ('content', 'hunks', 'changed')
+    
+    def __init__(self, content: str, hunks: List[HunkResult], changed: bool):
+        self.content = content
+        self.hunks = hunks
+        self.changed = changed
+    
+    @property
+    def rejected(self) -> List[HunkResult]:
+        return [hunk for hunk in self.hunks if hunk.status == HUNK_REJECTED]
+    
+    @property
+    def ok(self) -> bool:
+        return not self.rejected
+
+def parse_hunks(diff_text: str) -> List[Hunk]:
+    """parse hunkهای یک unified diff
+    
+    خطوط قبل از اولین @@ (مثل ---/+++ یا diff --git) نادیده گرفته
+    می‌شوند. شمارش خطوط header الزامی نیست چون پاسخ AI اغلب آن را اشتباه
+    می‌نویسد؛ خط کاملاً خالی داخل hunk یک خط context خالی است.
+    """
+    hunks: List[Hunk] = []
+    hunk: Optional[Hunk] = None
+    counts = (0, 0)
+    lines = diff_text.split('\n')
+    if lines and not lines[-1]:
+        # newline انتهای متن diff خط خالی context نیست
+        lines.pop()
+    
+    for number, line in enumerate(lines):
+        line = line.rstrip('\r')
+        match = _HUNK_HEADER.match(line)
+        if match:
+            _close_hunk(hunk, counts)
+            hunk = Hunk(len(hunks) + 1, int(match.group(1)), int(match.group(3)))
+            hunks.append(hunk)
+            old_count = match.group(2)
+            new_count = match.group(4)
+            counts = (1 if old_count is None else int(old_count),
+                      1 if new_count is None else int(new_count))
+            continue
+        
+        if hunk is None:
+            continue
+        
+        if line.startswith('diff ') or (line.startswith('--- ') and number + 1 < len(lines)
+                                        and lines[number + 1].startswith('+++ ')):
+            # شروع diff فایل بعدی
+            _close_hunk(hunk, counts)
+            hunk = None
+        elif line.startswith('\\'):
+            # "\ No newline at end of file" مربوط به خط قبلی است
+            if hunk.lines:
+                sign = hunk.lines[-1][0]
+                if sign != '+':
+                    hunk.old_no_eol = True
+                if sign != '-':
+                    hunk.new_no_eol = True
+        elif line == '':
+            hunk.lines.append((' ', ''))
+        elif line[0] in ' -+':
+            hunk.lines.append((line[0], line[1:]))
+        else:
+            raise ValueError(f"خط نامعتبر در hunk {hunk.index}: {line[:60]}")
+    
+    _close_hunk(hunk, counts)
+    
+    if not hunks:
+        raise ValueError("هیچ hunk معتبری (@@ -a,b +c,d @@) در diff یافت نشد")
+    return hunks
+
+def _close_hunk(hunk: Optional[Hunk], counts: Tuple[int, int]):
+    """حذف خطوط خالی انتهایی که جزء hunk نیستند (مثل خط خالی بین hunkها)"""
+    if hunk is None:
+        return
+    
+    old_count, new_count = counts
+    while hunk.lines and hunk.lines[-1] == (' ', ''):
+        if len(hunk.old_lines) <= old_count and len(hunk.new_lines) <= new_count:
+            break
+        hunk.lines.pop()
+    
+    if not any(sign != ' ' for sign, _ in hunk.lines):
+        raise ValueError(f"hunk {hunk.index} هیچ خط حذف یا اضافه‌ای ندارد")
+
+def _split_lines(content: str) -> List[Tuple[str, str]]:
+    """تقسیم متن به (متن خط، انتهای خط) تا انتهای خط‌های هر خط حفظ شود"""
+    if not content:
+        return []
+    
+    pieces = content.split('\n')
+    last = pieces.pop()
+    lines = [(piece[:-1], '\r\n') if piece.endswith('\r') else (piece, '\n') for piece in pieces]
+    if last:
+        lines.append((last, ''))
+    return lines
+
+class _Matcher:
+    """جستجوی محل یک دنباله خط در فایل با index خط اول
+    
+    index فقط یک بار برای فایل اصلی ساخته می‌شود؛ مقایسه آزاد فاصله‌های
+    انتهای خط را نادیده می‌گیرد.
+    """
+    
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self._loose = [text.rstrip() for text in texts]
+        self._index: Dict[bool, Dict[str, List[int]]] = {}
+    
+    def _positions(self, first: str, loose: bool) -> List[int]:
+        index = self._index.get(loose)
+        if index is None:
+            index = self._index[loose] = {}
+            for position, text in enumerate(self._loose if loose else self.texts):
+                index.setdefault(text, []).append(position)
+        return index.get(first.rstrip() if loose else first, [])
+    
+    def find(self, needle: List[str], expected: int, low: int) -> Optional[int]:
+        """نزدیک‌ترین محل به expected (نه قبل از low) که needle در آن است"""
+        for loose in (False, True):
+            texts = self._loose if loose else self.texts
+            target = [text.rstrip() for text in needle] if loose else needle
+            size = len(target)
+            candidates = [p for p in self._positions(needle[0], loose) if p >= low]
+            candidates.sort(key=lambda p: (abs(p - expected), p))
+            for position in candidates:
+                if texts[position:position + size] == target:
+                    return position
+        return None
+
+def apply_patch(content: str, diff_text: str, fuzz: int = None,
+                allow_partial: bool = None) -> PatchResult:
+    """اعمال unified diff روی متن یک فایل
+    
+    محل هر hunk ابتدا دقیقاً در خط اعلام شده، سپس با offset (نزدیک‌ترین
+    محل در کل فایل) و در نهایت با fuzz (نادیده گرفتن چند خط context ابتدا
+    و انتها) جستجو می‌شود. hunkها روی فایل اصلی و به ترتیب پیدا می‌شوند و
+    همپوشانی ندارند. hunk رد شده هیچ خطی را تغییر نمی‌دهد؛ اگر
+    allow_partial خاموش باشد، با رد شدن هر hunk کل فایل دست نخورده می‌ماند.
+    """
+    if fuzz is None:
+        fuzz = Config.PATCH_FUZZ
+    if allow_partial is None:
+        allow_partial = Config.PATCH_ALLOW_PARTIAL
+    
+    hunks = parse_hunks(diff_text)
+    original = _split_lines(content)
+    matcher = _Matcher([text for text, _ in original])
+    
+    results: List[HunkResult] = []
+    located: List[Tuple[int, int, List[Tuple[str, str]], Hunk]] = []
+    low = 0
+    drift = 0
+    
+    for hunk in hunks:
+        header_line = max(hunk.old_start - 1, 0) if hunk.old_lines else hunk.old_start
+        found = already = None
+        
+        for level in range(fuzz + 1):
+            lead, lines = hunk.trimmed(level)
+            if level and len(lines) == len(hunk.trimmed(level - 1)[1]):
+                break
+            old = [text for sign, text in lines if sign != '+']
+            
+            if not old:
+                if hunk.old_lines:
+                    # بدون context محل درج قابل بررسی نیست
+                    break
+                # درج در فایل خالی یا hunk بدون context: فقط شماره خط header
+                position = min(max(header_line + drift, low), len(original))
+                found = (position, level, lines, lead)
+                break
+            
+            expected = header_line + drift + lead
+            position = matcher.find(old, expected, low)
+            
+            if level == 0 and any(sign == '+' for sign, _ in hunk.lines):
+                # قبل از fuzz: شاید این hunk قبلاً روی فایل اعمال شده باشد؛
+                # اگر هر دو پیدا شوند، محل نزدیک‌تر به header انتخاب می‌شود
+                already = matcher.find(hunk.new_lines, header_line + drift, low)
+                if already is not None and (position is None or
+                                            abs(already - header_line - drift) < abs(position - expected)):
+                    break
+                already = None
+            
+            if position is not None:
+                found = (position, level, lines, lead)
+                break
+        
+        if already is not None:
+            results.append(HunkResult(hunk.index, HUNK_ALREADY, already + 1))
+            low = already + len(hunk.new_lines)
+            continue
+        
+        if found is None:
+            results.append(HunkResult(hunk.index, HUNK_REJECTED,
+                                      reason="خطوط context/حذفی در فایل پیدا نشد"))
+            continue
+        
+        position, level, lines, lead = found
+        size = sum(1 for sign, _ in lines if sign != '+')
+        offset = position - (header_line + lead)
+        drift = offset
+        low = position + size
+        located.append((position, size, lines, hunk))
+        results.append(HunkResult(hunk.index, HUNK_APPLIED, position + 1, offset, level))
+    
+    rejected = any(result.status == HUNK_REJECTED for result in results)
+    if not located or (rejected and not allow_partial):
+        return PatchResult(content, results, False)
+    
+    return PatchResult(_rebuild(original, located), results, True)
+
+def _rebuild(original: List[Tuple[str, str]],
+             located: List[Tuple[int, int, List[Tuple[str, str]], Hunk]]) -> str:
+    """ساخت متن نهایی از خطوط اصلی و hunkهای پیدا شده"""
+    crlf = sum(1 for _, eol in original if eol == '\r\n')
+    default_eol = '\r\n' if crlf * 2 > len(original) else '\n'
+    
+    # وضعیت newline انتهای فایل فقط با علامت "\ No newline" تغییر می‌کند
+    final_eol = original[-1][1] if original else default_eol
+    
+    output: List[Tuple[str, str]] = []
+    cursor = 0
+    
+    for position, size, lines, hunk in located:
+        output.extend(original[cursor:position])
+        source = position
+        for sign, text in lines:
+            if sign == ' ':
+                # خط context با همان فاصله‌ها و انتهای خط فایل اصلی می‌ماند
+                output.append(original[source])
+                source += 1
+            elif sign == '-':
+                source += 1
+            else:
+                output.append((text, default_eol))
+        cursor = position + size
+        
+        if cursor >= len(original):
+            if hunk.new_no_eol:
+                final_eol = ''
+            elif hunk.old_no_eol:
+                final_eol = default_eol
+    
+    output.extend(original[cursor:])
+    
+    # همه خطوط جز آخری باید انتهای خط داشته باشند
+    for i in range(len(output) - 1):
+        if not output[i][1]:
+            output[i] = (output[i][0], default_eol)
+    if output:
+        output[-1] = (output[-1][0], final_eol)
+    
+    return ''.join(text + eol for text, eol in output)
\ No newline at end of file
@@ -1,396 +1,984 @@
-import os
-import json
-from pathlib import Path
-from typing import Dict, List, Any, Tuple
-import fnmatch
-from config import Config
-
-class ProjectSerializer:
-    """تبدیل پروژه به فرمت قابل ارسال به LLM و برعکس"""
-    
-    def __init__(self, project_path: str):
-        self.project_path = Path(project_path).resolve()
-        self.last_snapshot = {}  # برای ردیابی تغییرات
-        
-    def should_ignore(self, path: Path) -> bool:
-        """بررسی اینکه آیا فایل یا پوشه باید نادیده گرفته شود"""
-        path_str = str(path)
-        
-        for pattern in Config.IGNORE_PATTERNS:
-            if fnmatch.fnmatch(path_str, f'*{pattern}*'):
-                return True
-        
-        if path.is_file():
-            try:
-                if path.stat().st_size > Config.MAX_FILE_SIZE:
-                    print(f"⚠️  فایل {path.name} بیش از حد بزرگ است")
-                    return True
-            except:
-                pass
-                
-        return False
-    
-    def is_binary_file(self, file_path: Path) -> bool:
-        """بررسی اینکه فایل binary است یا text"""
-        try:
-            with open(file_path, 'tr', encoding='utf-8') as f:
-                f.read(1024)
-            return False
-        except:
-            return True
-    
-    def load_project_files(self) -> List[Dict[str, Any]]:
-        """بارگذاری فایل‌های پروژه"""
-        if not self.project_path.exists():
-            raise FileNotFoundError(f"مسیر پروژه یافت نشد: {self.project_path}")
-        
-        files = []
-        ignored_count = 0
-        binary_count = 0
-        
-        for root, dirs, filenames in os.walk(self.project_path):
-            root_path = Path(root)
-            dirs[:] = [d for d in dirs if not self.should_ignore(root_path / d)]
-            
-            for filename in filenames:
-                file_path = root_path / filename
-                
-                if self.should_ignore(file_path):
-                    ignored_count += 1
-                    continue
-                
-                if self.is_binary_file(file_path):
-                    binary_count += 1
-                    continue
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    relative_path = file_path.relative_to(self.project_path)
-                    
-                    files.append({
-                        "path": str(relative_path).replace('\\', '/'),
-                        "content": content
-                    })
-                    
-                except Exception as e:
-                    print(f"⚠️  خطا در خواندن {file_path.name}: {e}")
-                    continue
-        
-        print(f"\n📊 آمار:")
-        print(f"   ✅ فایل‌ها: {len(files)}")
-        print(f"   ⏭️  نادیده گرفته: {ignored_count}")
-        print(f"   🔒 Binary: {binary_count}")
-        
-        # ذخیره snapshot
-        self.last_snapshot = {f["path"]: f["content"] for f in files}
-        
-        return files
-    
-    def serialize_project(self, selected_files: List[str] = None) -> str:
-        """تبدیل پروژه به JSON"""
-        files = self.load_project_files()
-        
-        # فیلتر کردن فایل‌های انتخابی
-        if selected_files:
-            files = [f for f in files if f["path"] in selected_files]
-        
-        project_data = {
-            "project_name": self.project_path.name,
-            "base_path": str(self.project_path),
-            "total_files": len(files),
-            "files": files
-        }
-        
-        json_output = json.dumps(project_data, ensure_ascii=False, indent=2)
-        return json_output
-    
-    def serialize_changes_only(self, current_files: List[Dict[str, Any]]) -> str:
-        """خروجی فقط تغییرات (بهینه‌تر)"""
-        changes = []
-        current_paths = {f["path"]: f["content"] for f in current_files}
-        
-        # فایل‌های تغییر یافته یا جدید
-        for path, content in current_paths.items():
-            if path not in self.last_snapshot:
-                # فایل جدید
-                changes.append({
-                    "path": path,
-                    "content": content,
-                    "action": "added"
-                })
-            elif self.last_snapshot[path] != content:
-                # فایل تغییر یافته
-                changes.append({
-                    "path": path,
-                    "content": content,
-                    "action": "modified"
-                })
-        
-        # فایل‌های حذف شده
-        for path in self.last_snapshot.keys():
-            if path not in current_paths:
-                changes.append({
-                    "path": path,
-                    "action": "deleted"
-                })
-        
-        if not changes:
-            # هیچ تغییری وجود ندارد
-            return json.dumps({
-                "project_name": self.project_path.name,
-                "changes_only": True,
-                "message": "هیچ تغییری شناسایی نشد",
-                "files": []
-            }, ensure_ascii=False, indent=2)
-        
-        project_data = {
-            "project_name": self.project_path.name,
-            "changes_only": True,
-            "total_changes": len(changes),
-            "files": changes
-        }
-        
-        return json.dumps(project_data, ensure_ascii=False, indent=2)
-    
-    def split_into_parts(self, json_str: str, max_chars: int) -> List[str]:
-        """تقسیم JSON به بخش‌های کوچکتر"""
-        if len(json_str) <= max_chars:
-            return [json_str]
-        
-        try:
-            data = json.loads(json_str)
-        except:
-            # اگر parse نشد، تقسیم ساده
-            return self._simple_split(json_str, max_chars)
-        
-        # تقسیم هوشمند بر اساس فایل‌ها
-        files = data.get("files", [])
-        if not files:
-            return [json_str]
-        
-        parts = []
-        header = {
-            "project_name": data.get("project_name"),
-            "base_path": data.get("base_path"),
-            "changes_only": data.get("changes_only", False),
-            "total_files": data.get("total_files", len(files))
-        }
-        
-        current_part_files = []
-        current_size = len(json.dumps(header, ensure_ascii=False))
-        
-        for file_obj in files:
-            file_json = json.dumps(file_obj, ensure_ascii=False)
-            file_size = len(file_json)
-            
-            # اگر یک فایل خیلی بزرگ است
-            if file_size > max_chars:
-                # اگر فایل‌های قبلی وجود دارد، آن‌ها را ذخیره کن
-                if current_part_files:
-                    part_data = header.copy()
-                    part_data["files"] = current_part_files
-                    parts.append(json.dumps(part_data, ensure_ascii=False, indent=2))
-                    current_part_files = []
-                    current_size = len(json.dumps(header, ensure_ascii=False))
-                
-                # فایل بزرگ را به تنهایی به عنوان یک بخش اضافه کن
-                part_data = header.copy()
-                part_data["files"] = [file_obj]
-                part_data["warning"] = f"فایل {file_obj['path']} بسیار بزرگ است"
-                parts.append(json.dumps(part_data, ensure_ascii=False, indent=2))
-                continue
-            
-            # بررسی اگر اضافه کردن این فایل از حد بگذرد
-            if current_size + file_size + 100 > max_chars:  # 100 برای کاماها و آرایه
-                # ذخیره بخش فعلی
-                part_data = header.copy()
-                part_data["files"] = current_part_files
-                parts.append(json.dumps(part_data, ensure_ascii=False, indent=2))
-                
-                # شروع بخش جدید
-                current_part_files = [file_obj]
-                current_size = len(json.dumps(header, ensure_ascii=False)) + file_size
-            else:
-                current_part_files.append(file_obj)
-                current_size += file_size
-        
-        # اضافه کردن آخرین بخش
-        if current_part_files:
-            part_data = header.copy()
-            part_data["files"] = current_part_files
-            parts.append(json.dumps(part_data, ensure_ascii=False, indent=2))
-        
-        # اضافه کردن تگ‌های PART
-        total_parts = len(parts)
-        tagged_parts = []
-        for i, part in enumerate(parts, 1):
-            tagged = f"---START PART {i}/{total_parts}---\n{part}\n---END PART {i}/{total_parts}---"
-            tagged_parts.append(tagged)
-        
-        return tagged_parts
-    
-    def _simple_split(self, text: str, max_chars: int) -> List[str]:
-        """تقسیم ساده متن"""
-        parts = []
-        for i in range(0, len(text), max_chars):
-            parts.append(text[i:i+max_chars])
-        
-        total = len(parts)
-        return [f"---START PART {i+1}/{total}---\n{p}\n---END PART {i+1}/{total}---" 
-                for i, p in enumerate(parts)]
-    
-    def deserialize_project(self, json_str: str) -> Dict[str, Any]:
-        """تبدیل JSON به ساختار پروژه"""
-        try:
-            # پاکسازی ورودی
-            json_str = json_str.strip()
-            
-            # حذف markdown code blocks
-            if json_str.startswith('```'):
-                lines = json_str.split('\n')
-                json_str = '\n'.join(lines[1:-1]) if len(lines) > 2 else json_str
-            
-            # حذف تگ‌های PART اگر وجود دارد
-            if '---START PART' in json_str:
-                json_str = self._extract_from_parts(json_str)
-            
-            project_data = json.loads(json_str)
-            
-            if "files" not in project_data:
-                raise ValueError("فرمت JSON نادرست است. کلید 'files' یافت نشد.")
-            
-            return project_data
-            
-        except json.JSONDecodeError as e:
-            raise ValueError(f"خطا در parse کردن JSON: {e}")
-    
-    def _extract_from_parts(self, text: str) -> str:
-        """استخراج JSON از بخش‌های چندگانه"""
-        import re
-        
-        # پیدا کردن تمام بخش‌ها
-        pattern = r'---START PART \d+/\d+---\n(.*?)\n---END PART \d+/\d+---'
-        matches = re.findall(pattern, text, re.DOTALL)
-        
-        if not matches:
-            return text
-        
-        # ترکیب بخش‌ها
-        combined_files = []
-        base_info = None
-        
-        for match in matches:
-            try:
-                part_data = json.loads(match)
-                
-                if base_info is None:
-                    base_info = {
-                        "project_name": part_data.get("project_name"),
-                        "base_path": part_data.get("base_path"),
-                        "changes_only": part_data.get("changes_only", False)
-                    }
-                
-                if "files" in part_data:
-                    combined_files.extend(part_data["files"])
-                    
-            except json.JSONDecodeError:
-                continue
-        
-        result = base_info or {}
-        result["files"] = combined_files
-        result["total_files"] = len(combined_files)
-        
-        return json.dumps(result, ensure_ascii=False)
-    
-    def apply_changes(self, project_data: Dict[str, Any]) -> List[str]:
-        """اعمال تغییرات به پروژه واقعی"""
-        applied_changes = []
-        
-        # بررسی حالت changes_only
-        changes_only = project_data.get("changes_only", False)
-        
-        if changes_only:
-            # حالت فقط تغییرات
-            return self._apply_changes_only(project_data)
-        else:
-            # حالت کل پروژه
-            return self._apply_full_project(project_data)
-    
-    def _apply_changes_only(self, project_data: Dict[str, Any]) -> List[str]:
-        """اعمال فقط تغییرات"""
-        applied_changes = []
-        
-        for file_obj in project_data.get("files", []):
-            path = file_obj["path"]
-            action = file_obj.get("action", "modified")
-            file_path = self.project_path / path
-            
-            if action == "deleted":
-                # حذف فایل
-                if file_path.exists():
-                    file_path.unlink()
-                    applied_changes.append(f"➖ حذف: {path}")
-                    
-            elif action == "added":
-                # اضافه کردن فایل جدید
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(file_obj["content"])
-                applied_changes.append(f"➕ جدید: {path}")
-                
-            elif action == "modified":
-                # تغییر فایل موجود
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(file_obj["content"])
-                applied_changes.append(f"✏️  تغییر: {path}")
-        
-        return applied_changes
-    
-    def _apply_full_project(self, project_data: Dict[str, Any]) -> List[str]:
-        """اعمال کل پروژه"""
-        applied_changes = []
-        
-        # دریافت فایل‌های موجود
-        existing_files = set()
-        for root, dirs, filenames in os.walk(self.project_path):
-            root_path = Path(root)
-            dirs[:] = [d for d in dirs if not self.should_ignore(root_path / d)]
-            
-            for filename in filenames:
-                file_path = root_path / filename
-                if not self.should_ignore(file_path):
-                    relative_path = file_path.relative_to(self.project_path)
-                    existing_files.add(str(relative_path).replace('\\', '/'))
-        
-        new_files = {f["path"] for f in project_data.get("files", [])}
-        
-        # اعمال فایل‌های جدید/تغییر یافته
-        for file_obj in project_data.get("files", []):
-            file_path = self.project_path / file_obj["path"]
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(file_obj["content"])
-            
-            if file_obj["path"] in existing_files:
-                applied_changes.append(f"✏️  تغییر: {file_obj['path']}")
-            else:
-                applied_changes.append(f"➕ جدید: {file_obj['path']}")
-        
-        # حذف فایل‌های حذف شده
-        deleted_files = existing_files - new_files
-        for file_path_str in deleted_files:
-            file_path = self.project_path / file_path_str
-            if file_path.exists():
-                file_path.unlink()
-                applied_changes.append(f"➖ حذف: {file_path_str}")
-        
-        return applied_changes
-    
-    def get_file_list(self) -> List[Tuple[str, int]]:
-        """دریافت لیست فایل‌ها با اندازه"""
-        files = self.load_project_files()
+import mmap
+import stat
+import codecs
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Tuple, Optional, Iterator, Iterable, TextIO, Set
+from config import Config
+from ignore_matcher import IgnoreMatcher
+from file_scanner import ProjectScanner, ScannedFile
+from project_watcher import LiveProjectModel, ProjectWatcher
+from content_cache import ContentCache, get_project_state_dir
+from export_writer import JsonStreamWriter
+from export_formats import ExportFormat, get_format, detect_format
+from snapshot_store import SnapshotStore, SnapshotEntry, content_entry
+from part_planner import PartPlanner, UNIT_CHARS
+from patch_engine import apply_patch
+from apply_engine import ApplyEngine
+from change_preview import ChangePreview
+from outline import OutlineCache, outline_record
+from search_index import SearchIndex
+from response_parser import parse_response
+from token_estimator import TokenEstimator
+
+# بایت‌هایی که در فایل‌های متنی عادی دیده می‌شوند
+_TEXT_BYTES = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+
+def _looks_binary(block: bytes) -> bool:
+    """تشخیص binary با بایت NUL یا نسبت بالای کاراکترهای کنترلی"""
+    if not block:
+        return False
+    
+    if b'\0' in block:
+        return True
+    
+    control_count = len(block.translate(None, _TEXT_BYTES))
+    return control_count / len(block) > 0.3
+
+def _decode_text(buffer) -> Optional[str]:
+    """decode یک buffer (bytes یا mmap) به متن؛ None برای فایل binary
+    
+    مانند خواندن در حالت text، انتهای خط‌ها به \\n تبدیل می‌شوند.
+    """
+    if _looks_binary(buffer[:Config.BINARY_SNIFF_BYTES]):
+        return None
+    
+    try:
+        text = str(buffer, 'utf-8')
+    except UnicodeDecodeError:
+        return None
+    
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    return text
+
+class ProjectSerializer:
+    """تبدیل پروژه به فرمت قابل ارسال به LLM و برعکس"""
+    
+    # دلیل ثبت شده برای فایل تغییر یافته‌ای که محتوایش خوانده نشد
+    # (فایل‌های ignore شده پیش از خواندن کنار گذاشته می‌شوند، پس ignored یعنی حجم زیاد)
+    SKIP_REASONS = {
+        'ignored': 'too_large',
+        'binary': 'binary',
+        'missing': 'missing',
+        'error': 'unreadable'
+    }
+    
+    def __init__(self, project_path: str, git_manager=None):
+        self.project_path = Path(project_path).resolve()
+        self.git_manager = git_manager  # برای لیست فایل‌ها از index گیت
+        self.baseline_name = SnapshotStore.SYNC_STATE  # مبنای مقایسه «فقط تغییرات»
+        self.export_format = Config.EXPORT_FORMAT  # قالب متن خروجی (export_formats)
+        self.snapshot_store: Optional[SnapshotStore] = None
+        self.token_estimator: Optional[TokenEstimator] = None
+        self.outline_cache: Optional[OutlineCache] = None
+        self.search_index: Optional[SearchIndex] = None
+        self.ignore_matcher = IgnoreMatcher(Config.IGNORE_PATTERNS)
+        self.scanner = ProjectScanner(self.project_path, self.ignore_matcher)
+        self.content_cache: Optional[ContentCache] = None
+        self.live_model: Optional[LiveProjectModel] = None
+        self.watcher: Optional[ProjectWatcher] = None
+        # header و رکوردهای آخرین خروجی درون حافظه (برای تقسیم بدون parse دوباره)
+        self.last_export_records: Optional[Tuple[Dict[str, Any], List[Dict[str, Any]], ExportFormat,
+                                                 Dict[str, SnapshotEntry]]] = None
+        self._content_cache_failed = False
+        
+    def should_ignore(self, path: Path) -> bool:
+        """بررسی اینکه آیا فایل یا پوشه باید نادیده گرفته شود"""
+        try:
+            parts = path.relative_to(self.project_path).parts
+        except ValueError:
+            parts = path.parts
+        
+        if self.ignore_matcher.matches_parts(parts):
+            return True
+        
+        if path.is_file():
+            try:
+                if path.stat().st_size > Config.MAX_FILE_SIZE:
+                    print(f"⚠️  فایل {path.name} بیش از حد بزرگ است")
+                    return True
+            except:
+                pass
+                
+        return False
+    
+    def is_binary_file(self, file_path: Path) -> bool:
+        """بررسی اینکه فایل binary است یا text (فقط بلوک اول خوانده می‌شود)"""
+        try:
+            with open(file_path, 'rb') as f:
+                block = f.read(Config.BINARY_SNIFF_BYTES)
+        except OSError:
+            return True
+        
+        if _looks_binary(block):
+            return True
+        
+        try:
+            # بلوک ممکن است وسط یک کاراکتر چندبایتی قطع شده باشد
+            codecs.getincrementaldecoder('utf-8')().decode(block, final=False)
+            return False
+        except UnicodeDecodeError:
+            return True
+    
+    def _read_text(self, file_path: str, size: int) -> Optional[str]:
+        """خواندن یک‌باره فایل، تشخیص binary و decode همان buffer
+        
+        فایل‌های بزرگ با mmap خوانده می‌شوند تا کپی اضافه‌ای ساخته نشود.
+        خروجی None یعنی فایل binary است.
+        """
+        with open(file_path, 'rb') as f:
+            if size >= Config.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    return _decode_text(buffer)
+            
+            return _decode_text(f.read())
+    
+    def _list_git_files(self) -> Optional[List[str]]:
+        """لیست فایل‌ها از index گیت، یا None اگر پروژه repository نباشد"""
+        if not Config.USE_GIT_INDEX or self.git_manager is None:
+            return None
+        
+        if self.git_manager.project_path != self.project_path:
+            return None
+        
+        return self.git_manager.list_project_files()
+    
+    def _iter_candidate_files(self) -> Iterator[ScannedFile]:
+        """تولید فایل‌های کاندید؛ از index گیت یا با پیمایش os.scandir"""
+        git_files = self._list_git_files()
+        
+        if git_files is not None:
+            return self.scanner.from_paths(git_files)
+        
+        return self.scanner.scan()
+    
+    def _get_content_cache(self) -> Optional[ContentCache]:
+        """ایجاد تنبل کش محتوا (پس از آنکه .git احتمالاً ساخته شده باشد)"""
+        if not Config.CONTENT_CACHE_ENABLED or self._content_cache_failed:
+            return None
+        
+        if self.content_cache is None:
+            try:
+                state_dir = get_project_state_dir(self.project_path)
+                self.content_cache = ContentCache(state_dir / 'content_cache.sqlite3')
+            except Exception as e:
+                print(f"⚠️  کش محتوا در دسترس نیست: {e}")
+                self._content_cache_failed = True
+                return None
+        
+        return self.content_cache
+    
+    def _get_snapshot_store(self) -> SnapshotStore:
+        """ایجاد تنبل انبار snapshotها (در صورت خطا فقط در حافظه)"""
+        if self.snapshot_store is None:
+            try:
+                directory = get_project_state_dir(self.project_path) / 'snapshots'
+                self.snapshot_store = SnapshotStore(directory)
+            except Exception as e:
+                print(f"⚠️  snapshotها ذخیره نمی‌شوند: {e}")
+                self.snapshot_store = SnapshotStore(None)
+        
+        return self.snapshot_store
+    
+    @property
+    def last_snapshot(self) -> Dict[str, SnapshotEntry]:
+        """آنچه در آخرین خروجی ارسال شده: مسیر -> (hash، اندازه)"""
+        return self._get_snapshot_store().load(SnapshotStore.LAST_EXPORT) or {}
+    
+    def get_baseline(self, name: str = None) -> Dict[str, SnapshotEntry]:
+        """baseline نام‌دار (پیش‌فرض: baseline انتخاب شده برای مقایسه)"""
+        store = self._get_snapshot_store()
+        name = name or self.baseline_name
+        baseline = store.load(name)
+        if baseline is None and name == SnapshotStore.SYNC_STATE:
+            # خروجی‌های قبل از جدا شدن وضعیت همگام‌سازی فقط «آخرین خروجی» دارند
+            baseline = store.load(SnapshotStore.LAST_EXPORT)
+        return baseline or {}
+    
+    def _record_sent(self, entries: Dict[str, SnapshotEntry], kind: str, outlines: List[str] = None,
+                     state: Dict[str, SnapshotEntry] = None):
+        """ثبت فایل‌های ارسال شده به عنوان baseline «آخرین خروجی»
+        
+        فایل‌های outline جزو baseline نیستند (محتوای کاملشان ارسال نشده)
+        ولی مسیرشان ثبت می‌شود تا apply_changes آن‌ها را بازنویسی نکند.
+        state وضعیتی است که طرف مقابل پس از این خروجی دارد (پیش‌فرض: همان
+        فایل‌های ارسال شده) و مبنای خروجی «فقط تغییرات» بعدی می‌شود.
+        """
+        store = self._get_snapshot_store()
+        store.save(SnapshotStore.LAST_EXPORT, entries, {
+            "kind": kind,
+            "compared_to": self.baseline_name if kind == "changes_only" else None,
+            "outlines": sorted(outlines or [])
+        })
+        store.save(SnapshotStore.SYNC_STATE, state if state is not None else entries, {"kind": kind})
+    
+    def clear_content_cache(self):
+        """پاک کردن کش محتوای این پروژه"""
+        cache = self._get_content_cache()
+        if cache is not None:
+            cache.clear()
+    
+    def _load_file(self, scanned: ScannedFile) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """بارگذاری یک فایل (روی thread کارگر اجرا می‌شود)
+        
+        خروجی: (وضعیت، رکورد) که وضعیت یکی از ok/missing/ignored/binary/error است
+        """
+        if scanned.ignored:
+            return 'ignored', None
+        
+        # فایل‌های حذف شده از working tree که هنوز در index هستند
+        try:
+            st = scanned.stat()
+        except OSError:
+            return 'missing', None
+        
+        if not stat.S_ISREG(st.st_mode):
+            return 'missing', None
+        
+        if st.st_size > Config.MAX_FILE_SIZE:
+            print(f"⚠️  فایل {scanned.name} بیش از حد بزرگ است")
+            return 'ignored', None
+        
+        relative_path = scanned.path
+        
+        cache = self._get_content_cache()
+        if cache is not None:
+            cached = cache.get(relative_path, st)
+            if cached is not None:
+                kind, content = cached
+                if kind == 'binary':
+                    return 'binary', None
+                return 'ok', {"path": relative_path, "content": content}
+        
+        try:
+            content = self._read_text(scanned.abs_path, st.st_size)
+        except Exception as e:
+            print(f"⚠️  خطا در خواندن {scanned.name}: {e}")
+            return 'error', None
+        
+        if content is None:
+            if cache is not None:
+                cache.put(relative_path, st, 'binary')
+            return 'binary', None
+        
+        if cache is not None:
+            cache.put(relative_path, st, 'text', content)
+        
+        return 'ok', {
+            "path": relative_path,
+            "content": content
+        }
+    
+    def _iter_loaded_files(self, candidates: Iterable[ScannedFile] = None
+                           ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """خواندن موازی فایل‌ها همزمان با پیمایش، با حفظ ترتیب مسیرها
+        
+        candidates پیش‌فرض همه فایل‌های پروژه است. تعداد کارهای در جریان
+        محدود است تا حافظه با اندازه پروژه رشد نکند.
+        """
+        if candidates is None:
+            candidates = self._iter_candidate_files()
+        
+        workers = max(1, Config.LOAD_WORKERS)
+        
+        if workers == 1:
+            for scanned in candidates:
+                yield self._load_file(scanned)
+            return
+        
+        max_pending = workers * 4
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="loader") as pool:
+            pending = deque()
+            
+            for scanned in candidates:
+                pending.append(pool.submit(self._load_file, scanned))
+                
+                # نتایج به همان ترتیب ارسال برگردانده می‌شوند
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            
+            while pending:
+                yield pending.popleft().result()
+    
+    def iter_project_files(self) -> Iterator[Dict[str, Any]]:
+        """بارگذاری جریانی فایل‌های پروژه (هر بار یک فایل در حافظه)"""
+        if not self.project_path.exists():
+            raise FileNotFoundError(f"مسیر پروژه یافت نشد: {self.project_path}")
+        
+        # در حالت نظارت زنده خروجی مستقیماً از مدل درون حافظه ساخته می‌شود؛
+        # رویدادهای در صف ابتدا اعمال می‌شوند و اگر ممکن نشد از دیسک خوانده می‌شود
+        if self.live_model is not None and self.watcher is not None and self.watcher.flush():
+            files = self.live_model.snapshot_files()
+            print(f"\n⚡ {len(files)} فایل از مدل زنده پروژه")
+            yield from files
+            return
+        
+        file_count = 0
+        ignored_count = 0
+        binary_count = 0
+        
+        cache = self._get_content_cache()
+        if cache is not None:
+            cache.reset_counters()
+        
+        try:
+            for status, file_obj in self._iter_loaded_files():
+                if status == 'ok':
+                    file_count += 1
+                    yield file_obj
+                elif status == 'ignored':
+                    ignored_count += 1
+                elif status == 'binary':
+                    binary_count += 1
+        finally:
+            if cache is not None:
+                cache.flush()
+        
+        print(f"\n📊 آمار:")
+        print(f"   ✅ فایل‌ها: {file_count}")
+        print(f"   ⏭️  نادیده گرفته: {ignored_count}")
+        print(f"   🔒 Binary: {binary_count}")
+        if cache is not None:
+            print(f"   💾 کش: {cache.hits} hit / {cache.misses} miss")
+    
+    def load_project_files(self) -> List[Dict[str, Any]]:
+        """بارگذاری فایل‌های پروژه"""
+        return list(self.iter_project_files())
+    
+    def start_watching(self) -> ProjectWatcher:
+        """شروع حالت نظارت زنده (inotify یا polling)"""
+        if self.watcher is not None and self.watcher.is_alive():
+            return self.watcher
+        
+        self.live_model = LiveProjectModel(self)
+        self.watcher = ProjectWatcher(self.live_model)
+        self.watcher.start()
+        return self.watcher
+    
+    def stop_watching(self):
+        """توقف حالت نظارت زنده"""
+        if self.watcher is not None:
+            self.watcher.stop()
+        self.watcher = None
+        self.live_model = None
+    
+    def _project_header(self, total_files: int, outline_files: int = 0) -> Dict[str, Any]:
+        header = {
+            "project_name": self.project_path.name,
+            "base_path": str(self.project_path),
+            "total_files": total_files
+        }
+        if outline_files:
+            header["outline_files"] = outline_files
+        return header
+    
+    def get_export_format(self) -> ExportFormat:
+        return get_format(self.export_format)
+    
+    def _get_outline_cache(self) -> OutlineCache:
+        """کش outlineها در پوشه state پروژه"""
+        if self.outline_cache is None:
+            try:
+                cache_path = get_project_state_dir(self.project_path) / 'outlines.json'
+            except Exception:
+                cache_path = None
+            self.outline_cache = OutlineCache(cache_path)
+        
+        return self.outline_cache
+        
+    def _select_records(self, files: Iterable[Dict[str, Any]], selected_files: List[str] = None,
+                        outline_others: bool = False) -> Iterator[Tuple[Dict[str, Any], bool]]:
+        """رکوردهای خروجی: (رکورد، آیا outline است)
+        
+        بدون انتخاب همه فایل‌ها کامل هستند؛ با انتخاب، بقیه فایل‌ها حذف یا
+        (با outline_others) به outline فقط خواندنی تبدیل می‌شوند.
+        """
+        selected = set(selected_files) if selected_files else None
+        cache = self._get_outline_cache() if selected is not None and outline_others else None
+        
+        for file_obj in files:
+            if selected is None or file_obj["path"] in selected:
+                yield file_obj, False
+            elif cache is not None:
+                yield outline_record(file_obj, cache), True
+        
+        if cache is not None:
+            cache.save()
+    
+    def serialize_project(self, selected_files: List[str] = None, outline_others: bool = False) -> str:
+        """تبدیل پروژه به متن خروجی (JSON یا قالب انتخاب شده در export_format)
+        
+        با outline_others فایل‌های انتخاب نشده فقط به صورت outline می‌آیند.
+        """
+        records = []
+        sent = {}
+        outlines = []
+        for record, is_outline in self._select_records(self.load_project_files(), selected_files, outline_others):
+            records.append(record)
+            if is_outline:
+                outlines.append(record["path"])
+            else:
+                sent[record["path"]] = content_entry(record["content"])
+        
+        header = self._project_header(len(records), len(outlines))
+        json_output = self._dump_export(header, records, sent)
+        
+        # ذخیره snapshot
+        self._record_sent(sent, "selected" if selected_files else "full", outlines)
+        return json_output
+    
+    def _dump_export(self, header: Dict[str, Any], records: List[Dict[str, Any]],
+                     entries: Dict[str, SnapshotEntry] = None) -> str:
+        """متن خروجی؛ header، رکوردها و hash محتوای آن‌ها (entries) برای create_export_planner نگه داشته می‌شوند"""
+        export_format = self.get_export_format()
+        self.last_export_records = (header, records, export_format, entries or {})
+        return export_format.dumps(header, records)
+    
+    def _spool_project(self, writer: JsonStreamWriter, selected_files: List[str] = None,
+                       outline_others: bool = False) -> Tuple[Dict[str, SnapshotEntry], List[str]]:
+        sent = {}
+        outlines = []
+        for record, is_outline in self._select_records(self.iter_project_files(), selected_files, outline_others):
+            writer.add(record)
+            if is_outline:
+                outlines.append(record["path"])
+            else:
+                sent[record["path"]] = content_entry(record["content"])
+        return sent, outlines
+    
+    def write_project(self, stream: TextIO, selected_files: List[str] = None,
+                      outline_others: bool = False) -> int:
+        """نوشتن جریانی خروجی پروژه در stream
+        
+        خروجی دقیقاً همان serialize_project است ولی هر فایل بلافاصله پس از
+        خواندن encode و در فایل موقت نوشته می‌شود؛ حافظه مصرفی به بزرگ‌ترین
+        فایل محدود است. خروجی: تعداد کاراکترهای نوشته شده
+        """
+        self.last_export_records = None
+        with JsonStreamWriter(export_format=self.get_export_format()) as writer:
+            sent, outlines = self._spool_project(writer, selected_files, outline_others)
+            written = writer.finish(stream, self._project_header(writer.count, len(outlines)))
+        
+        self._record_sent(sent, "selected" if selected_files else "full", outlines)
+        return written
+    
+    def export_to_file(self, output_path: str, selected_files: List[str] = None,
+                       outline_others: bool = False) -> int:
+        """ذخیره خروجی پروژه در فایل بدون ساختن کل JSON در حافظه"""
+        self.last_export_records = None
+        with JsonStreamWriter(export_format=self.get_export_format()) as writer:
+            sent, outlines = self._spool_project(writer, selected_files, outline_others)
+            
+            # فایل مقصد فقط پس از بارگذاری کامل باز می‌شود
+            with open(output_path, 'w', encoding='utf-8') as f:
+                written = writer.finish(f, self._project_header(writer.count, len(outlines)))
+        
+        self._record_sent(sent, "selected" if selected_files else "full", outlines)
+        return written
+    
+    def serialize_changes_only(self, current_files: List[Dict[str, Any]]) -> str:
+        """خروجی فقط تغییرات (بهینه‌تر)"""
+        changes = []
+        baseline = self.get_baseline()
+        current_entries = {}
+        sent_entries = {}
+        
+        # فایل‌های تغییر یافته یا جدید (مقایسه hash به جای متن کامل)
+        for file_obj in current_files:
+            path = file_obj["path"]
+            entry = content_entry(file_obj["content"])
+            current_entries[path] = entry
+            
+            if path not in baseline:
+                # فایل جدید
+                sent_entries[path] = entry
+                changes.append({
+                    "path": path,
+                    "content": file_obj["content"],
+                    "action": "added"
+                })
+            elif baseline[path] != entry:
+                # فایل تغییر یافته
+                sent_entries[path] = entry
+                changes.append({
+                    "path": path,
+                    "content": file_obj["content"],
+                    "action": "modified"
+                })
+        
+        # فایل‌های حذف شده
+        for path in baseline.keys():
+            if path not in current_entries:
+                changes.append({
+                    "path": path,
+                    "action": "deleted"
+                })
+        
+        # فقط فایل‌های ارسال شده «آخرین خروجی» هستند (و apply فقط همان‌ها را
+        # حذف می‌کند)، ولی پس از این تغییرات طرف مقابل وضعیت فعلی را دارد
+        self._record_sent(sent_entries, "changes_only", state=current_entries)
+        
+        if not changes:
+            # هیچ تغییری وجود ندارد
+            return self._dump_export({
+                "project_name": self.project_path.name,
+                "changes_only": True,
+                "message": "هیچ تغییری شناسایی نشد"
+            }, [])
+        
+        header = {
+            "project_name": self.project_path.name,
+            "changes_only": True,
+            "total_changes": len(changes)
+        }
+        
+        return self._dump_export(header, changes, sent_entries)
+    
+    def serialize_changes_since(self, ref: str) -> str:
+        """خروجی «فقط تغییرات» نسبت به یک commit یا branch (با کمک git)
+        
+        لیست فایل‌های اضافه، تغییر یا حذف شده از merge-base با ref تا
+        working tree (شامل تغییرات commit نشده و فایل‌های untracked) از گیت
+        گرفته می‌شود و فقط همان فایل‌ها خوانده می‌شوند؛ زمان خروجی به اندازه
+        تغییرات بستگی دارد نه اندازه پروژه. snapshot آخرین خروجی تغییر نمی‌کند.
+        """
+        if self.git_manager is None or self.git_manager.repo is None:
+            raise ValueError("برای خروجی تغییرات نسبت به commit به repository گیت نیاز است")
+        
+        base, changed = self.git_manager.list_changed_files(ref)
+        actions = dict(changed)
+        
+        changes = []
+        to_read = []
+        for scanned in self.scanner.from_paths(path for path, _ in changed):
+            if scanned.ignored:
+                continue
+            if actions[scanned.path] == "deleted":
+                changes.append({"path": scanned.path, "action": "deleted"})
+            else:
+                to_read.append(scanned)
+        
+        # نتایج به همان ترتیب to_read برمی‌گردند؛ فایل‌هایی که خوانده نشدند
+        # بدون محتوا و با دلیل در خروجی می‌مانند تا تغییرشان گم نشود
+        for scanned, (status, file_obj) in zip(to_read, self._iter_loaded_files(to_read)):
+            if status == 'ok':
+                file_obj["action"] = actions[file_obj["path"]]
+                changes.append(file_obj)
+            else:
+                changes.append({
+                    "path": scanned.path,
+                    "action": actions[scanned.path],
+                    "skipped": self.SKIP_REASONS.get(status, status)
+                })
+        
+        changes.sort(key=lambda file_obj: file_obj["path"])
+        print(f"🔍 {len(changes)} تغییر نسبت به {ref} ({base[:8]})")
+        
+        header = {
+            "project_name": self.project_path.name,
+            "changes_only": True,
+            "base_ref": ref,
+            "base_commit": base
+        }
+        if not changes:
+            header["message"] = "هیچ تغییری شناسایی نشد"
+        else:
+            header["total_changes"] = len(changes)
+        
+        return self._dump_export(header, changes)
+    
+    def _get_token_estimator(self) -> TokenEstimator:
+        """تخمین‌گر token با کش دائمی در پوشه state پروژه"""
+        if self.token_estimator is None:
+            try:
+                cache_path = get_project_state_dir(self.project_path) / 'token_counts.json'
+            except Exception:
+                cache_path = None
+            self.token_estimator = TokenEstimator(cache_path)
+        
+        return self.token_estimator
+    
+    def create_export_planner(self) -> Optional[PartPlanner]:
+        """برنامه‌ریز بخش‌ها از رکوردهای آخرین خروجی (بدون parse متن خروجی)
+        
+        هر رکورد فقط یک بار encode می‌شود. اگر خروجی درون حافظه‌ای گرفته نشده
+        یا فایلی نداشته باشد None برمی‌گرداند.
+        """
+        if self.last_export_records is None:
+            return None
+        header, records, export_format, entries = self.last_export_records
+        if not records:
+            return None
+        
+        part_header = self._part_header(dict(header, files=records))
+        hashes = {path: entry[0] for path, entry in entries.items()}
+        return PartPlanner(part_header, records, self._get_token_estimator(), export_format, hashes)
+    
+    def create_part_planner(self, json_str: str) -> Optional[PartPlanner]:
+        """ساخت برنامه‌ریز بخش‌ها از متن یک خروجی (مثلاً متن paste شده)
+        
+        متن یک بار parse می‌شود؛ برای خروجی همین serializer از
+        create_export_planner استفاده کنید. اگر متن قابل parse نباشد یا
+        فایلی نداشته باشد None برمی‌گرداند.
+        """
+        export_format = detect_format(json_str)
+        try:
+            data = export_format.parse(json_str)
+        except ValueError:
+            return None
+        
+        files = data.get("files", []) if isinstance(data, dict) else []
+        if not files:
+            return None
+        
+        return PartPlanner(self._part_header(data), files, self._get_token_estimator(), export_format)
+    
+    def split_into_parts(self, json_str: str, max_chars: int, unit: str = UNIT_CHARS,
+                         packing: str = None) -> List[str]:
+        """تقسیم JSON به بخش‌های کوچکتر
+        
+        max_chars سقف هر بخش در واحد unit است (کاراکتر یا token تخمینی).
+        """
+        if unit == UNIT_CHARS and len(json_str) <= max_chars:
+            return [json_str]
+        
+        planner = self.create_part_planner(json_str)
+        if planner is None:
+            if unit != UNIT_CHARS:
+                return [json_str]
+            # اگر parse نشد، تقسیم ساده
+            return self._simple_split(json_str, max_chars)
+        
+        # تقسیم هوشمند بر اساس فایل‌ها
+        return planner.split(max_chars, unit, packing)
+    
+    @staticmethod
+    def _part_header(data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "project_name": data.get("project_name"),
+            "base_path": data.get("base_path"),
+            "changes_only": data.get("changes_only", False),
+            "total_files": data.get("total_files", len(data.get("files", [])))
+        }
+    
+    def split_records(self, files: List[Dict[str, Any]], max_size: int, unit: str = UNIT_CHARS,
+                      changes_only: bool = False, packing: str = None) -> List[str]:
+        """تقسیم مستقیم رکوردهای فایل به بخش‌ها (بدون ساختن و parse دوباره JSON کامل)"""
+        header = self._part_header({
+            "project_name": self.project_path.name,
+            "base_path": str(self.project_path),
+            "changes_only": changes_only,
+            "files": files
+        })
+        planner = PartPlanner(header, files, self._get_token_estimator(), self.get_export_format())
+        return planner.split(max_size, unit, packing)
+    
+    def _simple_split(self, text: str, max_chars: int) -> List[str]:
+        """تقسیم ساده متن"""
+        parts = []
+        for i in range(0, len(text), max_chars):
+            parts.append(text[i:i+max_chars])
+        
+        total = len(parts)
+        return [f"---START PART {i+1}/{total}---\n{p}\n---END PART {i+1}/{total}---" 
+                for i, p in enumerate(parts)]
+    
+    def deserialize_project(self, json_str: str) -> Dict[str, Any]:
+        """تبدیل پاسخ هوش مصنوعی به ساختار پروژه
+            
+        سند داخل توضیحات و code fence و پاسخ‌های چندبخشی (به هر ترتیب) با
+        response_parser پیدا می‌شوند؛ بخش‌های گم شده یا خراب ValueError می‌دهند.
+        """
+        project_data = parse_response(json_str)
+            
+        if not isinstance(project_data.get("files"), list):
+            raise ValueError("فرمت JSON نادرست است. کلید 'files' یافت نشد.")
+            
+        return project_data
+    
+    def apply_changes(self, project_data: Dict[str, Any]) -> List[str]:
+        """اعمال تغییرات به پروژه واقعی
+        
+        همه فایل‌ها با ApplyEngine به صورت اتمی نوشته می‌شوند؛ اگر نوشتن یکی
+        از آن‌ها خطا بدهد، پروژه به حالت قبل برمی‌گردد و خطا raise می‌شود.
+        """
+        applied_changes = self.recover_interrupted_apply()
+        return applied_changes + self.plan_changes(project_data).run()
+        
+    def plan_changes(self, project_data: Dict[str, Any]) -> ApplyEngine:
+        """عملیات لازم برای اعمال پاسخ، بدون تغییر دادن چیزی روی دیسک
+        
+        خروجی ApplyEngine صف شده است: run آن تغییرات را اعمال می‌کند و
+        preview_changes از همان صف پیش‌نمایش می‌سازد.
+        """
+        # بررسی حالت changes_only
+        changes_only = project_data.get("changes_only", False)
+        
+        # پاسخ دارای patch هرگز کل پروژه نیست (وگرنه بقیه فایل‌ها حذف می‌شدند)
+        if any(f.get("action") == "patch" for f in project_data.get("files", [])):
+            changes_only = True
+        
+        if changes_only:
+            # حالت فقط تغییرات
+            return self._plan_changes_only(project_data)
+        else:
+            # حالت کل پروژه
+            return self._plan_full_project(project_data)
+    
+    def preview_changes(self, project_data: Dict[str, Any]) -> ChangePreview:
+        """پیش‌نمایش تغییرات پاسخ (وضعیت و آمار خطوط هر فایل) در حافظه"""
+        return ChangePreview.from_engine(self.plan_changes(project_data))
+    
+    def commit_changes(self, project_data: Dict[str, Any], message: str,
+                       request_summary: str = "ai-changes") -> Tuple[str, str, ChangePreview]:
+        """commit تغییرات پاسخ در یک feature branch جدید بدون نوشتن روی working tree
+        
+        محتوای نهایی فایل‌ها از همان صف plan_changes گرفته و با GitManager
+        مستقیماً به blob و commit تبدیل می‌شود. فقط فایل‌هایی که با فایل روی
+        دیسک فرق دارند وارد commit می‌شوند (مانند پیش‌نمایش)، تا تغییرات commit
+        نشده فایل‌هایی که پاسخ فقط تکرار کرده وارد commit نشوند. اگر همین
+        فایل‌ها تغییرات commit نشده داشته باشند ValueError داده می‌شود، چون
+        fast-forward آن‌ها را بازنویسی نمی‌کند. خروجی: (نام branch، SHA
+        commit، پیش‌نمایش تغییرات نسبت به دیسک)
+        """
+        if self.git_manager is None or self.git_manager.repo is None:
+            raise ValueError("Git repository در دسترس نیست")
+        if self.git_manager.project_path != self.project_path:
+            raise ValueError("Git repository متعلق به پروژه دیگری است")
+        
+        engine = self.plan_changes(project_data)
+        writes: Dict[str, bytes] = {}
+        deletes: Set[str] = set()
+        for op in engine.operations:
+            # اگر یک مسیر چند بار در صف باشد، آخرین عملیات نتیجه نهایی است
+            path = Path(op.path).as_posix()
+            writes.pop(path, None)
+            deletes.discard(path)
+            if not op.is_write:
+                deletes.add(path)
+                continue
+            
+            data = op.encoded()
+            try:
+                if op.target.stat().st_size == len(data) and op.target.read_bytes() == data:
+                    continue
+            except FileNotFoundError:
+                pass
+            writes[path] = data
+        
+        dirty = sorted(self.git_manager.uncommitted_paths() & (writes.keys() | deletes))
+        if dirty:
+            listed = '\n'.join(f"  • {path}" for path in dirty[:20])
+            if len(dirty) > 20:
+                listed += f"\n  ... و {len(dirty) - 20} فایل دیگر"
+            raise ValueError(
+                f"این فایل‌ها تغییرات commit نشده دارند و پاسخ هم آن‌ها را تغییر می‌دهد:\n{listed}\n"
+                f"ابتدا آن‌ها را commit یا stash کنید (یا GIT_OBJECT_COMMIT را خاموش کنید)"
+            )
+        
+        branch_name, commit_sha = self.git_manager.commit_files(writes, deletes, message, request_summary)
+        return branch_name, commit_sha, ChangePreview.from_engine(engine)
+    
+    def _create_apply_engine(self) -> ApplyEngine:
+        try:
+            journal_dir = get_project_state_dir(self.project_path) / 'apply_journal'
+        except Exception:
+            journal_dir = None
+        return ApplyEngine(self.project_path, journal_dir)
+    
+    def recover_interrupted_apply(self) -> List[str]:
+        """برگرداندن اعمال تغییراتی که با بسته شدن ناگهانی برنامه نیمه‌کاره مانده"""
+        restored = self._create_apply_engine().recover()
+        if restored:
+            print(f"♻️  اعمال نیمه‌کاره قبلی برگردانده شد ({len(restored)} فایل)")
+        return [f"♻️  برگردانده شد (اعمال نیمه‌کاره قبلی): {path}" for path in restored]
+    
+    def _read_only_paths(self, project_data: Dict[str, Any]) -> Set[str]:
+        """فایل‌هایی که فقط outline آن‌ها ارسال شده و نباید بازنویسی شوند"""
+        paths = set(self._get_snapshot_store().get_meta(SnapshotStore.LAST_EXPORT).get("outlines") or [])
+        for file_obj in project_data.get("files", []):
+            if file_obj.get("read_only") or file_obj.get("outline"):
+                paths.add(file_obj["path"])
+        return paths
+    
+    def _plan_changes_only(self, project_data: Dict[str, Any]) -> ApplyEngine:
+        """صف کردن فقط تغییرات"""
+        engine = self._create_apply_engine()
+        read_only = self._read_only_paths(project_data)
+        
+        for file_obj in project_data.get("files", []):
+            path = file_obj["path"]
+            action = file_obj.get("action", "modified")
+            file_path = self.project_path / path
+            
+            if path in read_only:
+                engine.note(f"🔒 فقط خواندنی (outline)، تغییر نکرد: {path}")
+                continue
+            
+            if file_obj.get("skipped") and "content" not in file_obj:
+                engine.note(f"⏭️  محتوا ارسال نشده بود ({file_obj['skipped']})، تغییر نکرد: {path}")
+                continue
+            
+            if action == "deleted":
+                # حذف فایل
+                if file_path.exists():
+                    engine.delete(path, f"➖ حذف: {path}")
+                    
+            elif action == "added":
+                # اضافه کردن فایل جدید
+                engine.write(path, file_obj["content"], f"➕ جدید: {path}")
+                
+            elif action == "modified":
+                # تغییر فایل موجود
+                engine.write(path, file_obj["content"], f"✏️  تغییر: {path}")
+        
+            elif action == "patch":
+                # اعمال unified diff روی فایل موجود
+                self._apply_patch(path, file_obj, engine)
+        
+        return engine
+    
+    def _apply_patch(self, path: str, file_obj: Dict[str, Any], engine: ApplyEngine):
+        """اعمال diff یک فایل و گزارش نتیجه هر hunk
+        
+        فایل فقط وقتی نوشته می‌شود که patch تغییری داده باشد؛ hunk رد شده
+        هیچ وقت بخشی از فایل را خراب نمی‌کند.
+        """
+        file_path = self.project_path / path
+        diff_text = file_obj.get("diff") or file_obj.get("content") or ""
+        
+        original = ""
+        if file_path.exists():
+            # newline='' تا انتهای خط‌های CRLF فایل حفظ شوند
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                original = f.read()
+        
+        try:
+            result = apply_patch(original, diff_text)
+        except ValueError as e:
+            engine.note(f"❌ patch نامعتبر: {path} ({e})")
+            return
+        
+        if result.changed and result.ok:
+            summary = f"🩹 patch: {path} ({len(result.hunks)} hunk)"
+        elif result.changed:
+            summary = f"⚠️  patch ناقص: {path} ({len(result.rejected)} از {len(result.hunks)} hunk رد شد)"
+        elif result.rejected:
+            summary = f"❌ patch رد شد: {path} (فایل تغییر نکرد)"
+        else:
+            summary = f"ℹ️  patch قبلاً اعمال شده: {path}"
+        
+        if result.changed:
+            engine.write(path, result.content, summary, newline='')
+        else:
+            engine.note(summary)
+        for hunk in result.hunks:
+            engine.note(f"    • {hunk.describe()}")
+    
+    def _scan_existing_files(self) -> Set[str]:
+        """فایل‌های فعلی پروژه با همان قوانین بارگذاری (ignore و حداکثر اندازه)"""
+        existing_files = set()
+        for scanned in self._iter_candidate_files():
+            if scanned.ignored:
+                continue
+            try:
+                if scanned.stat().st_size > Config.MAX_FILE_SIZE:
+                    continue
+            except OSError:
+                continue
+            existing_files.add(scanned.path)
+        return existing_files
+    
+    def _changed_since_export(self, path: str, entry: SnapshotEntry) -> bool:
+        """آیا فایل روی دیسک با نسخه ارسال شده در خروجی فرق دارد"""
+        try:
+            content = _decode_text((self.project_path / path).read_bytes())
+        except OSError:
+            return True
+        return content is None or content_entry(content) != entry
+    
+    def _plan_full_project(self, project_data: Dict[str, Any]) -> ApplyEngine:
+        """صف کردن کل پروژه
+        
+        manifest آخرین خروجی (مسیر و hash فایل‌های ارسال شده) فهرست فایل‌های
+        قابل حذف است: فایل‌هایی که ارسال نشده بودند (ignore شده یا انتخاب
+        نشده) هرگز حذف نمی‌شوند و فایلی که پس از خروجی روی دیسک تغییر کرده
+        هم حذف نمی‌شود. بدون manifest، پروژه مانند قبل پیمایش می‌شود.
+        """
+        manifest = self._get_snapshot_store().load(SnapshotStore.LAST_EXPORT)
+        if manifest is not None:
+            existing_files = set(manifest)
+        else:
+            existing_files = self._scan_existing_files()
+        
+        new_files = {f["path"] for f in project_data.get("files", [])}
+        read_only = self._read_only_paths(project_data)
+        
+        engine = self._create_apply_engine()
+        
+        # اعمال فایل‌های جدید/تغییر یافته
+        for file_obj in project_data.get("files", []):
+            path = file_obj["path"]
+            if path in read_only:
+                # outline هرگز جای محتوای واقعی فایل را نمی‌گیرد
+                engine.note(f"🔒 فقط خواندنی (outline)، تغییر نکرد: {path}")
+                continue
+            
+            if path in existing_files or (manifest is not None and (self.project_path / path).exists()):
+                message = f"✏️  تغییر: {path}"
+            else:
+                message = f"➕ جدید: {path}"
+            engine.write(path, file_obj["content"], message)
+        
+        # حذف فایل‌های حذف شده
+        deleted_files = existing_files - new_files - read_only
+        for path in sorted(deleted_files):
+            if not (self.project_path / path).exists():
+                continue
+            if manifest is not None and self._changed_since_export(path, manifest[path]):
+                engine.note(f"⚠️  پس از خروجی تغییر کرده بود و حذف نشد: {path}")
+                continue
+            engine.delete(path, f"➖ حذف: {path}")
+        
+        return engine
+    
+    def _get_search_index(self) -> SearchIndex:
+        """index جستجوی محتوای پروژه، ذخیره شده در پوشه state"""
+        if self.search_index is None:
+            try:
+                cache_path = get_project_state_dir(self.project_path) / 'search_index.json'
+            except Exception:
+                cache_path = None
+            self.search_index = SearchIndex(cache_path)
+        
+        return self.search_index
+    
+    def refresh_search_index(self) -> int:
+        """هماهنگ کردن index جستجو با فایل‌های فعلی (فقط فایل‌های تغییر کرده tokenize می‌شوند)"""
+        index = self._get_search_index()
+        changed = index.update(self.iter_project_files())
+        index.save()
+        return changed
+    
+    def suggest_files(self, query: str, budget: int, unit: str = UNIT_CHARS,
+                      refresh: bool = True) -> List[Tuple[str, float]]:
+        """فایل‌های مرتبط با query به ترتیب امتیاز، تا سقف budget
+        
+        بدون refresh از index فعلی استفاده می‌شود (برای جستجوهای پشت سر هم).
+        خروجی: (مسیر، امتیاز)
+        """
+        if refresh or self.search_index is None:
+            self.refresh_search_index()
+        
+        index = self._get_search_index()
+        ranked = index.search(query)
+        selected = set(index.select_within_budget(ranked, budget, unit))
+        return [(path, score) for path, score in ranked if path in selected]
+    
+    def get_file_list(self) -> List[Tuple[str, int]]:
+        """دریافت لیست فایل‌ها با اندازه"""
+        files = self.load_project_files()
         return [(f["path"], len(f["content"])) for f in files]
\ No newline at end of file
@@ -0,0 +1,427 @@
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import threading
+import ctypes
+import ctypes.util
+from typing import Dict, List, Any, Optional, Set, Tuple
+from config import Config
+from file_scanner import ProjectScanner
+
+class LiveProjectModel:
+    """مدل درون حافظه پروژه که توسط ProjectWatcher به‌روز نگه داشته می‌شود
+    
+    برای هر فایل رکورد مسیر و محتوا نگه داشته می‌شود تا خروجی‌ها
+    بدون پیمایش و خواندن دوباره دیسک ساخته شوند. قوانین نادیده‌گیری و
+    محدودیت اندازه از همان مسیر بارگذاری ProjectSerializer اعمال می‌شوند.
+    """
+    
+    def __init__(self, serializer):
+        self.serializer = serializer
+        self.ready = False
+        self.version = 0
+        
+        self._lock = threading.RLock()
+        self._files: Dict[str, Dict[str, Any]] = {}
+    
+    def rebuild(self):
+        """بارگذاری کامل پروژه در مدل"""
+        files = {}
+        for status, file_obj in self.serializer._iter_loaded_files():
+            if status == 'ok':
+                files[file_obj["path"]] = file_obj
+        
+        self._flush_cache()
+        
+        with self._lock:
+            self._files = files
+            self.ready = True
+            self.version += 1
+    
+    def apply_changes(self, dirty_paths: Set[str]):
+        """به‌روزرسانی مدل برای مسیرهای نسبی تغییر کرده"""
+        serializer = self.serializer
+        scanner = serializer.scanner
+        
+        # در حالت گیت، فایل‌های ignore شده توسط .gitignore وارد مدل نمی‌شوند
+        git_files = serializer._list_git_files()
+        allowed = set(git_files) if git_files is not None else None
+        
+        updates = {}
+        removed_prefixes = []
+        
+        for relative_path in dirty_paths:
+            abs_path = scanner._abs_path(relative_path)
+            
+            if os.path.isdir(abs_path):
+                if allowed is not None:
+                    prefix = relative_path + '/'
+                    candidates = scanner.from_paths(p for p in git_files if p.startswith(prefix))
+                else:
+                    candidates = scanner.scan(relative_path)
+                
+                for scanned in candidates:
+                    updates[scanned.path] = scanned
+                continue
+            
+            # مسیر حذف شده ممکن است یک پوشه بوده باشد
+            removed_prefixes.append(relative_path + '/')
+            
+            if allowed is not None and relative_path not in allowed:
+                updates[relative_path] = None
+                continue
+            
+            updates[relative_path] = next(scanner.from_paths([relative_path]))
+        
+        loaded = {}
+        for relative_path, scanned in updates.items():
+            if scanned is None:
+                loaded[relative_path] = None
+                continue
+            status, file_obj = serializer._load_file(scanned)
+            loaded[relative_path] = file_obj if status == 'ok' else None
+        
+        # فایل‌های جدید باید در همان جایگاه ترتیب load_project_files قرار بگیرند
+        # (فقط همین thread مدل را تغییر می‌دهد، پس خواندن بدون قفل امن است)
+        order = None
+        if any(file_obj is not None and path not in self._files for path, file_obj in loaded.items()):
+            order = git_files if git_files is not None else [scanned.path for scanned in scanner.scan()]
+        
+        self._flush_cache()
+        
+        with self._lock:
+            for prefix in removed_prefixes:
+                for path in [p for p in self._files if p.startswith(prefix)]:
+                    del self._files[path]
+            
+            for relative_path, file_obj in loaded.items():
+                if file_obj is None:
+                    self._files.pop(relative_path, None)
+                else:
+                    self._files[relative_path] = file_obj
+            
+            if order is not None:
+                self._files = self._ordered(self._files, order)
+            
+            self.version += 1
+    
+    @staticmethod
+    def _ordered(files: Dict[str, Dict[str, Any]], order: List[str]) -> Dict[str, Dict[str, Any]]:
+        """مرتب کردن مدل به ترتیب مسیرهای بارگذاری (مسیرهای خارج از order در انتها)"""
+        ordered = {path: files[path] for path in order if path in files}
+        if len(ordered) != len(files):
+            ordered.update((path, file_obj) for path, file_obj in files.items() if path not in ordered)
+        return ordered
+    
+    def _flush_cache(self):
+        cache = self.serializer.content_cache
+        if cache is not None:
+            cache.flush()
+    
+    def snapshot_files(self) -> List[Dict[str, Any]]:
+        """کپی لیست فایل‌ها با همان ساختار load_project_files"""
+        with self._lock:
+            return [dict(file_obj) for file_obj in self._files.values()]
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._files)
+
+class _InotifyBackend:
+    """دریافت رویدادهای فایل‌سیستم لینوکس با inotify (از طریق ctypes)"""
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    
+    WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+    
+    _EVENT_HEADER = struct.Struct('iIII')
+    
+    def __init__(self, scanner: ProjectScanner):
+        self.scanner = scanner
+        self._fd = -1
+        self._watches: Dict[int, str] = {}
+        self._libc = None
+        # pipe برای بیدار کردن select (توقف یا درخواست flush)
+        self._wake_r = -1
+        self._wake_w = -1
+    
+    def start(self):
+        if not sys.platform.startswith('linux'):
+            raise OSError(errno.ENOSYS, "inotify فقط روی لینوکس در دسترس است")
+        
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 ناموفق بود")
+        
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._add_tree('')
+    
+    def _add_tree(self, relative_dir: str):
+        for directory in self.scanner.iter_dirs(relative_dir):
+            path = os.fsencode(self.scanner._abs_path(directory))
+            wd = self._libc.inotify_add_watch(self._fd, path, self.WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOSPC:
+                    # به سقف fs.inotify.max_user_watches رسیده‌ایم
+                    raise OSError(err, "تعداد watchهای inotify کافی نیست")
+                continue
+            self._watches[wd] = directory
+    
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        """انتظار برای رویدادها؛ None یعنی سرریز صف و نیاز به بارگذاری کامل"""
+        readable, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+        if self._wake_r in readable:
+            try:
+                while os.read(self._wake_r, 512):
+                    pass
+            except BlockingIOError:
+                pass
+        if self._fd not in readable:
+            return set()
+        
+        try:
+            data = os.read(self._fd, 256 * 1024)
+        except BlockingIOError:
+            return set()
+        
+        dirty = set()
+        offset = 0
+        header = self._EVENT_HEADER
+        
+        while offset + header.size <= len(data):
+            wd, mask, _cookie, length = header.unpack_from(data, offset)
+            name = os.fsdecode(data[offset + header.size:offset + header.size + length].rstrip(b'\0'))
+            offset += header.size + length
+            
+            if mask & self.IN_Q_OVERFLOW:
+                return None
+            
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            
+            if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF):
+                if directory:
+                    dirty.add(directory)
+                continue
+            
+            relative_path = f"{directory}/{name}" if directory else name
+            if self.scanner.matcher.matches_name(name):
+                continue
+            
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self._add_tree(relative_path)
+            
+            dirty.add(relative_path)
+        
+        return dirty
+    
+    def drain(self) -> Optional[Set[str]]:
+        """همه رویدادهای در صف بدون انتظار"""
+        dirty = set()
+        while True:
+            more = self.wait(0)
+            if more is None:
+                return None
+            if not more:
+                return dirty
+            dirty.update(more)
+    
+    def wake(self):
+        """بیدار کردن wait در حال انتظار"""
+        try:
+            os.write(self._wake_w, b'\0')
+        except OSError:
+            pass
+    
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        for fd in (self._wake_r, self._wake_w):
+            if fd >= 0:
+                os.close(fd)
+        self._wake_r = self._wake_w = -1
+
+class _PollingBackend:
+    """جایگزین سکوی-مستقل: مقایسه دوره‌ای stat فایل‌ها"""
+    
+    def __init__(self, scanner: ProjectScanner, interval: float):
+        self.scanner = scanner
+        self.interval = interval
+        self._state: Dict[str, Tuple[int, int]] = {}
+        self._next_poll = 0.0
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+    
+    def _take_state(self) -> Dict[str, Tuple[int, int]]:
+        state = {}
+        for scanned in self.scanner.scan():
+            if scanned.ignored:
+                continue
+            try:
+                st = scanned.stat()
+            except OSError:
+                continue
+            state[scanned.path] = (st.st_mtime_ns, st.st_size)
+        return state
+    
+    def start(self):
+        self._state = self._take_state()
+        self._next_poll = time.monotonic() + self.interval
+    
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        """مقایسه stat در زمان poll بعدی؛ تا timeout (یا بیدار شدن) بیشتر صبر نمی‌کند"""
+        remaining = self._next_poll - time.monotonic()
+        if remaining > 0:
+            if self._wake.wait(min(timeout, remaining)):
+                self._wake.clear()
+            if self._stop.is_set() or time.monotonic() < self._next_poll:
+                return set()
+        return self.drain()
+        
+    def drain(self) -> Optional[Set[str]]:
+        """مقایسه stat همین حالا"""
+        new_state = self._take_state()
+        self._next_poll = time.monotonic() + self.interval
+        old_state = self._state
+        self._state = new_state
+        
+        dirty = {path for path, key in new_state.items() if old_state.get(path) != key}
+        dirty.update(path for path in old_state if path not in new_state)
+        return dirty
+    
+    def wake(self):
+        self._wake.set()
+    
+    def close(self):
+        self._stop.set()
+        self._wake.set()
+
+class ProjectWatcher(threading.Thread):
+    """thread پس‌زمینه که LiveProjectModel را با تغییرات فایل‌سیستم همگام نگه می‌دارد
+    
+    روی لینوکس از inotify و در غیر این صورت (یا در صورت خطا) از polling استفاده می‌کند.
+    """
+    
+    def __init__(self, model: LiveProjectModel):
+        super().__init__(name="project-watcher", daemon=True)
+        self.model = model
+        self.backend_name = None
+        self._stop_event = threading.Event()
+        self._backend = None
+        # درخواست‌های flush با شماره نسل: flush تا اعمال رویدادهای قبل از آن منتظر می‌ماند
+        self._flush_cond = threading.Condition()
+        self._flush_requested = 0
+        self._flush_done = 0
+    
+    def _create_backend(self):
+        scanner = self.model.serializer.scanner
+        
+        if Config.WATCH_USE_INOTIFY:
+            backend = _InotifyBackend(scanner)
+            try:
+                backend.start()
+                self.backend_name = "inotify"
+                return backend
+            except (OSError, AttributeError) as e:
+                backend.close()
+                print(f"⚠️  inotify در دسترس نیست، polling استفاده می‌شود: {e}")
+        
+        backend = _PollingBackend(scanner, Config.WATCH_POLL_INTERVAL)
+        backend.start()
+        self.backend_name = "polling"
+        return backend
+    
+    def run(self):
+        try:
+            # backend قبل از بارگذاری شروع می‌شود تا رویدادی از دست نرود
+            self._backend = self._create_backend()
+            self.model.rebuild()
+            
+            while not self._stop_event.is_set():
+                dirty = self._backend.wait(0.5)
+                
+                # جمع کردن رویدادهای پشت سر هم (مثلاً ذخیره چند فایل توسط IDE)
+                deadline = time.monotonic() + Config.WATCH_DEBOUNCE
+                while (dirty and not self._stop_event.is_set() and not self._flush_pending()
+                       and time.monotonic() < deadline):
+                    more = self._backend.wait(max(0.0, deadline - time.monotonic()))
+                    if more is None:
+                        dirty = None
+                        break
+                    dirty.update(more)
+                
+                flush_generation = self._flush_requested
+                if flush_generation != self._flush_done and dirty is not None:
+                    more = self._backend.drain()
+                    dirty = None if more is None else dirty | more
+                
+                if dirty is None:
+                    self.model.rebuild()
+                elif dirty:
+                    self.model.apply_changes(dirty)
+                
+                if flush_generation != self._flush_done:
+                    with self._flush_cond:
+                        self._flush_done = flush_generation
+                        self._flush_cond.notify_all()
+        except Exception as e:
+            print(f"❌ خطا در نظارت بر پروژه: {e}")
+            self.model.ready = False
+        finally:
+            if self._backend is not None:
+                self._backend.close()
+    
+    def _flush_pending(self) -> bool:
+        return self._flush_requested != self._flush_done
+    
+    def flush(self, timeout: float = None) -> bool:
+        """اعمال همه تغییرات در صف (شامل پنجره debounce) روی مدل و انتظار برای آن
+        
+        False اگر نظارت فعال نباشد یا در timeout انجام نشود؛ در این حالت مدل
+        ممکن است قدیمی باشد.
+        """
+        if timeout is None:
+            timeout = Config.WATCH_FLUSH_TIMEOUT
+        if not self.is_alive() or not self.model.ready or self._backend is None:
+            return False
+        
+        with self._flush_cond:
+            self._flush_requested += 1
+            generation = self._flush_requested
+            self._backend.wake()
+            return self._flush_cond.wait_for(
+                lambda: self._flush_done >= generation or not self.is_alive(), timeout
+            ) and self._flush_done >= generation and self.model.ready
+    
+    def stop(self, timeout: float = 2.0):
+        """توقف نظارت"""
+        self._stop_event.set()
+        if self._backend is not None:
+            self._backend.wake()
+        self.join(timeout)
+        self.model.ready = False
\ No newline at end of file
@@ -0,0 +1,223 @@
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional
+from export_formats import BlocksFormat, FORMATS, FORMAT_BLOCKS
+from part_planner import join_chunks
+
+# تگ‌های ---START PART i/n--- و ---END PART i/n--- (با فاصله، نقل قول یا bold اضافه)
+_PART_MARKER = re.compile(
+    r'^[ \t>*_#]*-{3,}[ \t]*(START|END)[ \t]+PART[ \t]+(\d+)[ \t]*/[ \t]*(\d+)[ \t]*-{3,}[ \t*_]*\r?$',
+    re.MULTILINE)
+
+# خط fence بدون محتوا (پایان بلوک کد markdown)
+_BARE_FENCE = re.compile(r'^[ \t]*(?:`{3,}|~{3,})[ \t]*\r?$', re.MULTILINE)
+
+_FENCE_PREFIXES = ('```', '~~~')
+
+_decoder = json.JSONDecoder()
+
+class ResponsePart:
+    """متن یک بخش از پاسخ چندبخشی (بین تگ‌های START و END)"""
+    
+    __slots__ = ('number', 'total', 'text', 'closed')
+    
+    def __init__(self, number: int, total: int, text: str, closed: bool):
+        self.number = number
+        self.total = total
+        self.text = text
+        self.closed = closed
+
+def scan_parts(text: str) -> List[ResponsePart]:
+    """پیدا کردن بخش‌ها با یک بار پیمایش تگ‌ها، به همان ترتیبی که در متن آمده‌اند
+    
+    تگ START داخل یک بخش باز با همان شماره نادیده گرفته می‌شود؛ START با
+    شماره دیگر بخش قبلی را (بدون END) می‌بندد. بخشی که تا پایان متن باز
+    بماند با closed=False برگردانده می‌شود.
+    """
+    parts: List[ResponsePart] = []
+    current = None
+    
+    for match in _PART_MARKER.finditer(text):
+        kind, number, total = match.group(1), int(match.group(2)), int(match.group(3))
+        if kind == "START":
+            if current is not None:
+                if current[0] == number:
+                    continue
+                parts.append(ResponsePart(current[0], current[1], text[current[2]:match.start()], False))
+            current = (number, total, match.end() + 1)
+        elif current is not None and current[0] == number:
+            parts.append(ResponsePart(number, current[1], text[current[2]:match.start()], True))
+            current = None
+    
+    if current is not None:
+        parts.append(ResponsePart(current[0], current[1], text[current[2]:], False))
+    return parts
+
+def _closing_fence(text: str, start: int) -> int:
+    """شروع آخرین خط fence بدون محتوا بعد از start (یا طول متن)"""
+    close = len(text)
+    for match in _BARE_FENCE.finditer(text, start):
+        close = match.start()
+    return close
+
+def extract_document(text: str) -> Dict[str, Any]:
+    """پیدا کردن و parse سند پروژه داخل متن پاسخ
+    
+    توضیحات قبل و بعد از سند و fence بلوک کد (با یا بدون نام زبان) نادیده
+    گرفته می‌شوند. JSON با raw_decode خوانده می‌شود، پس متن بعد از آن مهم
+    نیست؛ سند بلوکی اگر داخل fence باشد تا آخرین fence خالی ادامه دارد.
+    """
+    position = 0
+    length = len(text)
+    fenced = False
+    error: Optional[ValueError] = None
+    
+    while position < length:
+        end = text.find('\n', position)
+        if end < 0:
+            end = length
+        line = text[position:end].strip()
+        
+        if line.startswith('{'):
+            try:
+                data, _ = _decoder.raw_decode(text, text.index('{', position))
+            except ValueError as e:
+                error = error or e
+            else:
+                # شیءهای JSON دیگر (مثلاً نمونه داخل توضیحات) سند پروژه نیستند
+                if isinstance(data, dict) and "files" in data:
+                    return data
+        
+        elif line.startswith(BlocksFormat.MAGIC):
+            stop = _closing_fence(text, end) if fenced else length
+            return FORMATS[FORMAT_BLOCKS].parse(text[position:stop])
+        
+        elif line.startswith(_FENCE_PREFIXES):
+            fenced = True
+        
+        position = end + 1
+    
+    if error is not None:
+        raise ValueError(f"خطا در parse کردن JSON: {error}")
+    raise ValueError("فرمت JSON نادرست است. کلید 'files' یافت نشد.")
+
+def _join_numbers(numbers: Iterable[int]) -> str:
+    return "، ".join(str(number) for number in sorted(numbers))
+
+class PartCollector:
+    """جمع‌آوری افزایشی بخش‌های پاسخ چندبخشی
+    
+    هر متنی که اضافه می‌شود (یک یا چند بخش، به هر ترتیب) همان لحظه parse
+    می‌شود و فقط سند parse شده هر بخش نگه داشته می‌شود، نه متن خام آن.
+    نسخه‌های تکراری یک بخش کنار گذاشته می‌شوند (اگر نسخه قبلی خراب بوده
+    باشد، نسخه سالم جای آن را می‌گیرد). متن بدون تگ PART بخش 1 از 1 است.
+    """
+    
+    def __init__(self):
+        self.total: Optional[int] = None
+        self.documents: Dict[int, Dict[str, Any]] = {}
+        self.corrupt: Dict[int, str] = {}
+        self.duplicates: List[int] = []
+    
+    def add_part(self, part: ResponsePart) -> bool:
+        """افزودن یک بخش؛ True اگر بخش سالم و جدید باشد"""
+        number = part.number
+        if number in self.documents:
+            self.duplicates.append(number)
+            return False
+        
+        if self.total is None:
+            self.total = part.total
+        if part.total != self.total:
+            self.corrupt[number] = f"تعداد بخش‌ها ({part.total}) با بخش‌های قبلی ({self.total}) یکی نیست"
+            return False
+        if not 1 <= number <= self.total:
+            self.corrupt[number] = f"شماره بخش خارج از محدوده 1 تا {self.total} است"
+            return False
+        
+        try:
+            self.documents[number] = extract_document(part.text)
+        except ValueError as e:
+            reason = str(e) if part.closed else f"تگ END PART یافت نشد و بخش ناقص است ({e})"
+            self.corrupt.setdefault(number, reason)
+            return False
+    
+        self.corrupt.pop(number, None)
+        return True
+    
+    def add_text(self, text: str) -> List[int]:
+        """افزودن متن paste شده؛ خروجی: شماره بخش‌های سالم جدید"""
+        parts = scan_parts(text)
+        if not parts:
+            parts = [ResponsePart(1, 1, text, True)]
+        return [part.number for part in parts if self.add_part(part)]
+    
+    @property
+    def missing(self) -> List[int]:
+        if self.total is None:
+            return []
+        return [number for number in range(1, self.total + 1)
+                if number not in self.documents and number not in self.corrupt]
+    
+    @property
+    def is_complete(self) -> bool:
+        return self.total is not None and len(self.documents) == self.total
+    
+    def status(self) -> str:
+        """خلاصه وضعیت: تعداد بخش‌های دریافت شده، گم شده و خراب"""
+        if self.total is None:
+            return "هنوز بخشی دریافت نشده"
+        text = f"بخش‌های دریافت شده: {len(self.documents)}/{self.total}"
+        if self.missing:
+            text += f" — گم شده: {_join_numbers(self.missing)}"
+        if self.corrupt:
+            text += f" — خراب: {_join_numbers(self.corrupt)}"
+        return text
+    
+    def result(self) -> Dict[str, Any]:
+        """سند پروژه از بخش‌ها به ترتیب شماره
+        
+        بخش‌های دریافت نشده یا خراب با شماره گزارش و ValueError داده می‌شود
+        تا هیچ فایلی بی‌صدا از دست نرود.
+        """
+        if self.total is None:
+            raise ValueError("هیچ بخشی دریافت نشده است")
+        if not self.is_complete:
+            lines = [f"پاسخ چندبخشی کامل نیست ({len(self.documents)} از {self.total} بخش سالم):"]
+            if self.missing:
+                lines.append(f"  • بخش‌های دریافت نشده: {_join_numbers(self.missing)}")
+            for number in sorted(self.corrupt):
+                lines.append(f"  • بخش {number} خراب است: {self.corrupt[number]}")
+            raise ValueError("\n".join(lines))
+        
+        documents = [self.documents[number] for number in range(1, self.total + 1)]
+        files: List[Dict[str, Any]] = []
+        for document in documents:
+            files.extend(document.get("files") or [])
+        
+        result = {key: value for key, value in documents[0].items() if key != "files"}
+        result["changes_only"] = any(document.get("changes_only", False) for document in documents)
+        # سرهم کردن فایل‌های بزرگی که در چند بخش آمده‌اند
+        result["files"] = join_chunks(files)
+        if self.total > 1:
+            result["total_files"] = len(result["files"])
+        return result
+
+def combine_parts(parts: List[ResponsePart]) -> Dict[str, Any]:
+    """ترکیب بخش‌های یک پاسخ (به هر ترتیب) در یک سند پروژه"""
+    collector = PartCollector()
+    for part in parts:
+        collector.add_part(part)
+    if collector.duplicates:
+        print(f"ℹ️  بخش‌های تکراری نادیده گرفته شدند: {_join_numbers(set(collector.duplicates))}")
+    return collector.result()
+
+def parse_response(text: str) -> Dict[str, Any]:
+    """parse پاسخ هوش مصنوعی (سند واحد یا چندبخشی، در هر قالب خروجی)"""
+    parts = scan_parts(text)
+    if parts:
+        return combine_parts(parts)
+    
+    project_data = extract_document(text)
+    project_data["files"] = join_chunks(project_data["files"])
+    return project_data
\ No newline at end of file
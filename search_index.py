@@ -0,0 +1,271 @@
+import json
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from snapshot_store import content_hash
+from part_planner import UNIT_CHARS, UNIT_TOKENS
+from token_estimator import estimate_tokens
+
+# با تغییر tokenizer یا شکل ذخیره، index قبلی دور ریخته می‌شود
+INDEX_VERSION = 1
+
+_WORD = re.compile(r'\w+')
+# اجزای شناسه‌ها: HTTPServer -> http, server و load_project -> load, project
+_WORD_PART = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+|[^\W\d_]+')
+
+_MIN_TERM = 2
+_MAX_TERM = 40
+
+def _word_terms(word: str) -> List[str]:
+    """termهای یک کلمه: خود کلمه و اجزای snake_case/camelCase آن"""
+    lower = word.lower()
+    terms = [lower] if _MIN_TERM <= len(lower) <= _MAX_TERM and not lower.isdigit() else []
+    if '_' in word or (not word.islower() and not word.isupper()):
+        for part in _WORD_PART.findall(word):
+            part = part.lower()
+            if part != lower and _MIN_TERM <= len(part) <= _MAX_TERM and not part.isdigit():
+                terms.append(part)
+    return terms
+
+def tokenize(text: str) -> Counter:
+    """شمارش termهای متن (کلمات با حروف کوچک و اجزای شناسه‌ها)
+    
+    کلمات ابتدا با regex در C شمرده می‌شوند و هر کلمه یکتا فقط یک بار
+    تجزیه می‌شود، پس هزینه با تعداد کلمات متفاوت رشد می‌کند.
+    """
+    counts = Counter()
+    for word, count in Counter(_WORD.findall(text)).items():
+        for term in _word_terms(word):
+            counts[term] += count
+    return counts
+
+def _trigrams(term: str) -> Set[str]:
+    padded = f" {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class SearchIndex:
+    """index جستجوی محلی روی محتوای فایل‌های پروژه (BM25 + trigram)
+    
+    برای هر فایل hash محتوا، اندازه (کاراکتر و token تخمینی) و شمارش
+    termها نگه داشته و در پوشه state پروژه ذخیره می‌شود؛ update فقط
+    فایل‌هایی را که hash آن‌ها عوض شده دوباره tokenize می‌کند. inverted
+    index در حافظه به صورت افزایشی به‌روز می‌شود. termهای query که دقیقاً
+    در پروژه نیستند (غلط تایپی، بخشی از نام) با شباهت trigram به termهای
+    موجود گسترش پیدا می‌کنند.
+    """
+    
+    K1 = 1.2
+    B = 0.75
+    PATH_BOOST = 3          # وزن termهای مسیر فایل نسبت به محتوا
+    FUZZY_MIN_SIMILARITY = 0.45
+    FUZZY_MAX_TERMS = 3     # حداکثر term مشابه برای هر term query
+    FUZZY_WEIGHT = 0.6      # ضریب امتیاز termهای مشابه نسبت به term دقیق
+    
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._lock = threading.Lock()
+        self._dirty = False
+        # مسیر -> [hash، کاراکتر، token، {term: tf}]
+        self._docs: Dict[str, List[Any]] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+        self._trigram_terms: Optional[Dict[str, List[str]]] = None
+        self._norms: Optional[Dict[str, float]] = None
+        self._load()
+    
+    def __len__(self) -> int:
+        return len(self._docs)
+    
+    def _load(self):
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        
+        for path, doc in data.get("docs", {}).items():
+            self._add(path, doc)
+    
+    def save(self):
+        """ذخیره index (فقط اگر تغییری کرده باشد)"""
+        with self._lock:
+            if not self._dirty or self.cache_path is None:
+                return
+            try:
+                with open(self.cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({"version": INDEX_VERSION, "docs": self._docs}, f,
+                              ensure_ascii=False, separators=(',', ':'))
+                self._dirty = False
+            except OSError as e:
+                print(f"⚠️  ذخیره index جستجو ناموفق بود: {e}")
+    
+    def _add(self, path: str, doc: List[Any]):
+        terms = doc[3]
+        self._docs[path] = doc
+        length = sum(terms.values())
+        self._lengths[path] = length
+        self._total_length += length
+        self._norms = None
+        for term, tf in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if self._trigram_terms is not None:
+                    for gram in _trigrams(term):
+                        self._trigram_terms.setdefault(gram, []).append(term)
+            postings[path] = tf
+    
+    def _remove(self, path: str):
+        doc = self._docs.pop(path)
+        self._total_length -= self._lengths.pop(path)
+        self._norms = None
+        for term in doc[3]:
+            postings = self._postings[term]
+            del postings[path]
+            if not postings:
+                # از map trigram هنگام جستجو با بررسی postings کنار گذاشته می‌شود
+                del self._postings[term]
+    
+    def update(self, files: Iterable[Dict[str, Any]]) -> int:
+        """هماهنگ کردن index با فایل‌های فعلی پروژه
+        
+        فایل‌های حذف شده از index بیرون می‌روند. خروجی: تعداد فایل‌هایی
+        که دوباره tokenize شدند.
+        """
+        seen = set()
+        changed = 0
+        with self._lock:
+            for file_obj in files:
+                path = file_obj["path"]
+                content = file_obj["content"]
+                seen.add(path)
+                
+                digest = content_hash(content)
+                doc = self._docs.get(path)
+                if doc is not None and doc[0] == digest:
+                    continue
+                
+                terms = tokenize(content)
+                for term, tf in tokenize(path).items():
+                    terms[term] += tf * self.PATH_BOOST
+                
+                if doc is not None:
+                    self._remove(path)
+                self._add(path, [digest, len(content), estimate_tokens(content), dict(terms)])
+                changed += 1
+            
+            for path in [path for path in self._docs if path not in seen]:
+                self._remove(path)
+                changed += 1
+            
+            if changed:
+                self._dirty = True
+        return changed
+    
+    def size(self, path: str, unit: str = UNIT_CHARS) -> int:
+        """اندازه فایل ایندکس شده بر حسب کاراکتر یا token تخمینی"""
+        doc = self._docs[path]
+        return doc[2] if unit == UNIT_TOKENS else doc[1]
+    
+    def _similar_terms(self, term: str) -> List[Tuple[str, float]]:
+        """termهای موجود با شباهت trigram (Jaccard) کافی به term"""
+        if self._trigram_terms is None:
+            self._trigram_terms = {}
+            for known in self._postings:
+                for gram in _trigrams(known):
+                    self._trigram_terms.setdefault(gram, []).append(known)
+        
+        grams = _trigrams(term)
+        # هر term با Jaccard کافی حداقل need trigram مشترک دارد، پس کافی
+        # است کاندیداها فقط از کم‌تکرارترین trigramها جمع شوند
+        need = math.ceil(self.FUZZY_MIN_SIMILARITY * len(grams))
+        lists = sorted((self._trigram_terms.get(gram, ()) for gram in grams), key=len)
+        candidates = set()
+        for terms in lists[:len(grams) - need + 1]:
+            candidates.update(terms)
+        
+        similar = []
+        for candidate in candidates:
+            if candidate == term or candidate not in self._postings:
+                continue
+            other = _trigrams(candidate)
+            score = len(grams & other) / len(grams | other)
+            if score >= self.FUZZY_MIN_SIMILARITY:
+                similar.append((candidate, score))
+        
+        similar.sort(key=lambda item: (-item[1], item[0]))
+        return similar[:self.FUZZY_MAX_TERMS]
+    
+    def _query_terms(self, query: str) -> Dict[str, float]:
+        weights: Dict[str, float] = {}
+        for term in tokenize(query):
+            if term in self._postings:
+                weights[term] = 1.0
+            elif len(term) >= 3:
+                # فقط termهایی که در پروژه نیستند گسترش داده می‌شوند
+                for similar, score in self._similar_terms(term):
+                    weight = score * self.FUZZY_WEIGHT
+                    weights[similar] = max(weights.get(similar, 0.0), weight)
+        return weights
+    
+    def _get_norms(self) -> Dict[str, float]:
+        """ضریب طول هر سند در BM25؛ فقط پس از تغییر index دوباره ساخته می‌شود"""
+        if self._norms is None:
+            average = self._total_length / len(self._docs) or 1.0
+            k1, b = self.K1, self.B
+            self._norms = {path: k1 * (1 - b + b * length / average)
+                           for path, length in self._lengths.items()}
+        return self._norms
+    
+    def search(self, query: str, limit: int = None) -> List[Tuple[str, float]]:
+        """رتبه‌بندی فایل‌ها برای query با BM25؛ خروجی (مسیر، امتیاز) نزولی"""
+        with self._lock:
+            count = len(self._docs)
+            if not count:
+                return []
+            
+            norms = self._get_norms()
+            k1 = self.K1
+            scores: Dict[str, float] = {}
+            get = scores.get
+            
+            terms = self._query_terms(query)
+            # termهایی که در بیش از نیمی از فایل‌ها هستند (idf ناچیز) وقتی
+            # term کمیاب‌تری در query هست نادیده گرفته می‌شوند
+            rare = [term for term in terms if len(self._postings[term]) * 2 <= count]
+            if rare:
+                terms = {term: terms[term] for term in rare}
+            
+            for term, weight in terms.items():
+                postings = self._postings[term]
+                df = len(postings)
+                factor = math.log(1 + (count - df + 0.5) / (df + 0.5)) * weight * (k1 + 1)
+                for path, tf in postings.items():
+                    scores[path] = get(path, 0.0) + factor * tf / (tf + norms[path])
+        
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit else ranked
+    
+    def select_within_budget(self, ranked: List[Tuple[str, float]], budget: int,
+                             unit: str = UNIT_CHARS) -> List[str]:
+        """فایل‌های برتر به ترتیب رتبه تا پر شدن بودجه
+        
+        فایلی که در بودجه باقی‌مانده جا نشود رد می‌شود و فایل‌های کوچک‌تر
+        بعدی هنوز شانس انتخاب دارند.
+        """
+        selected = []
+        total = 0
+        for path, _ in ranked:
+            size = self.size(path, unit)
+            if total + size <= budget:
+                selected.append(path)
+                total += size
+        return selected
\ No newline at end of file
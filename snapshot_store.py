@@ -0,0 +1,122 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+# یک رکورد snapshot: (hash محتوا، اندازه UTF-8 به بایت)
+SnapshotEntry = Tuple[str, int]
+
+def content_entry(content: str) -> SnapshotEntry:
+    """hash (blake2b) و اندازه محتوای متنی یک فایل"""
+    data = content.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest(), len(data)
+
+def content_hash(content: str) -> str:
+    return content_entry(content)[0]
+
+class SnapshotStore:
+    """baselineهای نام‌دار پروژه برای خروجی «فقط تغییرات»
+    
+    هر baseline نگاشت مسیر -> (hash، اندازه) است و فقط آنچه واقعاً برای
+    هوش مصنوعی ارسال شده را نشان می‌دهد. هر baseline در یک فایل JSON داخل
+    پوشه state پروژه ذخیره می‌شود تا پس از بستن برنامه از بین نرود.
+    اگر directory برابر None باشد baselineها فقط در حافظه نگه داشته می‌شوند.
+    """
+    
+    LAST_EXPORT = "last_export"   # دقیقاً فایل‌هایی که در آخرین خروجی ارسال شدند
+    SYNC_STATE = "sync_state"     # وضعیت پروژه از دید هوش مصنوعی (مبنای «فقط تغییرات»)
+    FORMAT_VERSION = 1
+    
+    def __init__(self, directory: Optional[Path]):
+        self.directory = Path(directory) if directory is not None else None
+        self._lock = threading.Lock()
+        self._loaded: Dict[str, Dict[str, SnapshotEntry]] = {}
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def _file_for(self, name: str) -> Path:
+        safe_name = "".join(c if c.isalnum() or c in '-_' else '-' for c in name)
+        return self.directory / f"{safe_name}.json"
+    
+    def load(self, name: str) -> Optional[Dict[str, SnapshotEntry]]:
+        """دریافت baseline (یا None اگر وجود نداشته باشد)"""
+        with self._lock:
+            if name in self._loaded:
+                return self._loaded[name]
+            
+            if self.directory is None:
+                return None
+            
+            file_path = self._file_for(name)
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as e:
+                print(f"⚠️  snapshot {name} قابل خواندن نیست: {e}")
+                return None
+            
+            if data.get("version") != self.FORMAT_VERSION:
+                return None
+            
+            entries = {path: (entry[0], entry[1]) for path, entry in data.get("files", {}).items()}
+            self._loaded[name] = entries
+            self._meta[name] = data.get("meta", {})
+            return entries
+    
+    def save(self, name: str, entries: Dict[str, SnapshotEntry], meta: Dict[str, Any] = None):
+        """ذخیره (جایگزینی کامل) یک baseline"""
+        meta = dict(meta or {})
+        meta.setdefault("created", datetime.now().isoformat(timespec='seconds'))
+        meta["total_files"] = len(entries)
+        
+        with self._lock:
+            self._loaded[name] = entries
+            self._meta[name] = meta
+            
+            if self.directory is None:
+                return
+            
+            data = {
+                "version": self.FORMAT_VERSION,
+                "name": name,
+                "meta": meta,
+                "files": {path: [entry[0], entry[1]] for path, entry in entries.items()}
+            }
+            
+            # نوشتن در فایل موقت و جایگزینی اتمی تا فایل نیمه‌کاره باقی نماند
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.directory), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(tmp_path, self._file_for(name))
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+    
+    def get_meta(self, name: str) -> Dict[str, Any]:
+        if self.load(name) is None:
+            return {}
+        with self._lock:
+            return dict(self._meta.get(name, {}))
+    
+    def delete(self, name: str):
+        """حذف یک baseline"""
+        with self._lock:
+            self._loaded.pop(name, None)
+            self._meta.pop(name, None)
+            if self.directory is not None:
+                try:
+                    self._file_for(name).unlink()
+                except FileNotFoundError:
+                    pass
\ No newline at end of file
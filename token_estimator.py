@@ -0,0 +1,81 @@
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+# بایت‌هایی که جزء کلمه یا فاصله هستند (باقی‌مانده: علامت‌های ASCII)
+_NON_PUNCT_BYTES = (bytes(range(ord('0'), ord('9') + 1)) + bytes(range(ord('A'), ord('Z') + 1)) +
+                    bytes(range(ord('a'), ord('z') + 1)) + b'_ \t\n\r\x0b\x0c' + bytes(range(0x80, 0x100)))
+
+def estimate_tokens(text: str) -> int:
+    """تخمین سریع تعداد token متن برای مدل‌های BPE
+    
+    هر بخش جدا شده با فاصله و هر علامت ASCII یک token حساب می‌شود و
+    کاراکترهای غیر ASCII (مثل فارسی) به ازای هر دو بایت اضافه UTF-8 یک
+    token دیگر دارند. تمام شمارش‌ها با متدهای C رشته انجام می‌شود.
+    """
+    if not text:
+        return 0
+    
+    data = text.encode('utf-8')
+    words = len(text.split())
+    punctuation = len(data.translate(None, _NON_PUNCT_BYTES))
+    non_ascii = len(data) - len(text)
+    return words + punctuation + non_ascii // 2
+
+class TokenEstimator:
+    """تخمین token با کش بر اساس hash محتوا
+    
+    کش در پوشه state پروژه ذخیره می‌شود تا بین اجراها باقی بماند.
+    """
+    
+    MAX_ENTRIES = 200000
+    
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._cache: Optional[Dict[str, int]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def _load(self) -> Dict[str, int]:
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path is not None and self.cache_path.exists():
+                try:
+                    with open(self.cache_path, 'r', encoding='utf-8') as f:
+                        self._cache = json.load(f)
+                except (OSError, ValueError):
+                    self._cache = {}
+        return self._cache
+    
+    def estimate(self, text: str, content_hash: str = None) -> int:
+        """تعداد token تخمینی؛ با content_hash نتیجه کش می‌شود"""
+        if content_hash is None:
+            return estimate_tokens(text)
+        
+        with self._lock:
+            cache = self._load()
+            tokens = cache.get(content_hash)
+            if tokens is None:
+                tokens = estimate_tokens(text)
+                cache[content_hash] = tokens
+                self._dirty = True
+            return tokens
+    
+    def save(self):
+        """ذخیره کش (قدیمی‌ترین رکوردها بیش از سقف حذف می‌شوند)"""
+        with self._lock:
+            if not self._dirty or self.cache_path is None:
+                return
+            
+            cache = self._cache
+            if len(cache) > self.MAX_ENTRIES:
+                keys = list(cache)[-self.MAX_ENTRIES:]
+                cache = self._cache = {key: cache[key] for key in keys}
+            
+            try:
+                with open(self.cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f, separators=(',', ':'))
+                self._dirty = False
+            except OSError as e:
+                print(f"⚠️  ذخیره کش token ناموفق بود: {e}")
\ No newline at end of file